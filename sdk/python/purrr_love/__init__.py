@@ -8,11 +8,13 @@ __author__ = "Purrr.love Team"
 __email__ = "dev@purrr.love"
 
 from .client import PurrrLoveClient
+from .pool import ClientPool
 from .models import Cat, User, ApiKey, TradingOffer, CatShow
 from .exceptions import PurrrLoveError, AuthenticationError, RateLimitError
 
 __all__ = [
     'PurrrLoveClient',
+    'ClientPool',
     'Cat',
     'User', 
     'ApiKey',
@@ -0,0 +1,486 @@
+"""
+🐱 Purrr.love Python SDK - Analytics Sync
+Incremental sync of analytics time buckets into a local columnar store
+"""
+
+import hashlib
+import json
+import math
+import mmap
+import os
+import re
+import tempfile
+import threading
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+from .exceptions import ValidationError
+
+STORE_FORMAT = 1
+
+ROLLUP_INTERVALS = {'hour': 3600, 'day': 86400, 'week': 604800}
+ROLLUP_FUNCTIONS = ('sum', 'mean', 'min', 'max', 'last', 'count')
+
+_SERIES_KEYS = ('series', 'buckets', 'timeseries', 'rows', 'results', 'data')
+_TIME_KEYS = ('bucket', 'timestamp', 'time', 'date', 'hour', 'day', 'period')
+_TIMESTAMP_COLUMN = '_time'
+_SAFE_NAME = re.compile(r'[^A-Za-z0-9_.-]')
+_PLAIN_NAME = re.compile(r'[a-z0-9_-][a-z0-9_.-]{0,63}')
+
+
+def _file_stem(name: str) -> str:
+    """
+    Filesystem-safe stem that is unique per name
+
+    Plain lowercase names are used as they are; anything else (spaces,
+    upper case, a leading dot, long names) is sanitized and suffixed with
+    a hash of the original, so names that sanitize alike, or differ only
+    in case on a case-insensitive filesystem, never share a file.
+    """
+    if _PLAIN_NAME.fullmatch(name):
+        return name
+    digest = hashlib.sha256(name.encode('utf-8')).hexdigest()[:8]
+    return f"{_SAFE_NAME.sub('_', name)[:64]}-{digest}"
+
+
+def _bucket_time(row: Dict[str, Any]) -> Optional[int]:
+    """Epoch seconds of a bucket row, or None"""
+    for key in _TIME_KEYS:
+        value = row.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return int(value)
+        if isinstance(value, str) and value:
+            try:
+                parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+            except ValueError:
+                continue
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return int(parsed.timestamp())
+    return None
+
+
+def analytics_buckets(data: Any) -> List[Dict[str, Any]]:
+    """
+    Extract time-bucketed rows from ``get_analytics_data`` output
+
+    Args:
+        data: Analytics payload (a list of rows, or a dict holding one)
+
+    Returns:
+        Rows that carry a bucket time, each with ``_time`` set to epoch seconds
+    """
+    rows = data
+    if isinstance(data, dict):
+        rows = next((data[key] for key in _SERIES_KEYS if isinstance(data.get(key), list)), [])
+    buckets = []
+    for row in rows or []:
+        if not isinstance(row, dict):
+            continue
+        bucket = _bucket_time(row)
+        if bucket is not None:
+            buckets.append(dict(row, _time=bucket))
+    return buckets
+
+
+def _numeric(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+class _Column:
+    """Append-only file of fixed-width values read through mmap"""
+
+    def __init__(self, path: str, typecode: str):
+        self.path = path
+        self.typecode = typecode
+        self.width = 8
+        self._map: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+
+    def truncate(self, rows: int) -> None:
+        """Drop bytes past ``rows`` left by an interrupted append, or pad a new column with NaN"""
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size > rows * self.width:
+            with open(self.path, 'r+b') as f:
+                f.truncate(rows * self.width)
+        elif size < rows * self.width:
+            self.append([math.nan if self.typecode == 'd' else 0] * (rows - size // self.width))
+
+    def append(self, values: Sequence[Any]) -> None:
+        self.release()
+        with open(self.path, 'ab') as f:
+            f.write(_pack(self.typecode, values))
+
+    def view(self) -> memoryview:
+        if self._view is None:
+            size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+            if size == 0:
+                return memoryview(b'').cast(self.typecode)
+            with open(self.path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._map).cast(self.typecode)
+        return self._view
+
+    def release(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+def _pack(typecode: str, values: Sequence[Any]) -> bytes:
+    buffer = bytearray(len(values) * 8)
+    view = memoryview(buffer).cast(typecode)
+    for i, value in enumerate(values):
+        view[i] = value
+    view.release()
+    return bytes(buffer)
+
+
+class AnalyticsSeries:
+    """
+    Local columnar time series for one analytics type
+
+    The series is a directory holding one append-only file per column:
+    ``_time.i64`` with bucket start times (epoch seconds) and one
+    ``.f64`` file per numeric metric (NaN where a bucket lacks it). A
+    ``manifest.json`` records the row count, the columns, their files, and the
+    newest bucket, which may still be filling up on the server and is
+    therefore kept out of the column files until a newer bucket closes
+    it. Files are memory-mapped for reads, so a query only touches the
+    pages it needs.
+
+    The manifest is written atomically after the columns, and column
+    bytes past its row count are discarded on open, so an interrupted
+    append never leaves a torn row.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Open or create a series
+
+        Args:
+            directory: Series directory
+        """
+        self.directory = os.path.expanduser(directory)
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.RLock()
+        manifest_path = os.path.join(self.directory, 'manifest.json')
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        else:
+            manifest = {'format': STORE_FORMAT, 'rows': 0, 'columns': [], 'open': None, 'synced_at': None}
+        if manifest.get('format') != STORE_FORMAT:
+            raise ValidationError(f"Unsupported analytics store format {manifest.get('format')}", field='format')
+        self.rows: int = manifest['rows']
+        self.metrics: List[str] = list(manifest['columns'])
+        # Manifests written before the mapping existed used the bare sanitized name
+        self._files: Dict[str, str] = {metric: _SAFE_NAME.sub('_', metric) + '.f64' for metric in self.metrics}
+        self._files.update(manifest.get('files') or {})
+        self.open_bucket: Optional[Dict[str, Any]] = manifest.get('open')
+        self.synced_at: Optional[str] = manifest.get('synced_at')
+
+        self._time = _Column(os.path.join(self.directory, _TIMESTAMP_COLUMN + '.i64'), 'q')
+        self._columns: Dict[str, _Column] = {}
+        self._time.truncate(self.rows)
+        for metric in self.metrics:
+            self._column(metric).truncate(self.rows)
+
+    def _column(self, metric: str) -> _Column:
+        column = self._columns.get(metric)
+        if column is None:
+            filename = self._files.get(metric)
+            if filename is None:
+                filename = self._files[metric] = self._new_filename(metric)
+            column = self._columns[metric] = _Column(os.path.join(self.directory, filename), 'd')
+        return column
+
+    def _new_filename(self, metric: str) -> str:
+        taken = {name.lower() for name in self._files.values()}
+        filename = _file_stem(metric) + '.f64'
+        n = 1
+        while filename.lower() in taken:
+            # Only reachable against legacy names, which were not hashed
+            filename = f"{_file_stem(metric)}-{n}.f64"
+            n += 1
+        return filename
+
+    @property
+    def last_closed(self) -> Optional[int]:
+        """Start time of the newest bucket in the column files"""
+        with self._lock:
+            times = self._time.view()
+            return times[self.rows - 1] if self.rows else None
+
+    @property
+    def last_bucket(self) -> Optional[int]:
+        """Start time of the newest bucket, closed or open"""
+        with self._lock:
+            return self.open_bucket['_time'] if self.open_bucket else self.last_closed
+
+    def merge(self, buckets: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add freshly fetched buckets
+
+        Buckets at or before the newest closed bucket are ignored. All but
+        the newest remaining bucket are appended; the newest becomes the
+        open bucket.
+
+        Args:
+            buckets: Rows from :func:`analytics_buckets`
+
+        Returns:
+            Number of rows appended to the column files
+        """
+        with self._lock:
+            last_closed = self.last_closed
+            fresh: Dict[int, Dict[str, Any]] = {}
+            if self.open_bucket:
+                fresh[self.open_bucket['_time']] = self.open_bucket
+            for bucket in buckets:
+                if last_closed is None or bucket['_time'] > last_closed:
+                    fresh[bucket['_time']] = bucket
+            if not fresh:
+                return 0
+
+            ordered = [fresh[t] for t in sorted(fresh)]
+            closed, newest = ordered[:-1], ordered[-1]
+            if closed:
+                for row in closed:
+                    for key, value in row.items():
+                        if key != _TIMESTAMP_COLUMN and key not in _TIME_KEYS and key not in self.metrics \
+                                and _numeric(value) is not None:
+                            self.metrics.append(key)
+                            self._column(key).truncate(self.rows)
+                for metric in self.metrics:
+                    values = [_numeric(row.get(metric)) for row in closed]
+                    self._column(metric).append([math.nan if v is None else v for v in values])
+                self._time.append([row['_time'] for row in closed])
+                self.rows += len(closed)
+
+            self.open_bucket = {key: _numeric(value) for key, value in newest.items()
+                                if key not in _TIME_KEYS and _numeric(value) is not None}
+            self.open_bucket[_TIMESTAMP_COLUMN] = newest[_TIMESTAMP_COLUMN]
+            self.synced_at = datetime.now(timezone.utc).isoformat()
+            self._write_manifest()
+            return len(closed)
+
+    def _write_manifest(self) -> None:
+        manifest = {'format': STORE_FORMAT, 'rows': self.rows, 'columns': self.metrics,
+                    'files': {metric: self._files[metric] for metric in self.metrics},
+                    'open': self.open_bucket, 'synced_at': self.synced_at}
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp, os.path.join(self.directory, 'manifest.json'))
+
+    def range(self, start: Optional[int] = None, end: Optional[int] = None,
+              metrics: Optional[Sequence[str]] = None, include_open: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get the buckets in a time range
+
+        Args:
+            start: First bucket start time to include (epoch seconds)
+            end: Bucket start times must be before this (epoch seconds)
+            metrics: Metrics to return (defaults to every metric)
+            include_open: Include the newest, possibly incomplete bucket
+
+        Returns:
+            Rows with ``time`` and the requested metrics, oldest first
+        """
+        metrics = list(metrics) if metrics is not None else list(self.metrics)
+        with self._lock:
+            times = self._time.view()
+            lo = 0 if start is None else bisect_left(times, start, 0, self.rows)
+            hi = self.rows if end is None else bisect_left(times, end, 0, self.rows)
+            columns = {metric: self._column(metric).view() if metric in self.metrics else None
+                       for metric in metrics}
+            rows = []
+            for i in range(lo, hi):
+                row = {'time': times[i]}
+                for metric, column in columns.items():
+                    value = column[i] if column is not None else math.nan
+                    row[metric] = None if math.isnan(value) else value
+                rows.append(row)
+            open_bucket = self.open_bucket
+            if include_open and open_bucket and (start is None or open_bucket['_time'] >= start) \
+                    and (end is None or open_bucket['_time'] < end):
+                rows.append(dict({'time': open_bucket['_time']},
+                                 **{metric: open_bucket.get(metric) for metric in metrics}))
+            return rows
+
+    def rollup(self, interval: Union[str, int] = 'day', agg: str = 'sum', start: Optional[int] = None,
+               end: Optional[int] = None, metrics: Optional[Sequence[str]] = None,
+               include_open: bool = True) -> List[Dict[str, Any]]:
+        """
+        Aggregate buckets into coarser intervals
+
+        Args:
+            interval: hour, day, week or a number of seconds
+            agg: sum, mean, min, max, last or count (missing values are skipped)
+            start: First bucket start time to include (epoch seconds)
+            end: Bucket start times must be before this (epoch seconds)
+            metrics: Metrics to aggregate (defaults to every metric)
+            include_open: Include the newest, possibly incomplete bucket
+
+        Returns:
+            One row per interval with ``time`` (interval start, UTC) and the aggregates
+
+        Raises:
+            ValidationError: If interval or agg is unknown
+        """
+        seconds = ROLLUP_INTERVALS.get(interval) if isinstance(interval, str) else int(interval)
+        if not seconds or seconds <= 0:
+            raise ValidationError(f"Unknown rollup interval '{interval}'", field='interval')
+        if agg not in ROLLUP_FUNCTIONS:
+            raise ValidationError(
+                f"Unknown rollup function '{agg}' (expected one of {', '.join(ROLLUP_FUNCTIONS)})", field='agg')
+
+        rows = self.range(start, end, metrics, include_open)
+        metrics = list(metrics) if metrics is not None else list(self.metrics)
+        groups: Dict[int, Dict[str, List[float]]] = {}
+        for row in rows:
+            group = groups.setdefault(row['time'] - row['time'] % seconds, {metric: [] for metric in metrics})
+            for metric in metrics:
+                if row.get(metric) is not None:
+                    group[metric].append(row[metric])
+
+        result = []
+        for group_start in sorted(groups):
+            out: Dict[str, Any] = {'time': group_start}
+            for metric, values in groups[group_start].items():
+                if agg == 'count':
+                    out[metric] = len(values)
+                elif not values:
+                    out[metric] = None
+                elif agg == 'sum':
+                    out[metric] = math.fsum(values)
+                elif agg == 'mean':
+                    out[metric] = math.fsum(values) / len(values)
+                elif agg == 'min':
+                    out[metric] = min(values)
+                elif agg == 'max':
+                    out[metric] = max(values)
+                else:
+                    out[metric] = values[-1]
+            result.append(out)
+        return result
+
+    def close(self) -> None:
+        """Release the memory maps"""
+        with self._lock:
+            self._time.release()
+            for column in self._columns.values():
+                column.release()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.rows + (1 if self.open_bucket else 0)
+
+
+class AnalyticsSync:
+    """
+    Keep local copies of analytics time series current
+
+    Each ``analytics_type`` gets an :class:`AnalyticsSeries` under
+    ``directory``. :meth:`sync` asks the server only for buckets from the
+    newest local bucket onwards (``since_param``, ``start_date`` by
+    default) and appends what is new; range and rollup queries are then
+    answered from the local files without touching the server. Buckets the
+    server returns again are ignored, so syncing is safe even when the
+    server ignores the start filter.
+
+    Example:
+        analytics = AnalyticsSync(client, '~/.purrr/analytics')
+        analytics.sync('user_behavior', filters={'timeframe': '30d'})
+        daily = analytics.rollup('user_behavior', 'day', agg='sum')
+    """
+
+    def __init__(self, client, directory: str, since_param: str = 'start_date'):
+        """
+        Initialize the sync
+
+        Args:
+            client: PurrrLoveClient
+            directory: Root directory of the local store
+            since_param: Filter name the server reads the first wanted bucket from
+        """
+        self.client = client
+        self.directory = os.path.expanduser(directory)
+        self.since_param = since_param
+        self._series: Dict[str, AnalyticsSeries] = {}
+        self._lock = threading.Lock()
+
+    def series(self, analytics_type: str) -> AnalyticsSeries:
+        """
+        Get the local series for an analytics type
+
+        Args:
+            analytics_type: Type of analytics
+
+        Returns:
+            AnalyticsSeries
+        """
+        with self._lock:
+            series = self._series.get(analytics_type)
+            if series is None:
+                path = os.path.join(self.directory, _file_stem(analytics_type))
+                series = self._series[analytics_type] = AnalyticsSeries(path)
+            return series
+
+    def sync(self, analytics_type: str = 'overview', filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Fetch new buckets for one analytics type
+
+        Args:
+            analytics_type: Type of analytics
+            filters: Extra filters sent with every sync
+
+        Returns:
+            Rows appended, total rows and the newest bucket time
+        """
+        series = self.series(analytics_type)
+        query = dict(filters or {})
+        since = series.last_bucket
+        if since is not None:
+            query[self.since_param] = datetime.fromtimestamp(since, timezone.utc).isoformat()
+        data = self.client.get_analytics_data(analytics_type, query)
+        appended = series.merge(analytics_buckets(data))
+        return {'appended': appended, 'rows': len(series), 'last_bucket': series.last_bucket}
+
+    def sync_all(self, analytics_types: Iterable[str],
+                 filters: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Sync several analytics types
+
+        Args:
+            analytics_types: Types of analytics
+            filters: Extra filters sent with every sync
+
+        Returns:
+            Sync results keyed by analytics type
+        """
+        return {analytics_type: self.sync(analytics_type, filters) for analytics_type in analytics_types}
+
+    def range(self, analytics_type: str, start: Optional[int] = None, end: Optional[int] = None,
+              metrics: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Get local buckets in a time range (see :meth:`AnalyticsSeries.range`)"""
+        return self.series(analytics_type).range(start, end, metrics)
+
+    def rollup(self, analytics_type: str, interval: Union[str, int] = 'day', agg: str = 'sum',
+               start: Optional[int] = None, end: Optional[int] = None,
+               metrics: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """Aggregate local buckets (see :meth:`AnalyticsSeries.rollup`)"""
+        return self.series(analytics_type).rollup(interval, agg, start, end, metrics)
+
+    def close(self) -> None:
+        """Release every series' memory maps"""
+        with self._lock:
+            for series in self._series.values():
+                series.close()
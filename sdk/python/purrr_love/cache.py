@@ -0,0 +1,175 @@
+"""
+🐱 Purrr.love Python SDK - Caching
+Thread-safe TTL cache with per-tenant namespaces
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+DEFAULT_CACHE_MAXSIZE = 10000
+DEFAULT_CACHE_TTL = 60.0
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a time-to-live
+
+    Keys are stored as ``(namespace, key)`` pairs so that several tenants
+    can share one bounded store without ever seeing each other's entries.
+    Use :meth:`namespace` to get a tenant-scoped view.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_MAXSIZE, ttl: float = DEFAULT_CACHE_TTL):
+        """
+        Initialize the cache
+
+        Args:
+            maxsize: Maximum number of entries across all namespaces
+            ttl: Default time-to-live in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # (namespace, key) -> (expires_at, value)
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None, namespace: str = '') -> Any:
+        """
+        Get a cached value
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+            namespace: Cache namespace
+
+        Returns:
+            Cached value or default
+        """
+        full_key = (namespace, key)
+        with self._lock:
+            entry = self._data.get(full_key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(full_key)
+                    self.hits += 1
+                    return value
+                del self._data[full_key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, namespace: str = '') -> None:
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (defaults to the cache TTL)
+            namespace: Cache namespace
+        """
+        full_key = (namespace, key)
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[full_key] = (expires_at, value)
+            self._data.move_to_end(full_key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any], ttl: Optional[float] = None,
+                   namespace: str = '') -> Any:
+        """
+        Get a cached value, computing and storing it on a miss
+
+        Args:
+            key: Cache key
+            factory: Callable producing the value on a miss
+            ttl: Time-to-live in seconds (defaults to the cache TTL)
+            namespace: Cache namespace
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key, _MISSING, namespace=namespace)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, ttl=ttl, namespace=namespace)
+        return value
+
+    def delete(self, key: Hashable, namespace: str = '') -> bool:
+        """
+        Remove an entry
+
+        Args:
+            key: Cache key
+            namespace: Cache namespace
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            return self._data.pop((namespace, key), None) is not None
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """
+        Remove entries
+
+        Args:
+            namespace: Only clear this namespace (None clears everything)
+        """
+        with self._lock:
+            if namespace is None:
+                self._data.clear()
+                return
+            for full_key in [k for k in self._data if k[0] == namespace]:
+                del self._data[full_key]
+
+    def namespace(self, name: str) -> 'NamespacedCache':
+        """
+        Get a view of the cache scoped to one namespace
+
+        Args:
+            name: Namespace name, e.g. a tenant id
+
+        Returns:
+            NamespacedCache view
+        """
+        return NamespacedCache(self, name)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class NamespacedCache:
+    """View of a TTLCache restricted to a single namespace"""
+
+    def __init__(self, cache: TTLCache, name: str):
+        self.cache = cache
+        self.name = name
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value from this namespace"""
+        return self.cache.get(key, default, namespace=self.name)
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value in this namespace"""
+        self.cache.set(key, value, ttl=ttl, namespace=self.name)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Get a cached value from this namespace, computing it on a miss"""
+        return self.cache.get_or_set(key, factory, ttl=ttl, namespace=self.name)
+
+    def delete(self, key: Hashable) -> bool:
+        """Remove an entry from this namespace"""
+        return self.cache.delete(key, namespace=self.name)
+
+    def clear(self) -> None:
+        """Remove every entry in this namespace"""
+        self.cache.clear(namespace=self.name)
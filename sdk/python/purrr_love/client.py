@@ -4,12 +4,21 @@ Main client class for interacting with the Purrr.love API
 """
 
 import requests
+import urllib3
 import json
-from typing import Dict, List, Optional, Union, Any
+import time
+from typing import Dict, Iterator, List, Optional, Union, Any
 from urllib.parse import urljoin
 
+from .cache import NamespacedCache, TTLCache
+from .compression import DEFAULT_COMPRESSION_THRESHOLD, compress_body, validate_request_encoding
 from .exceptions import PurrrLoveError, AuthenticationError, RateLimitError
+from .metrics import RequestMetrics
 from .models import Cat, User, ApiKey, TradingOffer, CatShow
+from .ratelimit import RateLimiter
+from .routes import ROUTES, Route
+from .transport import Transport
+from .webhook_logs import WebhookLogTail
 
 # Version constant
 __version__ = "2.0.0"
@@ -19,70 +28,139 @@ class PurrrLoveClient:
     Main client for interacting with the Purrr.love API
     """
     
-    def __init__(self, base_url: str = "https://api.purrr.love", api_key: Optional[str] = None):
+    def __init__(self, base_url: str = "https://api.purrr.love", api_key: Optional[str] = None,
+                 compress_requests: bool = False,
+                 compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+                 request_encoding: str = 'gzip',
+                 transport: Optional[Transport] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[NamespacedCache] = None):
         """
         Initialize the Purrr.love client
         
         Args:
             base_url: Base URL for the API
             api_key: API key for authentication
+            compress_requests: Whether to compress large request bodies
+            compression_threshold: Minimum body size in bytes to compress
+            request_encoding: Request body encoding (gzip, br, zstd)
+            transport: Shared HTTP transport (a private one is created if omitted)
+            rate_limiter: Optional client-side rate limiter applied to every request
+            cache: Optional cache namespace for SDK-side caches
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
-        self.session = requests.Session()
+        self.transport = transport or Transport()
+        self.rate_limiter = rate_limiter
+        self.cache = cache if cache is not None else TTLCache().namespace('')
+        self.metrics = RequestMetrics()
+        self.compress_requests = compress_requests
+        self.compression_threshold = compression_threshold
+        self.request_encoding = validate_request_encoding(request_encoding)
         
-        # Set default headers
-        self.session.headers.update({
-            'User-Agent': f'PurrrLove-Python-SDK/{__version__}',
-            'Content-Type': 'application/json'
-        })
+        # Absolute endpoint paths replace the base URL path, matching urljoin()
+        self._origin = urljoin(self.base_url, '/').rstrip('/')
+    
+    def warmup(self, n_connections: int = 1) -> Dict[str, Any]:
+        """
+        Pre-open connections to the API so the first request skips DNS,
+        TCP connect and TLS handshake
         
-        if api_key:
-            self.session.headers['X-API-Key'] = api_key
+        Args:
+            n_connections: Connections to open (capped at the pool size)
+            
+        Returns:
+            Warmup report with counts and timings
+            
+        Raises:
+            PurrrLoveError: If the API host cannot be reached
+        """
+        try:
+            return self.transport.warmup(self._origin + '/', n_connections)
+        except (urllib3.exceptions.HTTPError, OSError) as e:
+            raise PurrrLoveError(f"Warmup failed: {str(e)}")
+    
+    @property
+    def session(self) -> requests.Session:
+        """The underlying requests session (shared when the transport is shared)"""
+        return self.transport.session
     
     def authenticate(self, api_key: str) -> None:
         """
         Authenticate with an API key
         
+        The key is sent with each request rather than stored on the shared
+        session, so clients sharing a transport never see each other's key.
+        
         Args:
             api_key: API key for authentication
         """
         self.api_key = api_key
-        self.session.headers['X-API-Key'] = api_key
     
-    def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None, 
-                     params: Optional[Dict] = None) -> Dict[str, Any]:
+    def _make_request(self, method: str, endpoint: Union[str, Route], data: Optional[Dict] = None, 
+                     params: Optional[Dict] = None, path_params: Optional[Dict] = None,
+                     raw: bool = False) -> Union[Dict[str, Any], bytes]:
         """
         Make a request to the API
         
         Args:
             method: HTTP method
-            endpoint: API endpoint
+            endpoint: Precompiled Route or raw API endpoint path
             data: Request data
             params: Query parameters
+            path_params: Values for the Route template placeholders
+            raw: Return the undecoded response body instead of parsed JSON
             
         Returns:
-            API response data
+            API response data (bytes when raw)
             
         Raises:
             AuthenticationError: If authentication fails
             RateLimitError: If rate limit is exceeded
             PurrrLoveError: For other API errors
         """
-        url = urljoin(self.base_url, endpoint)
-        
+        if isinstance(endpoint, Route):
+            url = self._origin + endpoint.path(**(path_params or {}))
+            label = endpoint.name
+        else:
+            url = urljoin(self.base_url, endpoint)
+            label = endpoint.split('?', 1)[0]
+        
+        headers = {}
+        if self.api_key:
+            headers['X-API-Key'] = self.api_key
+        
+        body = None
+        uncompressed_size = 0
+        if data is not None and self.compress_requests:
+            body = json.dumps(data).encode('utf-8')
+            uncompressed_size = len(body)
+            if uncompressed_size >= self.compression_threshold:
+                body = compress_body(body, self.request_encoding)
+                headers['Content-Encoding'] = self.request_encoding
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        
+        started = time.perf_counter()
+        response = None
+        failed = True
         try:
-            response = self.session.request(
+            response = self.transport.request(
                 method=method,
                 url=url,
-                json=data,
-                params=params
+                json=data if body is None else None,
+                data=body,
+                params=params,
+                headers=headers
             )
             
             # Handle rate limiting
             if response.status_code == 429:
-                retry_after = response.headers.get('Retry-After', 60)
-                raise RateLimitError(f"Rate limit exceeded. Retry after {retry_after} seconds")
+                retry_after = response.headers.get('Retry-After', '60')
+                if not retry_after.isdigit():
+                    raise RateLimitError(f"Rate limit exceeded. Retry after {retry_after}")
+                raise RateLimitError("Rate limit exceeded", retry_after=int(retry_after))
             
             # Handle authentication errors
             if response.status_code == 401:
@@ -95,12 +173,51 @@ class PurrrLoveClient:
                 raise PurrrLoveError(f"API error {response.status_code}: {error_message}")
             
             # Parse response
-            if response.content:
-                return response.json()
-            return {}
+            if raw:
+                result = response.content
+            else:
+                result = response.json() if response.content else {}
+            failed = False
+            return result
             
         except requests.exceptions.RequestException as e:
             raise PurrrLoveError(f"Request failed: {str(e)}")
+        finally:
+            self.metrics.record(label, time.perf_counter() - started, error=failed,
+                                **self._transfer_sizes(response, uncompressed_size))
+    
+    @staticmethod
+    def _transfer_sizes(response: Optional[requests.Response], uncompressed_size: int) -> Dict[str, int]:
+        """
+        Measure request and response body sizes for compression metrics
+        
+        Args:
+            response: Completed response, if any
+            uncompressed_size: Request body size before compression
+            
+        Returns:
+            Keyword arguments for RequestMetrics.record
+        """
+        if response is None:
+            return {}
+        
+        request_body = response.request.body
+        sent = len(request_body) if request_body else 0
+        
+        # urllib3 counts the raw (still encoded) bytes it read off the socket
+        received = 0
+        raw = response.raw
+        if raw is not None and hasattr(raw, 'tell'):
+            received = raw.tell()
+        if not received:
+            received = int(response.headers.get('Content-Length') or 0)
+        
+        return {
+            'bytes_sent': sent,
+            'bytes_sent_uncompressed': uncompressed_size or sent,
+            'bytes_received': received,
+            'bytes_received_decoded': len(response.content or b''),
+        }
     
     # Cat Management
     def get_cats(self, limit: int = 50, offset: int = 0) -> List[Cat]:
@@ -115,7 +232,7 @@ class PurrrLoveClient:
             List of Cat objects
         """
         params = {'limit': limit, 'offset': offset}
-        response = self._make_request('GET', '/api/v1/cats', params=params)
+        response = self._make_request('GET', ROUTES['cats.list'], params=params)
         
         cats = []
         for cat_data in response.get('data', []):
@@ -123,6 +240,23 @@ class PurrrLoveClient:
         
         return cats
     
+    def get_cats_raw(self, limit: int = 50, offset: int = 0) -> bytes:
+        """
+        Get a page of the user's cats as the undecoded JSON body
+        
+        For pipelines that decode pages elsewhere, e.g. in ShardedRunner
+        worker processes.
+        
+        Args:
+            limit: Maximum number of cats to return
+            offset: Number of cats to skip
+            
+        Returns:
+            Response body bytes
+        """
+        params = {'limit': limit, 'offset': offset}
+        return self._make_request('GET', ROUTES['cats.list'], params=params, raw=True)
+    
     def get_cat(self, cat_id: int) -> Cat:
         """
         Get a specific cat by ID
@@ -133,7 +267,7 @@ class PurrrLoveClient:
         Returns:
             Cat object
         """
-        response = self._make_request('GET', f'/api/v1/cats/{cat_id}')
+        response = self._make_request('GET', ROUTES['cats.get'], path_params={'cat_id': cat_id})
         return Cat.from_dict(response['data'])
     
     def create_cat(self, name: str, species: str, personality_type: str, 
@@ -157,21 +291,36 @@ class PurrrLoveClient:
             'breed': breed
         }
         
-        response = self._make_request('POST', '/api/v1/cats', data=data)
+        response = self._make_request('POST', ROUTES['cats.create'], data=data)
         return Cat.from_dict(response['data'])
     
-    def update_cat(self, cat_id: int, **kwargs) -> Cat:
+    def update_cat(self, cat_id: Union[int, Cat], **kwargs) -> Cat:
         """
         Update a cat's information
         
+        Passing a loaded Cat sends only the fields changed since it was
+        loaded (plus any kwargs); an unchanged cat makes no request.
+        
         Args:
-            cat_id: ID of the cat to update
+            cat_id: ID of the cat to update, or a Cat with local changes
             **kwargs: Fields to update
             
         Returns:
-            Updated Cat object
+            Updated Cat object (the given Cat itself when nothing changed)
         """
-        response = self._make_request('PUT', f'/api/v1/cats/{cat_id}', data=kwargs)
+        cat = None
+        if isinstance(cat_id, Cat):
+            cat = cat_id
+            kwargs = dict(cat.changes(), **kwargs)
+            kwargs.pop('id', None)
+            if not kwargs:
+                return cat
+            cat_id = cat.id
+        
+        response = self._make_request('PUT', ROUTES['cats.update'], data=kwargs,
+                                      path_params={'cat_id': cat_id})
+        if cat is not None:
+            cat.mark_clean()
         return Cat.from_dict(response['data'])
     
     def delete_cat(self, cat_id: int) -> bool:
@@ -184,7 +333,7 @@ class PurrrLoveClient:
         Returns:
             True if successful
         """
-        self._make_request('DELETE', f'/api/v1/cats/{cat_id}')
+        self._make_request('DELETE', ROUTES['cats.delete'], path_params={'cat_id': cat_id})
         return True
     
     # Cat Activities
@@ -205,7 +354,8 @@ class PurrrLoveClient:
             'duration': duration
         }
         
-        response = self._make_request('POST', f'/api/v1/cats/{cat_id}/play', data=data)
+        response = self._make_request('POST', ROUTES['cats.play'], data=data,
+                                      path_params={'cat_id': cat_id})
         return response.get('data', {})
     
     def feed_cat(self, cat_id: int, food_type: str, amount: float = 1.0) -> Dict[str, Any]:
@@ -225,7 +375,8 @@ class PurrrLoveClient:
             'amount': amount
         }
         
-        response = self._make_request('POST', f'/api/v1/cats/{cat_id}/feed', data=data)
+        response = self._make_request('POST', ROUTES['cats.feed'], data=data,
+                                      path_params={'cat_id': cat_id})
         return response.get('data', {})
     
     def groom_cat(self, cat_id: int, grooming_type: str) -> Dict[str, Any]:
@@ -240,7 +391,8 @@ class PurrrLoveClient:
             Grooming results
         """
         data = {'grooming_type': grooming_type}
-        response = self._make_request('POST', f'/api/v1/cats/{cat_id}/groom', data=data)
+        response = self._make_request('POST', ROUTES['cats.groom'], data=data,
+                                      path_params={'cat_id': cat_id})
         return response.get('data', {})
     
     # Lost Pet Finder System
@@ -262,7 +414,7 @@ class PurrrLoveClient:
         Returns:
             Lost pet report data
         """
-        response = self._make_request('POST', '/api/v2/lost_pet_finder/report', data=pet_data)
+        response = self._make_request('POST', ROUTES['lost_pets.report'], data=pet_data)
         return response.get('data', {})
     
     def search_lost_pets(self, search_criteria: Dict[str, Any]) -> Dict[str, Any]:
@@ -281,7 +433,7 @@ class PurrrLoveClient:
         Returns:
             Search results with lost pets
         """
-        response = self._make_request('GET', '/api/v2/lost_pet_finder/search', params=search_criteria)
+        response = self._make_request('GET', ROUTES['lost_pets.search'], params=search_criteria)
         return response.get('data', {})
     
     def report_pet_sighting(self, sighting_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -299,7 +451,7 @@ class PurrrLoveClient:
         Returns:
             Sighting report data
         """
-        response = self._make_request('POST', '/api/v2/lost_pet_finder/sighting', data=sighting_data)
+        response = self._make_request('POST', ROUTES['lost_pets.sighting'], data=sighting_data)
         return response.get('data', {})
     
     def mark_pet_found(self, report_id: int, found_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -315,7 +467,7 @@ class PurrrLoveClient:
         Returns:
             Updated report data
         """
-        response = self._make_request('PUT', '/api/v2/lost_pet_finder/found', data=found_data)
+        response = self._make_request('PUT', ROUTES['lost_pets.found'], data=found_data)
         return response.get('data', {})
     
     def get_lost_pet_statistics(self) -> Dict[str, Any]:
@@ -325,7 +477,7 @@ class PurrrLoveClient:
         Returns:
             Statistics data including total reports, success rates, etc.
         """
-        response = self._make_request('GET', '/api/v2/lost_pet_finder/statistics')
+        response = self._make_request('GET', ROUTES['lost_pets.statistics'])
         return response.get('data', {})
     
     # Blockchain & NFT Management
@@ -347,7 +499,7 @@ class PurrrLoveClient:
             'metadata': metadata or {}
         }
         
-        response = self._make_request('POST', '/api/v2/advanced_features/blockchain?action=mint-nft', data=data)
+        response = self._make_request('POST', ROUTES['blockchain.mint_nft'], data=data)
         return response.get('data', {})
     
     def transfer_nft(self, nft_id: int, to_user_id: int, network: str = 'ethereum') -> Dict[str, Any]:
@@ -368,7 +520,7 @@ class PurrrLoveClient:
             'network': network
         }
         
-        response = self._make_request('POST', '/api/v2/advanced_features/blockchain?action=transfer-nft', data=data)
+        response = self._make_request('POST', ROUTES['blockchain.transfer_nft'], data=data)
         return response.get('data', {})
     
     def verify_nft_ownership(self, nft_id: int) -> Dict[str, Any]:
@@ -381,7 +533,7 @@ class PurrrLoveClient:
         Returns:
             Ownership verification data
         """
-        response = self._make_request('GET', f'/api/v2/advanced_features/blockchain?action=verify-nft&nft_id={nft_id}')
+        response = self._make_request('GET', ROUTES['blockchain.verify_nft'], params={'nft_id': nft_id})
         return response.get('data', {})
     
     def get_nft_collection(self, network: str = None) -> Dict[str, Any]:
@@ -394,11 +546,11 @@ class PurrrLoveClient:
         Returns:
             NFT collection data
         """
-        params = {'action': 'collection'}
+        params = {}
         if network:
             params['network'] = network
             
-        response = self._make_request('GET', '/api/v2/advanced_features/blockchain', params=params)
+        response = self._make_request('GET', ROUTES['blockchain.collection'], params=params)
         return response.get('data', {})
     
     def get_blockchain_statistics(self) -> Dict[str, Any]:
@@ -408,7 +560,7 @@ class PurrrLoveClient:
         Returns:
             Blockchain statistics data
         """
-        response = self._make_request('GET', '/api/v2/advanced_features/blockchain?action=stats')
+        response = self._make_request('GET', ROUTES['blockchain.stats'])
         return response.get('data', {})
     
     # Machine Learning Personality Prediction
@@ -423,8 +575,8 @@ class PurrrLoveClient:
         Returns:
             Personality prediction data
         """
-        params = {'action': 'predict', 'cat_id': cat_id, 'confidence': include_confidence}
-        response = self._make_request('GET', '/api/v2/advanced_features/ml-personality', params=params)
+        params = {'cat_id': cat_id, 'confidence': include_confidence}
+        response = self._make_request('GET', ROUTES['ml_personality.predict'], params=params)
         return response.get('data', {})
     
     def get_personality_insights(self, cat_id: int) -> Dict[str, Any]:
@@ -437,8 +589,8 @@ class PurrrLoveClient:
         Returns:
             Personality insights data
         """
-        params = {'action': 'insights', 'cat_id': cat_id}
-        response = self._make_request('GET', '/api/v2/advanced_features/ml-personality', params=params)
+        params = {'cat_id': cat_id}
+        response = self._make_request('GET', ROUTES['ml_personality.insights'], params=params)
         return response.get('data', {})
     
     def record_behavior_observation(self, cat_id: int, behavior_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -462,7 +614,7 @@ class PurrrLoveClient:
             **behavior_data
         }
         
-        response = self._make_request('POST', '/api/v2/advanced_features/ml-personality', data=data)
+        response = self._make_request('POST', ROUTES['ml_personality.observe'], data=data)
         return response.get('data', {})
     
     def update_genetic_data(self, cat_id: int, genetic_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -485,7 +637,7 @@ class PurrrLoveClient:
             **genetic_data
         }
         
-        response = self._make_request('POST', '/api/v2/advanced_features/ml-personality', data=data)
+        response = self._make_request('POST', ROUTES['ml_personality.genetic'], data=data)
         return response.get('data', {})
     
     def get_ml_training_status(self) -> Dict[str, Any]:
@@ -495,7 +647,7 @@ class PurrrLoveClient:
         Returns:
             Training status and metrics
         """
-        response = self._make_request('GET', '/api/v2/advanced_features/ml-personality?action=training')
+        response = self._make_request('GET', ROUTES['ml_personality.training'])
         return response.get('data', {})
     
     # Metaverse & VR Worlds
@@ -518,7 +670,7 @@ class PurrrLoveClient:
             **world_data
         }
         
-        response = self._make_request('POST', '/api/v2/advanced_features/metaverse', data=data)
+        response = self._make_request('POST', ROUTES['metaverse.create_world'], data=data)
         return response.get('data', {})
     
     def join_metaverse_world(self, world_id: int, cat_id: int = None) -> Dict[str, Any]:
@@ -539,7 +691,7 @@ class PurrrLoveClient:
         if cat_id:
             data['cat_id'] = cat_id
             
-        response = self._make_request('POST', '/api/v2/advanced_features/metaverse', data=data)
+        response = self._make_request('POST', ROUTES['metaverse.join_world'], data=data)
         return response.get('data', {})
     
     def leave_metaverse_world(self, world_id: int) -> Dict[str, Any]:
@@ -553,7 +705,7 @@ class PurrrLoveClient:
             World leaving confirmation
         """
         data = {'action': 'leave-world', 'world_id': world_id}
-        response = self._make_request('POST', '/api/v2/advanced_features/metaverse', data=data)
+        response = self._make_request('POST', ROUTES['metaverse.leave_world'], data=data)
         return response.get('data', {})
     
     def list_metaverse_worlds(self, filters: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -566,11 +718,11 @@ class PurrrLoveClient:
         Returns:
             List of available worlds
         """
-        params = {'action': 'worlds'}
+        params = {}
         if filters:
             params.update(filters)
             
-        response = self._make_request('GET', '/api/v2/advanced_features/metaverse', params=params)
+        response = self._make_request('GET', ROUTES['metaverse.worlds'], params=params)
         return response.get('data', {})
     
     def perform_vr_interaction(self, world_id: int, interaction_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -592,7 +744,7 @@ class PurrrLoveClient:
             **interaction_data
         }
         
-        response = self._make_request('POST', '/api/v2/advanced_features/metaverse', data=data)
+        response = self._make_request('POST', ROUTES['metaverse.interact'], data=data)
         return response.get('data', {})
     
     def get_metaverse_statistics(self) -> Dict[str, Any]:
@@ -602,7 +754,7 @@ class PurrrLoveClient:
         Returns:
             Metaverse statistics data
         """
-        response = self._make_request('GET', '/api/v2/advanced_features/metaverse?action=stats')
+        response = self._make_request('GET', ROUTES['metaverse.stats'])
         return response.get('data', {})
     
     # Webhook System
@@ -625,7 +777,7 @@ class PurrrLoveClient:
             **webhook_data
         }
         
-        response = self._make_request('POST', '/api/v2/advanced_features/webhooks', data=data)
+        response = self._make_request('POST', ROUTES['webhooks.create'], data=data)
         return response.get('data', {})
     
     def list_webhooks(self) -> Dict[str, Any]:
@@ -635,7 +787,7 @@ class PurrrLoveClient:
         Returns:
             List of webhook subscriptions
         """
-        response = self._make_request('GET', '/api/v2/advanced_features/webhooks?action=list')
+        response = self._make_request('GET', ROUTES['webhooks.list'])
         return response.get('data', {})
     
     def update_webhook(self, webhook_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -655,7 +807,7 @@ class PurrrLoveClient:
             **updates
         }
         
-        response = self._make_request('POST', '/api/v2/advanced_features/webhooks', data=data)
+        response = self._make_request('POST', ROUTES['webhooks.update'], data=data)
         return response.get('data', {})
     
     def delete_webhook(self, webhook_id: int) -> bool:
@@ -669,7 +821,7 @@ class PurrrLoveClient:
             True if successful
         """
         data = {'action': 'delete', 'webhook_id': webhook_id}
-        self._make_request('POST', '/api/v2/advanced_features/webhooks', data=data)
+        self._make_request('POST', ROUTES['webhooks.delete'], data=data)
         return True
     
     def test_webhook(self, webhook_id: int) -> Dict[str, Any]:
@@ -683,29 +835,61 @@ class PurrrLoveClient:
             Test results
         """
         data = {'action': 'test', 'webhook_id': webhook_id}
-        response = self._make_request('POST', '/api/v2/advanced_features/webhooks', data=data)
+        response = self._make_request('POST', ROUTES['webhooks.test'], data=data)
         return response.get('data', {})
     
-    def get_webhook_logs(self, webhook_id: int, limit: int = 100) -> Dict[str, Any]:
+    def get_webhook_logs(self, webhook_id: int, limit: int = 100, after_id: Optional[int] = None,
+                         before_id: Optional[int] = None) -> Dict[str, Any]:
         """
         Get webhook delivery logs
         
         Args:
             webhook_id: ID of the webhook
             limit: Maximum number of logs to return
+            after_id: Only return logs newer than this log ID
+            before_id: Only return logs older than this log ID
             
         Returns:
             Webhook delivery logs
         """
         params = {
-            'action': 'logs',
             'webhook_id': webhook_id,
             'limit': limit
         }
+        if after_id is not None:
+            params['after_id'] = after_id
+        if before_id is not None:
+            params['before_id'] = before_id
         
-        response = self._make_request('GET', '/api/v2/advanced_features/webhooks', params=params)
+        response = self._make_request('GET', ROUTES['webhooks.logs'], params=params)
         return response.get('data', {})
     
+    def tail_webhook_logs(self, webhook_id: int, follow: bool = False, history: bool = False,
+                          cursor: Optional[Dict[str, Any]] = None, page_size: int = 100,
+                          interval: float = 5.0, max_interval: float = 60.0) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over webhook delivery logs without re-fetching seen entries
+        
+        Args:
+            webhook_id: ID of the webhook
+            follow: Keep polling for new entries until the caller stops iterating
+            history: Stream every older entry first, newest first, page by page
+            cursor: Cursor from an earlier ``WebhookLogTail`` to resume after
+            page_size: Entries requested per page
+            interval: Seconds between polls in follow mode while entries arrive
+            max_interval: Longest wait between polls in follow mode
+            
+        Yields:
+            Delivery log entries
+        """
+        tail = WebhookLogTail(self, webhook_id, page_size=page_size, cursor=cursor)
+        if history:
+            yield from tail.history()
+        if follow:
+            yield from tail.follow(interval=interval, max_interval=max_interval)
+        elif not history:
+            yield from tail.poll()
+    
     # Analytics Dashboard
     def get_analytics_data(self, analytics_type: str = 'overview', filters: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -722,7 +906,7 @@ class PurrrLoveClient:
         if filters:
             params.update(filters)
             
-        response = self._make_request('GET', '/web/analytics_dashboard.php', params=params)
+        response = self._make_request('GET', ROUTES['analytics.dashboard'], params=params)
         return response.get('data', {})
     
     # Health Check
@@ -733,7 +917,7 @@ class PurrrLoveClient:
         Returns:
             Health status information
         """
-        response = self._make_request('GET', '/api/health.php')
+        response = self._make_request('GET', ROUTES['health'])
         return response
     
     # Utility Methods
@@ -744,7 +928,7 @@ class PurrrLoveClient:
         Returns:
             API information
         """
-        response = self._make_request('GET', '/api/')
+        response = self._make_request('GET', ROUTES['api.info'])
         return response
     
     def get_rate_limit_info(self) -> Dict[str, Any]:
@@ -756,7 +940,7 @@ class PurrrLoveClient:
         """
         # This would typically be available in response headers
         # For now, we'll make a lightweight request to check
-        response = self._make_request('GET', '/api/health.php')
+        response = self._make_request('GET', ROUTES['health'])
         return {
             'remaining': response.get('rate_limit_remaining', 'unknown'),
             'reset_time': response.get('rate_limit_reset', 'unknown')
@@ -0,0 +1,363 @@
+"""
+🐱 Purrr.love Python SDK - Binary Codec
+Compact binary encoding of SDK models for caches and inter-process queues
+"""
+
+import dataclasses
+import json
+import struct
+import zlib
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+from .exceptions import ConfigurationError, ValidationError
+from .models import ApiKey, Cat, CatShow, HealthDevice, MultiplayerSession, TradingOffer, User, VRInteraction
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+MAGIC = 0xC7
+FORMATS = {'struct': 1, 'msgpack': 2}
+DEFAULT_FORMAT = 'msgpack' if msgpack is not None else 'struct'
+
+# Stable wire ids; never reuse or renumber one
+MODEL_IDS = {
+    Cat: 1,
+    User: 2,
+    ApiKey: 3,
+    TradingOffer: 4,
+    CatShow: 5,
+    VRInteraction: 6,
+    HealthDevice: 7,
+    MultiplayerSession: 8,
+}
+
+_HEADER = struct.Struct('<BBBH')
+_MASKS = struct.Struct('<III')
+_FIXED_CODES = {'int': 'i', 'float': 'd', 'bool': '?', 'enum': 'B', 'datetime': 'q'}
+_PLAIN_TYPES = {'int': int, 'float': float, 'bool': bool, 'str': str}
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_INT_MIN, _INT_MAX = -(1 << 31), (1 << 31) - 1
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'))
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _field_kind(annotation: Any) -> Tuple[str, Optional[Type[Enum]]]:
+    if getattr(annotation, '__origin__', None) is Union:
+        args = [arg for arg in annotation.__args__ if arg is not type(None)]
+        if len(args) == 1:
+            annotation = args[0]
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return 'enum', annotation
+        if issubclass(annotation, datetime):
+            return 'datetime', None
+        for kind in (bool, int, float, str):
+            if annotation is kind:
+                return kind.__name__, None
+    return 'any', None
+
+
+_JSON_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+def _check_document(value: Any, name: str) -> None:
+    """Reject values that would not come back unchanged from JSON or msgpack"""
+    if type(value) in _JSON_SCALARS:
+        return
+    if type(value) is list:
+        for item in value:
+            _check_document(item, name)
+        return
+    if type(value) is dict:
+        for key, item in value.items():
+            if type(key) is not str:
+                raise ValidationError(f"Field '{name}' has a non-string key {key!r}", field=name)
+            _check_document(item, name)
+        return
+    raise ValidationError(f"Field '{name}' holds a {type(value).__name__}, which does not round-trip",
+                          field=name)
+
+
+def _micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        return (value - _NAIVE_EPOCH) // _MICROSECOND
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(micros: int, naive: bool) -> datetime:
+    return (_NAIVE_EPOCH if naive else _EPOCH) + timedelta(microseconds=micros)
+
+
+class _Schema:
+    """Field layout of one model class"""
+
+    def __init__(self, cls: type, model_id: int):
+        self.cls = cls
+        self.model_id = model_id
+        self.names: List[str] = []
+        self.kinds: List[str] = []
+        members: List[Optional[List[Enum]]] = []
+        for f in dataclasses.fields(cls):
+            kind, enum_cls = _field_kind(f.type)
+            self.names.append(f.name)
+            self.kinds.append(kind)
+            members.append(list(enum_cls) if enum_cls else None)
+        if len(self.names) > 32:
+            raise ConfigurationError(f"{cls.__name__} has more than 32 fields", config_key='codec')
+
+        self.getter = attrgetter(*self.names)
+        self.ints = [i for i, kind in enumerate(self.kinds) if kind == 'int']
+        self.plain = [(i, _PLAIN_TYPES[kind]) for i, kind in enumerate(self.kinds) if kind in ('float', 'bool', 'str')]
+        self.enums = [(i, members[i], {member: index for index, member in enumerate(members[i])})
+                      for i, kind in enumerate(self.kinds) if kind == 'enum']
+        self.datetimes = [i for i, kind in enumerate(self.kinds) if kind == 'datetime']
+        self.strings = [i for i, kind in enumerate(self.kinds) if kind == 'str']
+        self.fixed = [i for i, kind in enumerate(self.kinds) if kind in _FIXED_CODES]
+        self.documents = [i for i, kind in enumerate(self.kinds) if kind == 'any']
+        self.fixed_mask = sum(1 << i for i in self.fixed)
+        self.fixed_struct = struct.Struct('<' + ''.join(_FIXED_CODES[self.kinds[i]] for i in self.fixed))
+
+        described = ';'.join(
+            f"{name}:{kind}" + (':' + ','.join(str(m.value) for m in choices) if choices else '')
+            for name, kind, choices in zip(self.names, self.kinds, members)
+        )
+        self.version = zlib.crc32(f"{cls.__name__}|{described}".encode('utf-8')) & 0xFFFF
+
+    def to_wire(self, model: Any) -> Tuple[List[Any], int, int]:
+        """
+        Field values with enums as indexes and datetimes as epoch microseconds
+
+        Values that do not match their annotation (e.g. a string id) are
+        flagged in the generic mask and travel as they are.
+
+        Returns:
+            (values, generic mask, naive-datetime mask)
+        """
+        values = list(self.getter(model))
+        generic = naive = 0
+        for i in self.ints:
+            value = values[i]
+            if value is not None and (type(value) is not int or not _INT_MIN <= value <= _INT_MAX):
+                generic |= 1 << i
+        for i, plain in self.plain:
+            value = values[i]
+            if value is not None and type(value) is not plain:
+                generic |= 1 << i
+        for i, _, indexes in self.enums:
+            value = values[i]
+            if value is not None:
+                index = indexes.get(value)
+                if index is None:
+                    generic |= 1 << i
+                else:
+                    values[i] = index
+        for i in self.datetimes:
+            value = values[i]
+            if isinstance(value, datetime):
+                if value.tzinfo is None:
+                    naive |= 1 << i
+                values[i] = _micros(value)
+            elif value is not None:
+                generic |= 1 << i
+        return values, generic, naive
+
+    def from_wire(self, values: List[Any], generic: int, naive: int) -> Any:
+        for i, choices, _ in self.enums:
+            if values[i] is not None and not (generic >> i) & 1:
+                values[i] = choices[values[i]]
+        for i in self.datetimes:
+            if values[i] is not None and not (generic >> i) & 1:
+                values[i] = _from_micros(values[i], (naive >> i) & 1)
+        model = self.cls(**dict(zip(self.names, values)))
+        model.mark_clean()
+        return model
+
+    def sections(self, missing: int, generic: int) -> Tuple[List[int], List[int]]:
+        """String fields and JSON fields stored after the fixed part of a struct record"""
+        strings = [i for i in self.strings if not ((missing | generic) >> i) & 1]
+        documents = [i for i in self.documents if not (missing >> i) & 1]
+        if generic:
+            documents = sorted(documents + [i for i in range(len(self.names))
+                                            if (generic >> i) & 1 and self.kinds[i] != 'any'])
+        return strings, documents
+
+
+_SCHEMAS: Dict[type, _Schema] = {cls: _Schema(cls, model_id) for cls, model_id in MODEL_IDS.items()}
+_SCHEMAS_BY_ID: Dict[int, _Schema] = {schema.model_id: schema for schema in _SCHEMAS.values()}
+
+
+def schema_version(model_cls: type) -> int:
+    """
+    Schema version of a model class
+
+    The version is a fingerprint of the field names, types and enum
+    members, so it changes whenever the model's layout does.
+
+    Args:
+        model_cls: Model class from ``purrr_love.models``
+
+    Returns:
+        16-bit schema version
+    """
+    return _schema_for(model_cls).version
+
+
+def _schema_for(model_cls: type) -> _Schema:
+    schema = _SCHEMAS.get(model_cls)
+    if schema is None:
+        raise ValidationError(f"{model_cls.__name__} has no binary schema", field='model')
+    return schema
+
+
+def _encode_struct(schema: _Schema, values: List[Any], generic: int, naive: int) -> bytes:
+    missing = 0
+    for i, value in enumerate(values):
+        if value is None:
+            missing |= 1 << i
+    skip = missing | generic
+    fixed = [0 if (skip >> i) & 1 else values[i] for i in schema.fixed]
+    strings, documents = schema.sections(missing, generic)
+    chunks = [values[i].encode('utf-8') for i in strings]
+    if documents:
+        # Free-form and generic fields share one JSON array
+        chunks.append(_JSON_ENCODER.encode([values[i] for i in documents]).encode('utf-8'))
+    return b''.join((
+        _HEADER.pack(MAGIC, FORMATS['struct'], schema.model_id, schema.version),
+        _MASKS.pack(missing, generic, naive),
+        schema.fixed_struct.pack(*fixed),
+        struct.pack(f'<{len(chunks)}I', *map(len, chunks)),
+        *chunks,
+    ))
+
+
+def _decode_struct(schema: _Schema, data: bytes) -> Any:
+    offset = _HEADER.size
+    missing, generic, naive = _MASKS.unpack_from(data, offset)
+    offset += _MASKS.size
+    values: List[Any] = [None] * len(schema.names)
+    fixed = schema.fixed_struct.unpack_from(data, offset)
+    if missing & schema.fixed_mask:
+        for i, value in zip(schema.fixed, fixed):
+            if not (missing >> i) & 1:
+                values[i] = value
+    else:
+        for i, value in zip(schema.fixed, fixed):
+            values[i] = value
+    offset += schema.fixed_struct.size
+
+    strings, documents = schema.sections(missing, generic)
+    lengths = struct.unpack_from(f'<{len(strings) + bool(documents)}I', data, offset)
+    offset += 4 * len(lengths)
+    for i, length in zip(strings, lengths):
+        values[i] = data[offset:offset + length].decode('utf-8')
+        offset += length
+    if documents:
+        decoded = _JSON_DECODER.decode(data[offset:offset + lengths[-1]].decode('utf-8'))
+        for i, value in zip(documents, decoded):
+            values[i] = value
+    return schema.from_wire(values, generic, naive)
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ConfigurationError(
+            "msgpack is required for the msgpack model format (pip install \"purrr-love-sdk[msgpack]\")",
+            config_key='msgpack'
+        )
+
+
+def encode(model: Any, format: Optional[str] = None) -> bytes:
+    """
+    Encode a model as compact binary
+
+    Enums are stored as small ints and datetimes as epoch microseconds
+    (aware datetimes come back in UTC). Each record starts with a header
+    naming the model and its schema version, so :func:`decode` needs no
+    type hint and refuses records written by a different schema.
+
+    Args:
+        model: Instance of a model from ``purrr_love.models``
+        format: msgpack or struct (defaults to msgpack when installed)
+
+    Returns:
+        Encoded bytes
+
+    Raises:
+        ValidationError: If the model, a field value or the format is not supported;
+            free-form fields must hold JSON-style data (str keys, lists, not tuples)
+        ConfigurationError: If msgpack is requested but not installed
+    """
+    schema = _schema_for(type(model))
+    format = format or DEFAULT_FORMAT
+    if format not in FORMATS:
+        raise ValidationError(f"Unknown model format '{format}'", field='format')
+    if format == 'msgpack':
+        _require_msgpack()
+    values, generic, naive = schema.to_wire(model)
+    for i in schema.documents:
+        _check_document(values[i], schema.names[i])
+    if generic:
+        for i in range(len(values)):
+            if (generic >> i) & 1:
+                _check_document(values[i], schema.names[i])
+    try:
+        if format == 'struct':
+            return _encode_struct(schema, values, generic, naive)
+        header = _HEADER.pack(MAGIC, FORMATS['msgpack'], schema.model_id, schema.version)
+        return header + msgpack.packb([generic, naive, *values])
+    except (TypeError, ValueError, OverflowError) as e:
+        raise ValidationError(f"Cannot encode {type(model).__name__}: {e}", field='model')
+
+
+def decode(data: bytes, model_cls: Optional[type] = None) -> Any:
+    """
+    Decode bytes produced by :func:`encode`
+
+    The decoded model counts as freshly loaded for change tracking.
+
+    Args:
+        data: Encoded model
+        model_cls: Expected model class, checked against the header
+
+    Returns:
+        Model instance
+
+    Raises:
+        ValidationError: If the data is not an encoded model, is of another
+            model class, or was written by a different schema version
+        ConfigurationError: If the data is msgpack and msgpack is not installed
+    """
+    data = bytes(data)
+    if len(data) < _HEADER.size:
+        raise ValidationError("Encoded model is truncated", field='data')
+    magic, format_id, model_id, version = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValidationError("Data is not an encoded model", field='data')
+    schema = _SCHEMAS_BY_ID.get(model_id)
+    if schema is None:
+        raise ValidationError(f"Unknown model id {model_id}", field='data')
+    if model_cls is not None and schema.cls is not model_cls:
+        raise ValidationError(f"Expected {model_cls.__name__}, got {schema.cls.__name__}", field='data')
+    if version != schema.version:
+        raise ValidationError(
+            f"{schema.cls.__name__} was encoded with schema {version}, this SDK uses {schema.version}",
+            field='schema'
+        )
+
+    try:
+        if format_id == FORMATS['struct']:
+            return _decode_struct(schema, data)
+        if format_id == FORMATS['msgpack']:
+            _require_msgpack()
+            generic, naive, *values = msgpack.unpackb(memoryview(data)[_HEADER.size:], strict_map_key=False)
+            return schema.from_wire(values, generic, naive)
+    except (struct.error, ValueError, IndexError, TypeError) as e:
+        raise ValidationError(f"Corrupt encoded {schema.cls.__name__}: {e}", field='data')
+    raise ValidationError(f"Unknown model format {format_id}", field='data')
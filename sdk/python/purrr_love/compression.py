@@ -0,0 +1,126 @@
+"""
+🐱 Purrr.love Python SDK - Compression
+Content-encoding negotiation and request body compression
+"""
+
+import gzip
+from typing import Callable, Dict, List
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+from .exceptions import ConfigurationError
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# Response encodings in order of preference (best ratio first)
+_PREFERENCE = ('zstd', 'br', 'gzip', 'deflate')
+
+# Default minimum body size in bytes before request compression kicks in
+DEFAULT_COMPRESSION_THRESHOLD = 1024
+
+
+def _gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=6)
+
+
+def _brotli(body: bytes) -> bytes:
+    return brotli.compress(body, quality=5)
+
+
+def _zstd(body: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(body)
+
+
+def _request_compressors() -> Dict[str, Callable[[bytes], bytes]]:
+    compressors = {'gzip': _gzip}
+    if brotli is not None:
+        compressors['br'] = _brotli
+    if zstandard is not None:
+        compressors['zstd'] = _zstd
+    return compressors
+
+
+_COMPRESSORS = _request_compressors()
+
+
+def available_response_encodings() -> List[str]:
+    """
+    Get the response encodings the transport can decode
+
+    urllib3 only advertises ``br`` and ``zstd`` when the matching optional
+    decoder package is installed, so this never negotiates an encoding that
+    would come back undecodable.
+
+    Returns:
+        Encodings in order of preference
+    """
+    supported = {encoding.strip() for encoding in ACCEPT_ENCODING.split(',')}
+    return [encoding for encoding in _PREFERENCE if encoding in supported]
+
+
+def accept_encoding_header() -> str:
+    """
+    Build the Accept-Encoding header value for API requests
+
+    Returns:
+        Header value, e.g. ``zstd, br, gzip, deflate``
+    """
+    return ', '.join(available_response_encodings())
+
+
+def available_request_encodings() -> List[str]:
+    """
+    Get the encodings available for compressing request bodies
+
+    Returns:
+        Encodings in order of preference
+    """
+    return [encoding for encoding in _PREFERENCE if encoding in _COMPRESSORS]
+
+
+def validate_request_encoding(encoding: str) -> str:
+    """
+    Check that a request body encoding can be produced
+
+    Args:
+        encoding: Content-Encoding name (gzip, br, zstd)
+
+    Returns:
+        The validated encoding
+
+    Raises:
+        ConfigurationError: If the encoding is unknown or its package is missing
+    """
+    if encoding not in _COMPRESSORS:
+        raise ConfigurationError(
+            f"unsupported request encoding '{encoding}' "
+            f"(available: {', '.join(available_request_encodings())})",
+            config_key='request_encoding'
+        )
+    return encoding
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """
+    Compress a request body
+
+    Args:
+        body: Serialized request body
+        encoding: Content-Encoding name (gzip, br, zstd)
+
+    Returns:
+        Compressed body
+    """
+    return _COMPRESSORS[validate_request_encoding(encoding)](body)
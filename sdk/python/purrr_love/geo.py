@@ -0,0 +1,144 @@
+"""
+🐱 Purrr.love Python SDK - Geospatial Helpers
+Great-circle distances and a grid-based spatial index
+"""
+
+import math
+from typing import Dict, Hashable, Iterator, List, Set, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180.0
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance between two points
+
+    Args:
+        lat1: Latitude of the first point in degrees
+        lon1: Longitude of the first point in degrees
+        lat2: Latitude of the second point in degrees
+        lon2: Longitude of the second point in degrees
+
+    Returns:
+        Distance in kilometers
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class SpatialIndex:
+    """
+    Uniform latitude/longitude grid index
+
+    Points are bucketed into square cells of ``cell_km`` (measured along a
+    meridian). A radius query only visits the cells overlapping the
+    query's bounding box and then filters by exact haversine distance, so
+    its cost depends on local density rather than on the total number of
+    points. Longitudes wrap around the antimeridian.
+    """
+
+    def __init__(self, cell_km: float = 5.0):
+        """
+        Initialize the index
+
+        Args:
+            cell_km: Grid cell size in kilometers
+        """
+        self.cell_deg = cell_km / KM_PER_DEGREE
+        self._lon_cells = max(1, math.ceil(360.0 / self.cell_deg))
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._points: Dict[Hashable, Tuple[float, float, Tuple[int, int]]] = {}
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return (int(math.floor((lat + 90.0) / self.cell_deg)),
+                int(math.floor((lon + 180.0) / self.cell_deg)) % self._lon_cells)
+
+    def insert(self, key: Hashable, lat: float, lon: float) -> None:
+        """
+        Add or move a point
+
+        Args:
+            key: Point identifier
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+        """
+        self.remove(key)
+        cell = self._cell(lat, lon)
+        self._cells.setdefault(cell, set()).add(key)
+        self._points[key] = (lat, lon, cell)
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove a point
+
+        Args:
+            key: Point identifier
+
+        Returns:
+            True if the point was present
+        """
+        point = self._points.pop(key, None)
+        if point is None:
+            return False
+        bucket = self._cells[point[2]]
+        bucket.discard(key)
+        if not bucket:
+            del self._cells[point[2]]
+        return True
+
+    def within(self, lat: float, lon: float, radius_km: float) -> Iterator[Tuple[Hashable, float]]:
+        """
+        Find points within a radius
+
+        Args:
+            lat: Query latitude in degrees
+            lon: Query longitude in degrees
+            radius_km: Query radius in kilometers
+
+        Yields:
+            (key, distance_km) pairs in no particular order
+        """
+        angle = radius_km / EARTH_RADIUS_KM
+        lat_span = math.degrees(angle)
+        cos_lat = math.cos(math.radians(lat))
+        # Exact longitude half-width of a spherical cap; a cap reaching a
+        # pole covers every longitude
+        if angle >= math.pi / 2 or math.sin(angle) >= cos_lat:
+            lon_span = 180.0
+        else:
+            lon_span = math.degrees(math.asin(math.sin(angle) / cos_lat))
+
+        row_min, col_min = self._cell(max(-90.0, lat - lat_span), lon - lon_span)
+        row_max, _ = self._cell(min(90.0, lat + lat_span), lon)
+        col_count = min(self._lon_cells, int(math.ceil(2 * lon_span / self.cell_deg)) + 2)
+
+        for row in range(row_min, row_max + 1):
+            for offset in range(col_count):
+                bucket = self._cells.get((row, (col_min + offset) % self._lon_cells))
+                if not bucket:
+                    continue
+                for key in bucket:
+                    p_lat, p_lon, _ = self._points[key]
+                    distance = haversine_km(lat, lon, p_lat, p_lon)
+                    if distance <= radius_km:
+                        yield key, distance
+
+    def clear(self) -> None:
+        """Remove all points"""
+        self._cells.clear()
+        self._points.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._points
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def keys(self) -> List[Hashable]:
+        """Get all point identifiers"""
+        return list(self._points)
@@ -0,0 +1,608 @@
+"""
+🐱 Purrr.love Python SDK - Lost Pet Finder Helpers
+Local geospatial index of lost-pet reports and batched sighting ingestion
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from .exceptions import PurrrLoveError
+from .geo import SpatialIndex, haversine_km
+
+DEFAULT_SEARCH_RADIUS_KM = 10
+DEFAULT_MAX_STALENESS = 60.0
+
+CONFIDENCE_LEVELS = ('low', 'medium', 'high')
+
+
+class LostPetIndex:
+    """
+    Local snapshot of the lost-pet reports in one region
+
+    The index mirrors the active reports around a fixed coverage circle and
+    answers ``search_lost_pets``-style queries (radius, breed, color,
+    ``age_range``) in memory, with the same matching rules as the server:
+    case-insensitive substring matches on breed and color, an inclusive age
+    range, and results ordered by distance then newest first.
+
+    Queries fall back to the server when the snapshot is older than
+    ``max_staleness`` seconds or the query circle is not fully inside the
+    coverage circle.
+
+    Example:
+        index = LostPetIndex(client, latitude=40.78, longitude=-73.97, radius_km=50)
+        index.sync()
+        index.start()  # keep it fresh in the background
+        results = index.search({'latitude': 40.7829, 'longitude': -73.9654,
+                                'radius_km': 5, 'breed': 'persian'})
+    """
+
+    def __init__(self, client, latitude: float, longitude: float, radius_km: float,
+                 cell_km: float = 2.0,
+                 max_staleness: float = DEFAULT_MAX_STALENESS):
+        """
+        Initialize the index
+
+        Args:
+            client: PurrrLoveClient used for syncing and fallback searches
+            latitude: Coverage center latitude
+            longitude: Coverage center longitude
+            radius_km: Coverage radius in kilometers
+            cell_km: Spatial grid cell size in kilometers
+            max_staleness: Seconds after the last sync before queries go to the server
+        """
+        self.client = client
+        self.latitude = latitude
+        self.longitude = longitude
+        self.radius_km = radius_km
+        self.max_staleness = max_staleness
+
+        self._spatial = SpatialIndex(cell_km)
+        self._reports: Dict[Any, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._synced_at: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.local_queries = 0
+        self.server_queries = 0
+
+    # Synchronization
+    def sync(self) -> Dict[str, int]:
+        """
+        Refresh the snapshot from the server
+
+        Every sync is full: the search endpoint has no ``updated_since``
+        filter and only returns active reports, so any report missing from
+        the response (found, closed or moved out of range) is dropped.
+
+        Returns:
+            Counts of upserted and removed reports
+        """
+        now = time.monotonic()
+        criteria = {
+            'latitude': self.latitude,
+            'longitude': self.longitude,
+            'radius_km': self.radius_km,
+        }
+
+        response = self.client.search_lost_pets(criteria)
+        reports = response.get('results', [])
+
+        upserted = removed = 0
+        with self._lock:
+            seen = set()
+            for report in reports:
+                report_id = report.get('id')
+                if report_id is None:
+                    continue
+                seen.add(report_id)
+                if report.get('status', 'active') != 'active':
+                    removed += self._remove(report_id)
+                    continue
+                if self._upsert(report_id, report):
+                    upserted += 1
+
+            for report_id in [rid for rid in self._reports if rid not in seen]:
+                removed += self._remove(report_id)
+            self._synced_at = now
+
+        return {'upserted': upserted, 'removed': removed}
+
+    def apply(self, report: Dict[str, Any]) -> bool:
+        """
+        Apply one changed report without a sync
+
+        Active reports are inserted or replaced; reports with any other
+        status are dropped.
+
+        Args:
+            report: Lost pet report with ``id`` and ``status``
+
+        Returns:
+            True if the report is now in the index
+        """
+        report_id = report.get('id')
+        if report_id is None:
+            return False
+        with self._lock:
+            if report.get('status', 'active') != 'active':
+                self._remove(report_id)
+                return False
+            return self._upsert(report_id, report)
+
+    def discard(self, report_id: Any) -> bool:
+        """
+        Drop one report from the index
+
+        Args:
+            report_id: ID of the lost pet report
+
+        Returns:
+            True if the report was in the index
+        """
+        with self._lock:
+            return self._remove(report_id) == 1
+
+    def _upsert(self, report_id: Any, report: Dict[str, Any]) -> bool:
+        try:
+            lat = float(report['latitude'])
+            lon = float(report['longitude'])
+        except (KeyError, TypeError, ValueError):
+            # Reports without coordinates can never match a radius search
+            self._remove(report_id)
+            return False
+        self._reports[report_id] = report
+        self._spatial.insert(report_id, lat, lon)
+        return True
+
+    def _remove(self, report_id: Any) -> int:
+        self._spatial.remove(report_id)
+        return 1 if self._reports.pop(report_id, None) is not None else 0
+
+    def start(self, interval: float = 30.0) -> None:
+        """
+        Keep the snapshot fresh with a background sync thread
+
+        Args:
+            interval: Seconds between syncs
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True,
+                                        name='purrr-lost-pet-index')
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background sync thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sync()
+            except Exception:
+                # Keep serving the last snapshot; staleness triggers server fallback
+                pass
+            self._stop.wait(interval)
+
+    # Queries
+    @property
+    def is_stale(self) -> bool:
+        """Whether the snapshot is too old to answer queries"""
+        return self._synced_at is None or time.monotonic() - self._synced_at > self.max_staleness
+
+    def covers(self, latitude: float, longitude: float, radius_km: float) -> bool:
+        """
+        Check whether a query circle lies inside the coverage circle
+
+        Args:
+            latitude: Query center latitude
+            longitude: Query center longitude
+            radius_km: Query radius in kilometers
+
+        Returns:
+            True if the local snapshot can answer the query
+        """
+        distance = haversine_km(self.latitude, self.longitude, latitude, longitude)
+        return distance + radius_km <= self.radius_km
+
+    def search(self, search_criteria: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Search lost pets locally, falling back to the server when needed
+
+        Args:
+            search_criteria: Same criteria as ``PurrrLoveClient.search_lost_pets``
+
+        Returns:
+            Search results with ``results``, ``total_count`` and ``source``
+            (``local`` or ``server``)
+        """
+        latitude = search_criteria.get('latitude')
+        longitude = search_criteria.get('longitude')
+        radius_km = float(search_criteria.get('radius_km') or DEFAULT_SEARCH_RADIUS_KM)
+
+        if (latitude is not None and longitude is not None and not self.is_stale
+                and self.covers(float(latitude), float(longitude), radius_km)):
+            return self.search_local(search_criteria)
+
+        self.server_queries += 1
+        response = self.client.search_lost_pets(search_criteria)
+        response['source'] = 'server'
+        return response
+
+    def search_local(self, search_criteria: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Search the local snapshot only
+
+        Args:
+            search_criteria: Dictionary containing search parameters
+                - latitude: Search center latitude (required)
+                - longitude: Search center longitude (required)
+                - radius_km: Search radius in kilometers
+                - breed: Breed substring to match
+                - color: Color substring to match
+                - age_range: Dictionary with min and max age
+
+        Returns:
+            Search results with ``results``, ``total_count`` and ``source``
+        """
+        latitude = float(search_criteria['latitude'])
+        longitude = float(search_criteria['longitude'])
+        radius_km = float(search_criteria.get('radius_km') or DEFAULT_SEARCH_RADIUS_KM)
+        breed = (search_criteria.get('breed') or '').casefold()
+        color = (search_criteria.get('color') or '').casefold()
+        age_range = search_criteria.get('age_range')
+
+        results: List[Dict[str, Any]] = []
+        with self._lock:
+            for report_id, distance in self._spatial.within(latitude, longitude, radius_km):
+                report = self._reports[report_id]
+                if breed and breed not in str(report.get('breed') or '').casefold():
+                    continue
+                if color and color not in str(report.get('color') or '').casefold():
+                    continue
+                if age_range and not _age_in_range(report.get('age'), age_range):
+                    continue
+                result = dict(report)
+                result['distance_meters'] = distance * 1000
+                results.append(result)
+
+        # Newest first, then (stable) nearest first
+        results.sort(key=lambda r: str(r.get('created_at') or ''), reverse=True)
+        results.sort(key=lambda r: r['distance_meters'])
+
+        self.local_queries += 1
+        return {'results': results, 'total_count': len(results), 'source': 'local'}
+
+    def get(self, report_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Get a report from the snapshot
+
+        Args:
+            report_id: ID of the lost pet report
+
+        Returns:
+            Report data or None
+        """
+        with self._lock:
+            return self._reports.get(report_id)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._reports)
+
+
+def _age_in_range(age: Any, age_range: Dict[str, Any]) -> bool:
+    try:
+        age = int(age)
+    except (TypeError, ValueError):
+        return False
+    return int(age_range.get('min', age)) <= age <= int(age_range.get('max', age))
+
+
+class _PendingSighting:
+    """A buffered sighting plus the near-duplicates merged into it"""
+
+    __slots__ = ('data', 'received_at', 'sighted_at', 'merged', 'attempts', '_lat_sum', '_lon_sum', '_points')
+
+    def __init__(self, data: Dict[str, Any], received_at: float, sighted_at: float):
+        self.data = dict(data)
+        self.data['photos'] = list(self.data.get('photos') or [])
+        self.received_at = received_at
+        self.sighted_at = sighted_at
+        self.merged = 0
+        self.attempts = 0
+        coords = _coordinates(data)
+        self._points = 1 if coords else 0
+        self._lat_sum, self._lon_sum = coords or (0.0, 0.0)
+
+    @property
+    def coordinates(self):
+        if not self._points:
+            return None
+        return self._lat_sum / self._points, self._lon_sum / self._points
+
+    def absorb(self, data: Dict[str, Any], sighted_at: float) -> None:
+        """Fold a near-duplicate sighting into this one"""
+        self.merged += 1
+        coords = _coordinates(data)
+        if coords:
+            self._points += 1
+            self._lat_sum += coords[0]
+            self._lon_sum += coords[1]
+            self.data['latitude'], self.data['longitude'] = self.coordinates
+
+        # Report the most recent time the pet was seen
+        if sighted_at > self.sighted_at:
+            self.sighted_at = sighted_at
+            if data.get('sighting_date'):
+                self.data['sighting_date'] = data['sighting_date']
+
+        for photo in data.get('photos') or []:
+            if photo not in self.data['photos']:
+                self.data['photos'].append(photo)
+
+        description = data.get('description')
+        if description and description not in (self.data.get('description') or ''):
+            existing = self.data.get('description')
+            self.data['description'] = f"{existing}\n{description}" if existing else description
+
+        confidence = data.get('confidence_level')
+        if confidence in CONFIDENCE_LEVELS and (
+                self.data.get('confidence_level') not in CONFIDENCE_LEVELS
+                or CONFIDENCE_LEVELS.index(confidence) > CONFIDENCE_LEVELS.index(self.data['confidence_level'])):
+            self.data['confidence_level'] = confidence
+
+    def payload(self) -> Dict[str, Any]:
+        data = dict(self.data)
+        if self.merged:
+            data['merged_sightings'] = self.merged + 1
+        return data
+
+
+class SightingBatcher:
+    """
+    Buffer, de-duplicate and batch ``report_pet_sighting`` submissions
+
+    Sightings are buffered per ``lost_pet_report_id``. A new sighting that
+    falls within ``time_window`` seconds and ``distance_km`` of a buffered
+    one for the same report is merged into it instead of becoming a new
+    request: photos are unioned, distinct descriptions kept, the highest
+    confidence level and the latest sighting time win, and coordinates are
+    averaged. Sightings without coordinates merge when their ``location``
+    text matches.
+
+    Buffered sightings are held for ``hold_seconds`` so duplicates have a
+    chance to arrive, then submitted concurrently in batches. A failed
+    submission is retried after ``retry_delay`` seconds, doubling with
+    each attempt. The last ``max_results`` server responses are kept in
+    ``results``.
+
+    Example:
+        with SightingBatcher(client) as batcher:
+            for sighting in volunteer_feed:
+                batcher.add(sighting)
+        print(batcher.stats)
+    """
+
+    def __init__(self, client, time_window: float = 600.0, distance_km: float = 0.25,
+                 hold_seconds: float = 5.0, batch_size: int = 50, max_workers: int = 4,
+                 max_attempts: int = 3, retry_delay: float = 5.0, max_results: int = 1000):
+        """
+        Initialize the batcher
+
+        Args:
+            client: PurrrLoveClient used to submit sightings
+            time_window: Max seconds between sightings that may be merged
+            distance_km: Max distance between sightings that may be merged
+            hold_seconds: Seconds a sighting is buffered before it is submitted
+            batch_size: Buffered sightings that trigger an immediate flush
+            max_workers: Concurrent submissions per flush
+            max_attempts: Submission attempts before a sighting is dropped
+            retry_delay: Seconds before the first retry of a failed sighting
+            max_results: Recent submission responses kept in ``results``
+        """
+        self.client = client
+        self.time_window = time_window
+        self.distance_km = distance_km
+        self.hold_seconds = hold_seconds
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+
+        self._pending: Dict[Any, List[_PendingSighting]] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.submitted = 0
+        self.collapsed = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.results: Deque[Dict[str, Any]] = deque(maxlen=max_results)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Counts of submitted, collapsed, sent, failed and dropped sightings"""
+        with self._lock:
+            return {
+                'submitted': self.submitted,
+                'collapsed': self.collapsed,
+                'sent': self.sent,
+                'failed': self.failed,
+                'dropped': self.dropped,
+                'pending': self._count,
+            }
+
+    def add(self, sighting_data: Dict[str, Any]) -> bool:
+        """
+        Buffer a sighting
+
+        Args:
+            sighting_data: Same fields as ``PurrrLoveClient.report_pet_sighting``
+
+        Returns:
+            True if the sighting was merged into a buffered near-duplicate
+        """
+        report_id = sighting_data.get('lost_pet_report_id')
+        now = time.monotonic()
+        sighted_at = _sighting_time(sighting_data, time.time())
+
+        with self._lock:
+            self.submitted += 1
+            bucket = self._pending.setdefault(report_id, [])
+            for pending in bucket:
+                if self._is_duplicate(pending, sighting_data, sighted_at):
+                    pending.absorb(sighting_data, sighted_at)
+                    self.collapsed += 1
+                    return True
+            bucket.append(_PendingSighting(sighting_data, now, sighted_at))
+            self._count += 1
+            full = self._count >= self.batch_size
+
+        if full:
+            self.flush()
+        return False
+
+    def _is_duplicate(self, pending: _PendingSighting, data: Dict[str, Any], sighted_at: float) -> bool:
+        if abs(sighted_at - pending.sighted_at) > self.time_window:
+            return False
+        coords = _coordinates(data)
+        existing = pending.coordinates
+        if coords and existing:
+            return haversine_km(existing[0], existing[1], coords[0], coords[1]) <= self.distance_km
+        if coords or existing:
+            return False
+        return (str(data.get('location') or '').strip().casefold()
+                == str(pending.data.get('location') or '').strip().casefold())
+
+    def flush(self, force: bool = False) -> int:
+        """
+        Submit buffered sightings
+
+        Args:
+            force: Submit everything, ignoring ``hold_seconds``
+
+        Returns:
+            Number of sightings sent successfully
+        """
+        with self._flush_lock:
+            cutoff = time.monotonic() - self.hold_seconds
+            with self._lock:
+                ready: List[_PendingSighting] = []
+                for report_id in list(self._pending):
+                    bucket = self._pending[report_id]
+                    keep = []
+                    for pending in bucket:
+                        (ready if force or pending.received_at <= cutoff else keep).append(pending)
+                    if keep:
+                        self._pending[report_id] = keep
+                    else:
+                        del self._pending[report_id]
+                self._count -= len(ready)
+
+            if not ready:
+                return 0
+
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ready))) as executor:
+                outcomes = list(executor.map(self._send, ready))
+
+            sent = 0
+            with self._lock:
+                for pending, result in zip(ready, outcomes):
+                    if result is not None:
+                        sent += 1
+                        self.results.append(result)
+                        continue
+                    self.failed += 1
+                    if pending.attempts >= self.max_attempts:
+                        self.dropped += 1
+                    else:
+                        # Hold it back until the exponential retry delay has passed
+                        pending.received_at = (time.monotonic() - self.hold_seconds
+                                               + self.retry_delay * 2 ** (pending.attempts - 1))
+                        report_id = pending.data.get('lost_pet_report_id')
+                        self._pending.setdefault(report_id, []).append(pending)
+                        self._count += 1
+                self.sent += sent
+            return sent
+
+    def _send(self, pending: _PendingSighting) -> Optional[Dict[str, Any]]:
+        pending.attempts += 1
+        try:
+            return self.client.report_pet_sighting(pending.payload())
+        except PurrrLoveError:
+            return None
+
+    def start(self, interval: float = 1.0) -> None:
+        """
+        Flush held sightings from a background thread
+
+        Args:
+            interval: Seconds between flush checks
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True,
+                                        name='purrr-sighting-batcher')
+        self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stop the background thread
+
+        Args:
+            flush: Submit everything still buffered
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if flush:
+            self.flush(force=True)
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.flush()
+
+    def __enter__(self) -> 'SightingBatcher':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def _coordinates(data: Dict[str, Any]):
+    try:
+        return float(data['latitude']), float(data['longitude'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _sighting_time(data: Dict[str, Any], default: float) -> float:
+    """Sighting time as epoch seconds, or default when absent or unparseable"""
+    value = data.get('sighting_date')
+    if not value:
+        return default
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return default
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
@@ -0,0 +1,305 @@
+"""
+🐱 Purrr.love Python SDK - Lost Pet Matching
+Vectorized scoring of found-animal records against open lost-pet reports
+"""
+
+import re
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .exceptions import ConfigurationError
+from .geo import EARTH_RADIUS_KM
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+DEFAULT_WEIGHTS = {
+    'distance': 0.4,
+    'breed': 0.25,
+    'color': 0.25,
+    'time': 0.1,
+}
+
+# Similarity used when either side is missing the attribute
+_UNKNOWN_SIMILARITY = 0.5
+_MIXED_BREEDS = {'', 'mixed', 'unknown', 'domestic', 'domestic shorthair', 'domestic longhair'}
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ConfigurationError(
+            "NumPy is required for lost pet matching (pip install \"purrr-love-sdk[numpy]\")",
+            config_key='numpy'
+        )
+
+
+def _normalize(value: Any) -> str:
+    return ' '.join(str(value or '').casefold().replace('_', ' ').split())
+
+
+def _color_tokens(value: Any) -> List[str]:
+    return [token for token in re.split(r'[^a-z]+', _normalize(value)) if token and token not in ('and', 'with')]
+
+
+def _epoch_days(value: Any) -> float:
+    """Parse an ISO date/datetime into days since the epoch (NaN if missing)"""
+    if value is None or value == '':
+        return float('nan')
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        except ValueError:
+            return float('nan')
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp() / 86400.0
+
+
+def _found_date(record: Dict[str, Any]) -> Any:
+    return record.get('found_date') or record.get('sighting_date') or record.get('date')
+
+
+class LostPetMatcher:
+    """
+    Score found-animal records against lost-pet reports with NumPy
+
+    Reports are loaded once into column arrays (coordinates in radians,
+    breed codes, a color-token matrix and last-seen days). Each found
+    record is then scored against every report in a handful of array
+    operations:
+
+    - distance: ``exp(-haversine_km / distance_scale_km)``
+    - breed: 1 for the same breed, 0 for different breeds, 0.5 when either
+      side is unknown or mixed
+    - color: Jaccard similarity of color words ("black and white" vs "white")
+    - time: ``exp(-days_since_last_seen / time_scale_days)``, and 0 when the
+      animal was found more than a day before it was reported lost
+
+    The final score is the weighted sum of those components.
+
+    Example:
+        matcher = LostPetMatcher.from_search(client, {'latitude': 40.78, 'longitude': -73.97,
+                                                      'radius_km': 100})
+        candidates = matcher.match(found_record, k=10)
+    """
+
+    def __init__(self, reports: Iterable[Dict[str, Any]] = (), weights: Optional[Dict[str, float]] = None,
+                 distance_scale_km: float = 5.0, time_scale_days: float = 14.0):
+        """
+        Initialize the matcher
+
+        Args:
+            reports: Lost-pet reports (as returned by ``search_lost_pets``)
+            weights: Component weights (distance, breed, color, time)
+            distance_scale_km: Distance at which the distance score falls to 1/e
+            time_scale_days: Elapsed days at which the time score falls to 1/e
+        """
+        _require_numpy()
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self.distance_scale_km = distance_scale_km
+        self.time_scale_days = time_scale_days
+        self.load(reports)
+
+    @classmethod
+    def from_search(cls, client, search_criteria: Dict[str, Any], **kwargs: Any) -> 'LostPetMatcher':
+        """
+        Build a matcher from a server-side lost-pet search
+
+        Args:
+            client: PurrrLoveClient
+            search_criteria: Criteria for ``search_lost_pets``
+            **kwargs: Keyword arguments for the matcher
+
+        Returns:
+            LostPetMatcher loaded with the search results
+        """
+        return cls(client.search_lost_pets(search_criteria).get('results', []), **kwargs)
+
+    def load(self, reports: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replace the loaded reports
+
+        Args:
+            reports: Lost-pet reports
+        """
+        reports = list(reports)
+        self.reports = reports
+        n = len(reports)
+
+        self._lat = np.full(n, np.nan)
+        self._lon = np.full(n, np.nan)
+        self._last_seen = np.empty(n)
+        self._breed = np.empty(n, dtype=np.int32)
+        self._breed_vocab: Dict[str, int] = {}
+
+        color_rows: List[List[int]] = []
+        self._color_vocab: Dict[str, int] = {}
+
+        for i, report in enumerate(reports):
+            try:
+                self._lat[i] = float(report['latitude'])
+                self._lon[i] = float(report['longitude'])
+            except (KeyError, TypeError, ValueError):
+                pass
+            self._last_seen[i] = _epoch_days(report.get('last_seen_date'))
+            self._breed[i] = self._breed_code(report.get('breed'), grow=True)
+            color_rows.append([self._color_vocab.setdefault(t, len(self._color_vocab))
+                               for t in _color_tokens(report.get('color'))])
+
+        self._lat = np.radians(self._lat)
+        self._lon = np.radians(self._lon)
+        self._cos_lat = np.cos(self._lat)
+
+        self._colors = np.zeros((n, max(1, len(self._color_vocab))), dtype=np.float32)
+        for i, row in enumerate(color_rows):
+            self._colors[i, row] = 1.0
+        self._color_counts = self._colors.sum(axis=1)
+
+    def _breed_code(self, breed: Any, grow: bool = False) -> int:
+        """Breed code; -1 means unknown/mixed, -2 means a breed no report has"""
+        name = _normalize(breed)
+        if name in _MIXED_BREEDS:
+            return -1
+        if grow:
+            return self._breed_vocab.setdefault(name, len(self._breed_vocab))
+        return self._breed_vocab.get(name, -2)
+
+    def _encode_found(self, records: Sequence[Dict[str, Any]]):
+        m = len(records)
+        lat = np.full(m, np.nan)
+        lon = np.full(m, np.nan)
+        found = np.empty(m)
+        breed = np.empty(m, dtype=np.int32)
+        colors = np.zeros((m, self._colors.shape[1]), dtype=np.float32)
+        color_counts = np.zeros(m, dtype=np.float32)
+
+        for j, record in enumerate(records):
+            try:
+                lat[j] = float(record['latitude'])
+                lon[j] = float(record['longitude'])
+            except (KeyError, TypeError, ValueError):
+                pass
+            found[j] = _epoch_days(_found_date(record))
+            breed[j] = self._breed_code(record.get('breed'))
+            tokens = set(_color_tokens(record.get('color')))
+            color_counts[j] = len(tokens)
+            known = [self._color_vocab[t] for t in tokens if t in self._color_vocab]
+            colors[j, known] = 1.0
+
+        return np.radians(lat), np.radians(lon), found, breed, colors, color_counts
+
+    def score_matrix(self, found_records: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Score found records against every loaded report
+
+        Args:
+            found_records: Found-animal records
+
+        Returns:
+            Dictionary of (m x n) arrays: ``score``, ``distance_km`` and one
+            array per component
+        """
+        lat, lon, found, breed, colors, color_counts = self._encode_found(found_records)
+
+        # Haversine distance, broadcast (m, 1) against (1, n)
+        dlat = self._lat[None, :] - lat[:, None]
+        dlon = self._lon[None, :] - lon[:, None]
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * self._cos_lat[None, :] * np.sin(dlon / 2) ** 2
+        distance_km = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+        distance_score = np.nan_to_num(np.exp(-distance_km / self.distance_scale_km), nan=0.0)
+
+        # Breed: exact code match, neutral when either side is unknown/mixed
+        same = breed[:, None] == self._breed[None, :]
+        unknown = (breed[:, None] == -1) | (self._breed[None, :] == -1)
+        breed_score = np.where(unknown, _UNKNOWN_SIMILARITY, same.astype(np.float64))
+
+        # Color: Jaccard similarity of color words
+        intersection = colors @ self._colors.T
+        union = color_counts[:, None] + self._color_counts[None, :] - intersection
+        with np.errstate(divide='ignore', invalid='ignore'):
+            color_score = np.where(union > 0, intersection / union, _UNKNOWN_SIMILARITY)
+        color_score = np.where((color_counts[:, None] == 0) | (self._color_counts[None, :] == 0),
+                               _UNKNOWN_SIMILARITY, color_score)
+
+        # Time decay since the pet went missing; found-before-lost cannot match
+        elapsed = found[:, None] - self._last_seen[None, :]
+        time_score = np.where(elapsed < -1.0, 0.0, np.exp(-np.maximum(elapsed, 0.0) / self.time_scale_days))
+        time_score = np.where(np.isnan(elapsed), _UNKNOWN_SIMILARITY, time_score)
+
+        w = self.weights
+        score = (w['distance'] * distance_score + w['breed'] * breed_score
+                 + w['color'] * color_score + w['time'] * time_score)
+
+        return {
+            'score': score,
+            'distance_km': distance_km,
+            'distance': distance_score,
+            'breed': breed_score,
+            'color': color_score,
+            'time': time_score,
+        }
+
+    def match(self, found_record: Dict[str, Any], k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Find the top-k lost-pet reports for one found record
+
+        Args:
+            found_record: Found-animal record (latitude, longitude, breed,
+                color, found_date)
+            k: Number of candidates to return
+
+        Returns:
+            Candidates ordered by descending score
+        """
+        return self.match_batch([found_record], k=k)[0]
+
+    def match_batch(self, found_records: Sequence[Dict[str, Any]], k: int = 10,
+                    chunk_size: int = 256) -> List[List[Dict[str, Any]]]:
+        """
+        Find the top-k lost-pet reports for many found records at once
+
+        Records are scored in chunks so memory stays bounded at
+        ``chunk_size`` x number-of-reports.
+
+        Args:
+            found_records: Found-animal records
+            k: Number of candidates per record
+            chunk_size: Found records scored per array operation
+
+        Returns:
+            One candidate list per found record
+        """
+        n = len(self.reports)
+        if n == 0:
+            return [[] for _ in found_records]
+        k = min(k, n)
+
+        matches: List[List[Dict[str, Any]]] = []
+        for start in range(0, len(found_records), chunk_size):
+            chunk = found_records[start:start + chunk_size]
+            scores = self.score_matrix(chunk)
+            score = scores['score']
+            top = np.argpartition(-score, k - 1, axis=1)[:, :k]
+            for row, candidates in enumerate(top):
+                ordered = candidates[np.argsort(-score[row, candidates], kind='stable')]
+                matches.append([self._candidate(scores, row, int(i)) for i in ordered])
+        return matches
+
+    def _candidate(self, scores: Dict[str, Any], row: int, index: int) -> Dict[str, Any]:
+        distance = scores['distance_km'][row, index]
+        return {
+            'report_id': self.reports[index].get('id'),
+            'score': float(scores['score'][row, index]),
+            'distance_km': None if np.isnan(distance) else float(distance),
+            'components': {name: float(scores[name][row, index]) for name in ('distance', 'breed', 'color', 'time')},
+            'report': self.reports[index],
+        }
+
+    def __len__(self) -> int:
+        return len(self.reports)
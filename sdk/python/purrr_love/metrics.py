@@ -0,0 +1,124 @@
+"""
+🐱 Purrr.love Python SDK - Request Metrics
+Lightweight per-endpoint request metrics for the Purrr.love client
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
+
+
+@dataclass
+class EndpointStats:
+    """Aggregated statistics for one endpoint label"""
+    requests: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    bytes_sent: int = 0
+    bytes_sent_uncompressed: int = 0
+    bytes_received: int = 0
+    bytes_received_decoded: int = 0
+
+    @property
+    def average_time(self) -> float:
+        """Mean request duration in seconds"""
+        return self.total_time / self.requests if self.requests else 0.0
+
+    @property
+    def request_compression_ratio(self) -> float:
+        """Uncompressed to on-the-wire size of request bodies"""
+        return self.bytes_sent_uncompressed / self.bytes_sent if self.bytes_sent else 1.0
+
+    @property
+    def response_compression_ratio(self) -> float:
+        """Decoded to on-the-wire size of response bodies"""
+        return self.bytes_received_decoded / self.bytes_received if self.bytes_received else 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert EndpointStats instance to dictionary"""
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'total_time': self.total_time,
+            'average_time': self.average_time,
+            'max_time': self.max_time,
+            'bytes_sent': self.bytes_sent,
+            'bytes_sent_uncompressed': self.bytes_sent_uncompressed,
+            'bytes_received': self.bytes_received,
+            'bytes_received_decoded': self.bytes_received_decoded,
+            'request_compression_ratio': self.request_compression_ratio,
+            'response_compression_ratio': self.response_compression_ratio,
+        }
+
+
+class RequestMetrics:
+    """
+    Thread-safe request metrics keyed by stable endpoint label
+
+    Labels come from :class:`purrr_love.routes.Route` names, so every call
+    to e.g. ``get_cat`` is counted under ``cats.get`` regardless of the
+    cat id in the URL.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, EndpointStats] = {}
+
+    def record(self, label: str, duration: float, error: bool = False,
+               bytes_sent: int = 0, bytes_sent_uncompressed: int = 0,
+               bytes_received: int = 0, bytes_received_decoded: int = 0) -> None:
+        """
+        Record a completed request
+
+        Args:
+            label: Endpoint label
+            duration: Request duration in seconds
+            error: Whether the request failed
+            bytes_sent: Request body size on the wire
+            bytes_sent_uncompressed: Request body size before compression
+            bytes_received: Response body size on the wire
+            bytes_received_decoded: Response body size after decoding
+        """
+        with self._lock:
+            stats = self._endpoints.get(label)
+            if stats is None:
+                stats = self._endpoints[label] = EndpointStats()
+            stats.requests += 1
+            stats.total_time += duration
+            if duration > stats.max_time:
+                stats.max_time = duration
+            if error:
+                stats.errors += 1
+            stats.bytes_sent += bytes_sent
+            stats.bytes_sent_uncompressed += bytes_sent_uncompressed
+            stats.bytes_received += bytes_received
+            stats.bytes_received_decoded += bytes_received_decoded
+
+    def get(self, label: str) -> Optional[EndpointStats]:
+        """
+        Get statistics for one endpoint label
+
+        Args:
+            label: Endpoint label
+
+        Returns:
+            EndpointStats or None if the endpoint has not been called
+        """
+        with self._lock:
+            return self._endpoints.get(label)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get a point-in-time copy of all endpoint statistics
+
+        Returns:
+            Dictionary mapping endpoint labels to statistics
+        """
+        with self._lock:
+            return {label: stats.to_dict() for label, stats in self._endpoints.items()}
+
+    def reset(self) -> None:
+        """Clear all recorded statistics"""
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,494 @@
+"""
+🐱 Purrr.love Python SDK - Webhook-Driven Mirrors
+Local state kept current by webhook events instead of polling
+"""
+
+import dataclasses
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from .exceptions import NotFoundError
+from .models import Cat
+from .routes import ROUTES
+from .webhooks import WebhookEvent, WebhookReceiver
+
+CAT_EVENTS = ('cat.created', 'cat.updated', 'cat.deleted')
+NFT_EVENTS = ('blockchain.nft_minted', 'blockchain.nft_transferred')
+LOST_PET_EVENTS = ('lost_pet.reported', 'lost_pet.updated', 'lost_pet.sighting', 'lost_pet.found')
+METAVERSE_EVENTS = ('metaverse.world_joined', 'metaverse.world_left', 'metaverse.vr_interaction')
+SYNC_EVENTS = CAT_EVENTS + NFT_EVENTS + LOST_PET_EVENTS + METAVERSE_EVENTS
+
+DEFAULT_SEEN_EVENTS = 100000
+DEFAULT_WORLDS_TTL = 300.0
+
+_CAT_FIELDS = frozenset(f.name for f in dataclasses.fields(Cat))
+_CAT_REQUIRED = ('id', 'name', 'species', 'breed', 'personality_type', 'mood')
+
+# Version of a mirrored cat whose data carried no updated_at
+_UNVERSIONED = float('-inf')
+
+
+def _epoch(value: Any) -> Optional[float]:
+    """Parse an ISO timestamp or epoch number, or None"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+_CREATION_EVENTS = frozenset(('cat.created', 'lost_pet.reported', 'blockchain.nft_minted', 'nft.minted'))
+
+
+def event_version(event: WebhookEvent, record: Optional[Dict[str, Any]] = None) -> Optional[float]:
+    """
+    Ordering key of an event for one entity
+
+    Only the entity's own timestamps order events: ``updated_at``, or
+    ``created_at`` for creation events. The delivery timestamp is never
+    used, because the server re-signs every retry with the current time
+    and a stale retry would otherwise look newer than what it replays.
+
+    Args:
+        event: Verified webhook event
+        record: Entity data carried by the event
+
+    Returns:
+        Epoch seconds, or None when the event cannot be ordered
+    """
+    record = record or {}
+    version = _epoch(record.get('updated_at'))
+    if version is None and event.event_type in _CREATION_EVENTS:
+        version = _epoch(record.get('created_at'))
+    return version
+
+
+class CatMirror:
+    """
+    Local copy of cats, served instead of ``get_cat``
+
+    A cat is fetched from the server once, on its first lookup, and then
+    only changes through :meth:`apply` and :meth:`remove`, which
+    :class:`WebhookSync` calls for ``cat.*`` events. Every entry carries a
+    version, the server's ``updated_at`` in epoch seconds; a change older
+    than the stored version is ignored, and deleted cats leave a tombstone
+    so a late ``cat.updated`` cannot bring them back. A change without a
+    version cannot be ordered, so it drops the entry instead of patching
+    it and the next lookup fetches the current cat.
+
+    Example:
+        cats = CatMirror(client)
+        cat = cats.get(123)   # one request, then served locally
+    """
+
+    def __init__(self, client, max_age: Optional[float] = None):
+        """
+        Initialize the mirror
+
+        Args:
+            client: PurrrLoveClient used for first lookups
+            max_age: Refetch entries older than this many seconds
+                (None trusts webhook events indefinitely)
+        """
+        self.client = client
+        self.max_age = max_age
+        self._cats: Dict[Any, Dict[str, Any]] = {}
+        self._versions: Dict[Any, float] = {}
+        self._loaded_at: Dict[Any, float] = {}
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.fetches = 0
+        self.patches = 0
+        self.removals = 0
+        self.stale = 0
+
+    def get(self, cat_id: int, refresh: bool = False) -> Cat:
+        """
+        Get a cat, from the mirror when possible
+
+        Args:
+            cat_id: ID of the cat
+            refresh: Fetch from the server even if mirrored
+
+        Returns:
+            Cat object
+
+        Raises:
+            NotFoundError: If the cat was deleted
+        """
+        with self._lock:
+            data = self._cats.get(cat_id)
+            if data is None and cat_id in self._versions:
+                raise NotFoundError(f"Cat {cat_id} was deleted", resource_type='Cat', resource_id=str(cat_id))
+            fresh = self.max_age is None or time.monotonic() - self._loaded_at.get(cat_id, 0) < self.max_age
+            if data is not None and fresh and not refresh:
+                self.hits += 1
+                return Cat.from_dict(dict(data))
+
+        fetched = self.client.get_cat(cat_id).to_dict()
+        with self._lock:
+            self.fetches += 1
+            version = _epoch(fetched.get('updated_at'))
+            if version is None:
+                version = _UNVERSIONED
+            # An event newer than the fetch may have landed meanwhile
+            if self._versions.get(cat_id, _UNVERSIONED) <= version:
+                self._cats[cat_id] = fetched
+                self._versions[cat_id] = version
+                self._loaded_at[cat_id] = time.monotonic()
+            data = self._cats.get(cat_id, fetched)
+        return Cat.from_dict(dict(data))
+
+    def is_stale(self, cat_id: Any, version: Optional[float]) -> bool:
+        """
+        Check whether a change is older than the mirrored cat
+
+        Args:
+            cat_id: ID of the cat
+            version: Version of the change (None for unversioned)
+
+        Returns:
+            True if the change must be ignored
+        """
+        if version is None:
+            return False
+        with self._lock:
+            return version < self._versions.get(cat_id, _UNVERSIONED)
+
+    def apply(self, cat_id: Any, fields: Dict[str, Any], version: Optional[float]) -> bool:
+        """
+        Patch a cat with changed fields
+
+        A cat that is not mirrored yet is only added when the fields form
+        a complete cat; otherwise its first lookup fetches it. An
+        unversioned change drops the mirrored cat instead.
+
+        Args:
+            cat_id: ID of the cat
+            fields: Changed fields
+            version: Version of the change (epoch seconds, or None)
+
+        Returns:
+            True if the mirror changed
+        """
+        fields = {key: value for key, value in fields.items() if key in _CAT_FIELDS}
+        with self._lock:
+            if version is None:
+                if cat_id not in self._cats:
+                    return False
+                self._cats.pop(cat_id)
+                self._versions.pop(cat_id, None)
+                self._loaded_at.pop(cat_id, None)
+                return True
+            if version < self._versions.get(cat_id, _UNVERSIONED):
+                self.stale += 1
+                return False
+            current = self._cats.get(cat_id)
+            if current is None:
+                if not all(key in fields or key == 'id' for key in _CAT_REQUIRED):
+                    return False
+                current = {'id': cat_id}
+                self._loaded_at[cat_id] = time.monotonic()
+            current.update(fields)
+            self._cats[cat_id] = current
+            self._versions[cat_id] = version
+            self.patches += 1
+            return True
+
+    def remove(self, cat_id: Any, version: Optional[float]) -> bool:
+        """
+        Remove a deleted cat, leaving a tombstone
+
+        Args:
+            cat_id: ID of the cat
+            version: Version of the deletion (epoch seconds, or None to
+                keep the stored version)
+
+        Returns:
+            True if the mirror changed
+        """
+        with self._lock:
+            stored = self._versions.get(cat_id, _UNVERSIONED)
+            if version is None:
+                version = stored
+            elif version < stored:
+                self.stale += 1
+                return False
+            self._cats.pop(cat_id, None)
+            self._loaded_at.pop(cat_id, None)
+            self._versions[cat_id] = version
+            self.removals += 1
+            return True
+
+    def invalidate(self, cat_id: Optional[Any] = None) -> None:
+        """
+        Forget mirrored cats so the next lookup fetches them
+
+        Args:
+            cat_id: Only forget this cat (None forgets every cat)
+        """
+        with self._lock:
+            if cat_id is None:
+                self._cats.clear()
+                self._versions.clear()
+                self._loaded_at.clear()
+                return
+            self._cats.pop(cat_id, None)
+            self._versions.pop(cat_id, None)
+            self._loaded_at.pop(cat_id, None)
+
+    def __contains__(self, cat_id: Any) -> bool:
+        with self._lock:
+            return cat_id in self._cats
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cats)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Lookup, patch and stale-event counters"""
+        with self._lock:
+            return {
+                'cats': len(self._cats),
+                'tombstones': len(self._versions) - len(self._cats),
+                'hits': self.hits,
+                'fetches': self.fetches,
+                'patches': self.patches,
+                'removals': self.removals,
+                'stale': self.stale,
+            }
+
+
+class WebhookSync:
+    """
+    Apply webhook events to the SDK's local caches and mirrors
+
+    Handlers are registered on a :class:`WebhookReceiver` and route each
+    event to whatever local state it affects:
+
+    - ``cat.*`` patches or removes the cat in the :class:`CatMirror` and
+      drops its cached personality predictions
+    - ``blockchain.nft_*`` (and ``nft.*``) drops the network's cached
+      collection in an ``NFTPortfolio`` and the NFT's cached verification
+    - ``lost_pet.*`` updates or removes the report in a ``LostPetIndex``
+    - ``metaverse.*`` drops the world listings cached by :meth:`worlds`
+
+    Deliveries are idempotent: an event id already applied is skipped, so
+    server retries and duplicate subscriptions change nothing. Ordering is
+    per entity: an event older than the last one applied to the same cat,
+    NFT or report is skipped, because webhook deliveries can arrive out
+    of order after retries. Versions come from :func:`event_version`;
+    cat versions live in the :class:`CatMirror`. Events without a version
+    never advance one: cats are dropped from the mirror, and lost-pet
+    reports are applied and corrected by the index's next sync.
+
+    Example:
+        receiver = WebhookReceiver(secret)
+        sync = WebhookSync(client, receiver, portfolio=NFTPortfolio(client))
+        sync.subscribe('https://myapp.com/webhooks', secret)
+        cat = sync.cats.get(123)   # stays current without polling
+        receiver.run(port=8080)
+    """
+
+    def __init__(self, client, receiver: Optional[WebhookReceiver] = None, cats: Optional[CatMirror] = None,
+                 portfolio=None, lost_pets=None, predictor=None, worlds_ttl: float = DEFAULT_WORLDS_TTL,
+                 max_seen: int = DEFAULT_SEEN_EVENTS):
+        """
+        Initialize the integration
+
+        Args:
+            client: PurrrLoveClient
+            receiver: Receiver to register handlers on (events can also be
+                passed to :meth:`handle` directly)
+            cats: Cat mirror (one is created when omitted)
+            portfolio: Optional NFTPortfolio whose caches NFT events invalidate
+            lost_pets: Optional LostPetIndex that lost-pet events update
+            predictor: Optional PersonalityPredictor whose per-cat results cat events drop
+            worlds_ttl: Lifetime of cached world listings between metaverse events
+            max_seen: Event ids remembered for duplicate detection
+        """
+        self.client = client
+        self.cats = cats if cats is not None else CatMirror(client)
+        self.portfolio = portfolio
+        self.lost_pets = lost_pets
+        self.predictor = predictor
+        self.worlds_ttl = worlds_ttl
+        self.max_seen = max_seen
+        self.webhook_id: Optional[int] = None
+
+        self._seen: 'OrderedDict[str, None]' = OrderedDict()
+        self._versions: Dict[Tuple[str, Hashable], float] = {}
+        self._world_keys: Set[Tuple[str, Any]] = set()
+        self._lock = threading.Lock()
+
+        self.applied = 0
+        self.duplicates = 0
+        self.out_of_order = 0
+        self.ignored = 0
+
+        if receiver is not None:
+            for pattern in ('cat.*', 'blockchain.*', 'nft.*', 'lost_pet.*', 'metaverse.*'):
+                receiver.on(pattern, self.handle)
+
+    def subscribe(self, url: str, secret: str, events: Iterable[str] = SYNC_EVENTS) -> Dict[str, Any]:
+        """
+        Create the webhook subscription that feeds this integration
+
+        Args:
+            url: Public URL the receiver is mounted at
+            secret: Webhook secret (the receiver's secret)
+            events: Event types to subscribe to
+
+        Returns:
+            Created webhook data
+        """
+        result = self.client.create_webhook({'url': url, 'events': list(events), 'secret': secret})
+        self.webhook_id = result.get('webhook_id', result.get('id'))
+        return result
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Applied, duplicate, out-of-order and ignored event counters"""
+        with self._lock:
+            return {
+                'applied': self.applied,
+                'duplicates': self.duplicates,
+                'out_of_order': self.out_of_order + self.cats.stale,
+                'ignored': self.ignored,
+                'tracked_entities': len(self._versions),
+            }
+
+    # Event handling
+
+    def handle(self, event: WebhookEvent) -> bool:
+        """
+        Apply one event
+
+        Args:
+            event: Verified webhook event
+
+        Returns:
+            True if any local state changed
+        """
+        with self._lock:
+            if event.event_id in self._seen:
+                self.duplicates += 1
+                return False
+            self._seen[event.event_id] = None
+            while len(self._seen) > self.max_seen:
+                self._seen.popitem(last=False)
+
+        data = event.data if isinstance(event.data, dict) else {}
+        family = event.event_type.split('.', 1)[0]
+        if family == 'cat':
+            changed = self._handle_cat(event, data)
+        elif family in ('blockchain', 'nft'):
+            changed = self._handle_nft(event, data)
+        elif family == 'lost_pet':
+            changed = self._handle_lost_pet(event, data)
+        elif family == 'metaverse':
+            changed = self._handle_metaverse(data)
+        else:
+            changed = False
+
+        with self._lock:
+            if changed:
+                self.applied += 1
+            else:
+                self.ignored += 1
+        return changed
+
+    def _advance(self, kind: str, entity_id: Hashable, version: Optional[float]) -> bool:
+        """Record an entity's latest event version; False if the event is older"""
+        if version is None:
+            return True
+        key = (kind, entity_id)
+        with self._lock:
+            if version < self._versions.get(key, float('-inf')):
+                self.out_of_order += 1
+                return False
+            self._versions[key] = version
+            return True
+
+    def _handle_cat(self, event: WebhookEvent, data: Dict[str, Any]) -> bool:
+        record = data.get('cat') if isinstance(data.get('cat'), dict) else data
+        cat_id = record.get('id', data.get('cat_id'))
+        if cat_id is None:
+            return False
+        version = event_version(event, record)
+        if self.cats.is_stale(cat_id, version):
+            with self._lock:
+                self.out_of_order += 1
+            return False
+
+        if self.predictor is not None:
+            self.predictor.invalidate_cat(cat_id)
+        if event.event_type == 'cat.deleted':
+            return self.cats.remove(cat_id, version)
+        fields = {key: value for key, value in record.items() if key != 'cat_id'}
+        # Partial data for a cat not mirrored yet is skipped; its first lookup fetches it
+        return self.cats.apply(cat_id, fields, version)
+
+    def _handle_nft(self, event: WebhookEvent, data: Dict[str, Any]) -> bool:
+        if self.portfolio is None:
+            return False
+        nft_id = data.get('nft_id')
+        if nft_id is not None and not self._advance('nft', nft_id, event_version(event, data)):
+            return False
+        self.portfolio.invalidate(data.get('network'))
+        if nft_id is not None:
+            self.portfolio.invalidate_verification(nft_id)
+        return True
+
+    def _handle_lost_pet(self, event: WebhookEvent, data: Dict[str, Any]) -> bool:
+        if self.lost_pets is None:
+            return False
+        record = data.get('report') if isinstance(data.get('report'), dict) else data
+        report_id = record.get('id', data.get('report_id'))
+        if report_id is None or not self._advance('lost_pet', report_id, event_version(event, record)):
+            return False
+
+        if event.event_type == 'lost_pet.found':
+            return self.lost_pets.discard(report_id)
+        current = self.lost_pets.get(report_id)
+        report = dict(current or {}, **record)
+        report['id'] = report_id
+        if current is None and 'latitude' not in report:
+            # A sighting or partial update of a report outside the index
+            return False
+        return self.lost_pets.apply(report) or current is not None
+
+    def _handle_metaverse(self, data: Dict[str, Any]) -> bool:
+        with self._lock:
+            keys, self._world_keys = self._world_keys, set()
+        for key in keys:
+            self.client.cache.delete(key)
+        return bool(keys)
+
+    # Cached reads
+
+    def worlds(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        List metaverse worlds, cached until a metaverse event arrives
+
+        Args:
+            filters: Optional filters for world listing
+
+        Returns:
+            List of available worlds
+        """
+        key = (ROUTES['metaverse.worlds'].label, tuple(sorted((filters or {}).items())))
+        with self._lock:
+            self._world_keys.add(key)
+        return self.client.cache.get_or_set(key, lambda: self.client.list_metaverse_worlds(filters),
+                                            ttl=self.worlds_ttl)
@@ -3,10 +3,116 @@
 Data models for the Purrr.love API
 """
 
-from typing import Dict, List, Optional, Any, Union
+import marshal
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from operator import attrgetter
+
+
+def _clone(value: Any) -> Any:
+    """Copy nested dicts and lists so in-place edits show up as changes"""
+    try:
+        # A C-level deep copy for plain JSON-like data
+        return marshal.loads(marshal.dumps(value))
+    except ValueError:
+        pass
+    if isinstance(value, dict):
+        return {key: _clone(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone(item) for item in value]
+    return value
+
+
+def _wire_value(value: Any) -> Any:
+    """Field value in its API form"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class _Dirty:
+    """Snapshot placeholder that compares unequal to every value"""
+
+    def __eq__(self, other: Any) -> bool:
+        return False
+
+    def __ne__(self, other: Any) -> bool:
+        return True
+
+    __hash__ = None
+
+
+_DIRTY = _Dirty()
+
+_FIELD_ACCESS: Dict[type, Tuple[Tuple[str, ...], attrgetter]] = {}
+
+
+def _field_access(model: Any) -> Tuple[Tuple[str, ...], attrgetter]:
+    """Field names of a model class and a getter returning all their values"""
+    access = _FIELD_ACCESS.get(type(model))
+    if access is None:
+        names = tuple(f.name for f in fields(model))
+        access = _FIELD_ACCESS[type(model)] = (names, attrgetter(*names))
+    return access
+
+
+class ChangeTracking:
+    """
+    Dirty-field tracking for the dataclass models
+
+    ``from_dict`` snapshots the fields as loaded; ``dirty_fields`` and
+    ``changes`` compare against that snapshot, so edits to nested dicts
+    and lists are caught as well as reassignments, and setting a field
+    back to its loaded value makes it clean again. A model built directly
+    rather than loaded has no snapshot, and every field that is set
+    counts as dirty.
+    """
+
+    def mark_clean(self) -> None:
+        """Take the current field values as the loaded state"""
+        _, getter = _field_access(self)
+        self.__dict__['_snapshot'] = [_clone(value) if type(value) in (dict, list) else value
+                                      for value in getter(self)]
+
+    def mark_dirty(self, *names: str) -> None:
+        """
+        Force fields to count as changed
+
+        Args:
+            *names: Field names
+        """
+        snapshot = self.__dict__.get('_snapshot')
+        if snapshot is not None:
+            field_names, _ = _field_access(self)
+            for name in names:
+                snapshot[field_names.index(name)] = _DIRTY
+
+    @property
+    def dirty_fields(self) -> List[str]:
+        """Names of the fields changed since load, in declaration order"""
+        names, getter = _field_access(self)
+        snapshot = self.__dict__.get('_snapshot')
+        if snapshot is None:
+            return [name for name, value in zip(names, getter(self)) if value is not None]
+        return [name for name, value, loaded in zip(names, getter(self), snapshot) if value != loaded]
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether any field changed since load"""
+        return bool(self.dirty_fields)
+
+    def changes(self) -> Dict[str, Any]:
+        """
+        Changed fields in API form (enum values, ISO timestamps)
+
+        Returns:
+            Field name to new value, including fields cleared to None
+        """
+        return {name: _wire_value(getattr(self, name)) for name in self.dirty_fields}
 
 
 class PersonalityType(Enum):
@@ -72,7 +178,7 @@ class CareType(Enum):
 
 
 @dataclass
-class Cat:
+class Cat(ChangeTracking):
     """Cat model"""
     id: int
     name: str
@@ -113,7 +219,9 @@ class Cat:
         if data.get('updated_at'):
             data['updated_at'] = datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
         
-        return cls(**data)
+        instance = cls(**data)
+        instance.mark_clean()
+        return instance
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert Cat instance to dictionary"""
@@ -152,10 +260,22 @@ class Cat:
             data['multiplayer_status'] = self.multiplayer_status
         
         return data
+    
+    def save(self, client) -> 'Cat':
+        """
+        Send the fields changed since load with ``client.update_cat``
+        
+        Args:
+            client: PurrrLoveClient
+            
+        Returns:
+            Updated Cat from the server, or this Cat when nothing changed
+        """
+        return client.update_cat(self)
 
 
 @dataclass
-class User:
+class User(ChangeTracking):
     """User model"""
     id: int
     username: str
@@ -178,7 +298,9 @@ class User:
         if data.get('updated_at'):
             data['updated_at'] = datetime.fromisoformat(data['updated_at'].replace('Z', '+00:00'))
         
-        return cls(**data)
+        instance = cls(**data)
+        instance.mark_clean()
+        return instance
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert User instance to dictionary"""
@@ -205,7 +327,7 @@ class User:
 
 
 @dataclass
-class ApiKey:
+class ApiKey(ChangeTracking):
     """API Key model"""
     id: int
     name: str
@@ -227,7 +349,9 @@ class ApiKey:
         if data.get('created_at'):
             data['created_at'] = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
         
-        return cls(**data)
+        instance = cls(**data)
+        instance.mark_clean()
+        return instance
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert ApiKey instance to dictionary"""
@@ -251,7 +375,7 @@ class ApiKey:
 
 
 @dataclass
-class TradingOffer:
+class TradingOffer(ChangeTracking):
     """Trading Offer model"""
     id: int
     seller_id: int
@@ -280,7 +404,9 @@ class TradingOffer:
         if data.get('completed_at'):
             data['completed_at'] = datetime.fromisoformat(data['completed_at'].replace('Z', '+00:00'))
         
-        return cls(**data)
+        instance = cls(**data)
+        instance.mark_clean()
+        return instance
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert TradingOffer instance to dictionary"""
@@ -312,7 +438,7 @@ class TradingOffer:
 
 
 @dataclass
-class CatShow:
+class CatShow(ChangeTracking):
     """Cat Show model"""
     id: int
     name: str
@@ -345,7 +471,9 @@ class CatShow:
         if data.get('created_at'):
             data['created_at'] = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
         
-        return cls(**data)
+        instance = cls(**data)
+        instance.mark_clean()
+        return instance
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert CatShow instance to dictionary"""
@@ -378,7 +506,7 @@ class CatShow:
 
 
 @dataclass
-class VRInteraction:
+class VRInteraction(ChangeTracking):
     """VR Interaction model"""
     session_id: str
     cat_id: int
@@ -395,7 +523,9 @@ class VRInteraction:
         if data.get('timestamp'):
             data['timestamp'] = datetime.fromisoformat(data['timestamp'].replace('Z', '+00:00'))
         
-        return cls(**data)
+        instance = cls(**data)
+        instance.mark_clean()
+        return instance
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert VRInteraction instance to dictionary"""
@@ -415,7 +545,7 @@ class VRInteraction:
 
 
 @dataclass
-class HealthDevice:
+class HealthDevice(ChangeTracking):
     """Health Device model"""
     id: int
     cat_id: int
@@ -435,7 +565,9 @@ class HealthDevice:
         if data.get('created_at'):
             data['created_at'] = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
         
-        return cls(**data)
+        instance = cls(**data)
+        instance.mark_clean()
+        return instance
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert HealthDevice instance to dictionary"""
@@ -457,7 +589,7 @@ class HealthDevice:
 
 
 @dataclass
-class MultiplayerSession:
+class MultiplayerSession(ChangeTracking):
     """Multiplayer Session model"""
     session_id: str
     room_type: str
@@ -477,7 +609,9 @@ class MultiplayerSession:
         if data.get('created_at'):
             data['created_at'] = datetime.fromisoformat(data['created_at'].replace('Z', '+00:00'))
         
-        return cls(**data)
+        instance = cls(**data)
+        instance.mark_clean()
+        return instance
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert MultiplayerSession instance to dictionary"""
@@ -0,0 +1,456 @@
+"""
+🐱 Purrr.love Python SDK - NFT Helpers
+Pipelined batch minting and cached multi-network collection views
+"""
+
+import heapq
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from .exceptions import PurrrLoveError
+from .routes import ROUTES
+
+NETWORKS = ('ethereum', 'polygon', 'bsc', 'solana')
+
+# Seconds a cached per-network collection stays fresh; faster chains change sooner
+DEFAULT_COLLECTION_TTLS = {
+    'ethereum': 120.0,
+    'polygon': 30.0,
+    'bsc': 30.0,
+    'solana': 15.0,
+}
+DEFAULT_VERIFICATION_TTL = 300.0
+
+CONFIRMED_STATUSES = {'confirmed', 'minted', 'verified', 'completed', 'success'}
+FAILED_STATUSES = {'failed', 'rejected', 'reverted', 'error'}
+
+
+def default_is_confirmed(data: Dict[str, Any]) -> Optional[bool]:
+    """
+    Interpret a mint or verification response
+
+    Args:
+        data: Response data from ``mint_cat_nft`` or ``verify_nft_ownership``
+
+    Returns:
+        True when confirmed, False when the mint failed, None while pending
+    """
+    for key in ('verified', 'is_owner', 'confirmed'):
+        if data.get(key) is True:
+            return True
+    status = str(data.get('status') or '').lower()
+    if status in CONFIRMED_STATUSES:
+        return True
+    if status in FAILED_STATUSES:
+        return False
+    return None
+
+
+@dataclass
+class MintStatus:
+    """Progress of one cat's NFT mint"""
+    cat_id: int
+    network: str
+    state: str = 'pending'
+    nft_id: Optional[int] = None
+    transaction_hash: Optional[str] = None
+    polls: int = 0
+    error: Optional[str] = None
+    result: Dict[str, Any] = field(default_factory=dict)
+    submitted_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the mint reached a terminal state"""
+        return self.state in ('confirmed', 'failed', 'timeout')
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        """Seconds from submission to completion"""
+        if self.submitted_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.submitted_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert MintStatus instance to dictionary"""
+        return {
+            'cat_id': self.cat_id,
+            'network': self.network,
+            'state': self.state,
+            'nft_id': self.nft_id,
+            'transaction_hash': self.transaction_hash,
+            'polls': self.polls,
+            'error': self.error,
+            'elapsed': self.elapsed,
+        }
+
+
+class BatchMinter:
+    """
+    Mint NFTs for many cats concurrently and track their confirmations
+
+    All mints are submitted up front through a bounded thread pool. Each
+    submitted mint is then polled with ``verify_nft_ownership`` on an
+    exponential-backoff schedule, with the polls themselves also running
+    on the pool, so total wall-clock time is bounded by the slowest
+    confirmation rather than the sum of all of them.
+
+    Example:
+        minter = BatchMinter(client)
+        for status in minter.mint(litter_cat_ids, network='polygon'):
+            print(status.cat_id, status.state)
+        print(minter.summary())
+    """
+
+    def __init__(self, client, max_workers: int = 8, poll_initial: float = 1.0,
+                 poll_max: float = 30.0, poll_multiplier: float = 2.0, timeout: float = 600.0,
+                 is_confirmed: Callable[[Dict[str, Any]], Optional[bool]] = default_is_confirmed):
+        """
+        Initialize the batch minter
+
+        Args:
+            client: PurrrLoveClient used for minting and verification
+            max_workers: Concurrent API calls
+            poll_initial: Seconds before the first verification poll
+            poll_max: Maximum seconds between polls
+            poll_multiplier: Backoff multiplier between polls
+            timeout: Seconds after submission before a mint is marked timed out
+            is_confirmed: Interprets responses as confirmed/failed/pending
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.poll_initial = poll_initial
+        self.poll_max = poll_max
+        self.poll_multiplier = poll_multiplier
+        self.timeout = timeout
+        self.is_confirmed = is_confirmed
+        self.statuses: List[MintStatus] = []
+
+    def mint(self, cat_ids: Iterable[int], network: str = 'ethereum',
+             metadata: Union[None, Dict[str, Any], Callable[[int], Dict[str, Any]]] = None) -> Iterator[MintStatus]:
+        """
+        Mint NFTs for many cats on one network
+
+        Args:
+            cat_ids: IDs of the cats to mint
+            network: Blockchain network (ethereum, polygon, bsc, solana)
+            metadata: Shared metadata, or a callable returning metadata per cat
+
+        Yields:
+            A MintStatus snapshot every time a mint changes state
+        """
+        return self.mint_many([(cat_id, network) for cat_id in cat_ids], metadata)
+
+    def mint_many(self, jobs: Iterable[Tuple[int, str]],
+                  metadata: Union[None, Dict[str, Any], Callable[[int], Dict[str, Any]]] = None) -> Iterator[MintStatus]:
+        """
+        Mint NFTs for (cat_id, network) pairs across several networks
+
+        Args:
+            jobs: (cat_id, network) pairs
+            metadata: Shared metadata, or a callable returning metadata per cat
+
+        Yields:
+            A MintStatus snapshot every time a mint changes state
+        """
+        statuses = [MintStatus(cat_id=cat_id, network=network) for cat_id, network in jobs]
+        self.statuses = statuses
+        if not statuses:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running: Dict[Future, Tuple[MintStatus, float]] = {}
+            schedule: List[Tuple[float, int, MintStatus, float]] = []
+            sequence = 0
+
+            for status in statuses:
+                data = metadata(status.cat_id) if callable(metadata) else metadata
+                future = executor.submit(self.client.mint_cat_nft, status.cat_id, status.network, data)
+                status.submitted_at = time.monotonic()
+                running[future] = (status, self.poll_initial)
+
+            remaining = len(statuses)
+            while remaining:
+                now = time.monotonic()
+
+                # Launch verification polls that are due
+                while schedule and schedule[0][0] <= now:
+                    _, _, status, delay = heapq.heappop(schedule)
+                    if now - status.submitted_at >= self.timeout:
+                        self._finish(status, 'timeout', error=f"not confirmed after {self.timeout:.0f}s")
+                        remaining -= 1
+                        yield replace(status)
+                        continue
+                    status.polls += 1
+                    future = executor.submit(self.client.verify_nft_ownership, status.nft_id)
+                    running[future] = (status, delay)
+
+                wait_for = (schedule[0][0] - now) if schedule else None
+                if not running:
+                    time.sleep(max(0.0, wait_for or 0.0))
+                    continue
+
+                done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+                for future in done:
+                    status, delay = running.pop(future)
+                    changed, pending = self._handle(status, future)
+                    if pending:
+                        sequence += 1
+                        due = min(time.monotonic() + delay, status.submitted_at + self.timeout)
+                        heapq.heappush(schedule, (due, sequence, status,
+                                                  min(self.poll_max, delay * self.poll_multiplier)))
+                    elif status.done:
+                        remaining -= 1
+                    if changed:
+                        yield replace(status)
+
+    def _handle(self, status: MintStatus, future: Future) -> Tuple[bool, bool]:
+        """Apply a finished API call; returns (state changed, still pending)"""
+        try:
+            data = future.result() or {}
+        except PurrrLoveError as e:
+            if status.state == 'submitted':
+                # A failed poll is not a failed mint; try again later
+                return False, True
+            self._finish(status, 'failed', error=str(e))
+            return True, False
+
+        status.result = data
+        first_response = status.state == 'pending'
+        if first_response:
+            status.state = 'submitted'
+            status.nft_id = data.get('nft_id', status.nft_id)
+            status.transaction_hash = data.get('transaction_hash', status.transaction_hash)
+
+        outcome = self.is_confirmed(data)
+        if outcome is True:
+            self._finish(status, 'confirmed')
+            return True, False
+        if outcome is False:
+            self._finish(status, 'failed', error=data.get('message') or data.get('error') or 'mint failed')
+            return True, False
+        if status.nft_id is None:
+            self._finish(status, 'failed', error='mint response did not include an nft_id to verify')
+            return True, False
+        return first_response, True
+
+    @staticmethod
+    def _finish(status: MintStatus, state: str, error: Optional[str] = None) -> None:
+        status.state = state
+        status.error = error
+        status.finished_at = time.monotonic()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the most recent batch
+
+        Returns:
+            Counts per state and the slowest confirmation time
+        """
+        counts: Dict[str, int] = {}
+        for status in self.statuses:
+            counts[status.state] = counts.get(status.state, 0) + 1
+        elapsed = [s.elapsed for s in self.statuses if s.elapsed is not None]
+        return {
+            'total': len(self.statuses),
+            'states': counts,
+            'slowest_seconds': max(elapsed) if elapsed else None,
+        }
+
+
+def _collection_items(data: Any) -> List[Dict[str, Any]]:
+    """Normalize a ``get_nft_collection`` payload to a list of NFTs"""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in ('nfts', 'collection', 'results'):
+            if isinstance(data.get(key), list):
+                return data[key]
+    return []
+
+
+class NFTPortfolio:
+    """
+    Aggregated, cached view of a user's NFTs across blockchain networks
+
+    Collections for every network are fetched concurrently, merged, and
+    deduplicated by ``nft_id``. Each network's result is cached on its own
+    TTL, so a refresh only refetches the networks whose entries expired.
+    Ownership verifications are cached too, so repeated checks for the
+    same NFT inside ``verification_ttl`` cost no requests.
+
+    Entries live in ``client.cache``, so portfolios for pooled tenants stay
+    isolated and share the pool's bounded store.
+
+    Example:
+        portfolio = NFTPortfolio(client)
+        nfts = portfolio.collection()
+        ownership = portfolio.verify(nfts[0]['nft_id'])
+    """
+
+    def __init__(self, client, networks: Iterable[str] = NETWORKS, ttls: Optional[Dict[str, float]] = None,
+                 verification_ttl: float = DEFAULT_VERIFICATION_TTL, max_workers: int = 4):
+        """
+        Initialize the portfolio
+
+        Args:
+            client: PurrrLoveClient
+            networks: Networks included in the aggregated collection
+            ttls: Per-network cache lifetimes in seconds
+            verification_ttl: Lifetime of cached ownership verifications
+            max_workers: Concurrent collection requests
+        """
+        self.client = client
+        self.networks = tuple(networks)
+        self.ttls = dict(DEFAULT_COLLECTION_TTLS, **(ttls or {}))
+        self.verification_ttl = verification_ttl
+        self.max_workers = max_workers
+        self._verified: Set[int] = set()
+
+    @staticmethod
+    def _collection_key(network: str) -> Tuple[str, str]:
+        return ROUTES['blockchain.collection'].label, network
+
+    @staticmethod
+    def _verification_key(nft_id: int) -> Tuple[str, int]:
+        return ROUTES['blockchain.verify_nft'].label, nft_id
+
+    def network_collection(self, network: str, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the NFTs on one network
+
+        Args:
+            network: Blockchain network
+            refresh: Bypass the cache
+
+        Returns:
+            NFTs on the network
+        """
+        key = self._collection_key(network)
+        if not refresh:
+            cached = self.client.cache.get(key)
+            if cached is not None:
+                return cached
+        items = _collection_items(self.client.get_nft_collection(network))
+        self.client.cache.set(key, items, ttl=self.ttls.get(network))
+        return items
+
+    def collection(self, networks: Optional[Iterable[str]] = None, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get the merged collection across networks
+
+        Only networks without a fresh cache entry are fetched, and those
+        are fetched concurrently.
+
+        Args:
+            networks: Networks to include (defaults to the portfolio networks)
+            refresh: Bypass the cache for every network
+
+        Returns:
+            NFTs deduplicated by ``nft_id``, newest first
+        """
+        networks = tuple(networks) if networks is not None else self.networks
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        missing = []
+        for network in networks:
+            cached = None if refresh else self.client.cache.get(self._collection_key(network))
+            if cached is None:
+                missing.append(network)
+            else:
+                results[network] = cached
+
+        if len(missing) == 1:
+            results[missing[0]] = self.network_collection(missing[0], refresh=True)
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                futures = {network: executor.submit(self.network_collection, network, True)
+                           for network in missing}
+                for network, future in futures.items():
+                    results[network] = future.result()
+
+        merged: Dict[Any, Dict[str, Any]] = {}
+        for network in networks:
+            for nft in results[network]:
+                key = nft.get('nft_id', nft.get('id'))
+                if key is None:
+                    key = (nft.get('network', network), nft.get('contract_address'), nft.get('token_id'))
+                merged.setdefault(key, nft)
+        return sorted(merged.values(), key=lambda nft: str(nft.get('created_at') or ''), reverse=True)
+
+    def verify(self, nft_id: int, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Verify ownership of an NFT, reusing a recent verification
+
+        Args:
+            nft_id: ID of the NFT
+            refresh: Bypass the cache
+
+        Returns:
+            Ownership verification data
+        """
+        key = self._verification_key(nft_id)
+        if not refresh:
+            cached = self.client.cache.get(key)
+            if cached is not None:
+                return cached
+        result = self.client.verify_nft_ownership(nft_id)
+        self.client.cache.set(key, result, ttl=self.verification_ttl)
+        self._verified.add(nft_id)
+        return result
+
+    def verify_many(self, nft_ids: Iterable[int], refresh: bool = False) -> Dict[int, Dict[str, Any]]:
+        """
+        Verify ownership of several NFTs concurrently
+
+        Args:
+            nft_ids: IDs of the NFTs
+            refresh: Bypass the cache
+
+        Returns:
+            Verification data keyed by NFT id
+        """
+        nft_ids = list(dict.fromkeys(nft_ids))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {nft_id: executor.submit(self.verify, nft_id, refresh) for nft_id in nft_ids}
+            return {nft_id: future.result() for nft_id, future in futures.items()}
+
+    def transfer(self, nft_id: int, to_user_id: int, network: str = 'ethereum') -> Dict[str, Any]:
+        """
+        Transfer an NFT and drop the cache entries it makes stale
+
+        Args:
+            nft_id: ID of the NFT to transfer
+            to_user_id: ID of the user to transfer to
+            network: Blockchain network
+
+        Returns:
+            Transfer transaction data
+        """
+        result = self.client.transfer_nft(nft_id, to_user_id, network)
+        self.invalidate(network)
+        self.invalidate_verification(nft_id)
+        return result
+
+    def invalidate(self, network: Optional[str] = None) -> None:
+        """
+        Drop cached collections
+
+        Args:
+            network: Only drop this network (None drops every network)
+        """
+        for name in (network,) if network else self.networks:
+            self.client.cache.delete(self._collection_key(name))
+
+    def invalidate_verification(self, nft_id: Optional[int] = None) -> None:
+        """
+        Drop cached ownership verifications
+
+        Args:
+            nft_id: Only drop this NFT (None drops every verification)
+        """
+        for key in (nft_id,) if nft_id is not None else list(self._verified):
+            self.client.cache.delete(self._verification_key(key))
+            self._verified.discard(key)
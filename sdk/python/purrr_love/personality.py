@@ -0,0 +1,223 @@
+"""
+🐱 Purrr.love Python SDK - Batch Personality Prediction
+Chunked, parallel personality predictions memoized per model version
+"""
+
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .exceptions import PurrrLoveError
+from .routes import ROUTES
+
+DEFAULT_PREDICTION_TTL = 86400.0
+DEFAULT_VERSION_TTL = 60.0
+
+
+def model_version(training_status: Dict[str, Any]) -> str:
+    """
+    Derive a model version from ``get_ml_training_status`` data
+
+    An explicit ``model_version``/``version`` wins. Otherwise the version
+    is a fingerprint of the ``models`` entries, so any retrain that changes
+    them yields a new version.
+
+    Args:
+        training_status: Training status data
+
+    Returns:
+        Model version string
+    """
+    for key in ('model_version', 'version'):
+        if training_status.get(key) not in (None, ''):
+            return str(training_status[key])
+    models = training_status.get('models') or []
+    digest = hashlib.sha1(json.dumps(models, sort_keys=True, default=str).encode('utf-8'))
+    return 'models-' + digest.hexdigest()[:16]
+
+
+class PersonalityPredictor:
+    """
+    Batch personality predictions with a client-side result cache
+
+    Predictions are memoized in ``client.cache`` under the cat id and the
+    current model version. The version is read from
+    ``get_ml_training_status`` at most once every ``version_ttl`` seconds;
+    when a retrain changes it, every earlier prediction is ignored and
+    eventually evicted, so an unchanged prediction is never recomputed
+    and a stale one is never served.
+
+    Cache misses are split into chunks that run concurrently on a thread
+    pool.
+
+    Example:
+        predictor = PersonalityPredictor(client)
+        predictions = predictor.predict_many(shelter_cat_ids)
+        failed = predictor.errors
+    """
+
+    def __init__(self, client, chunk_size: int = 100, max_workers: int = 8,
+                 cache_ttl: float = DEFAULT_PREDICTION_TTL, version_ttl: float = DEFAULT_VERSION_TTL,
+                 include_confidence: bool = True):
+        """
+        Initialize the predictor
+
+        Args:
+            client: PurrrLoveClient
+            chunk_size: Cats handled by one worker task
+            max_workers: Concurrent prediction requests
+            cache_ttl: Lifetime of a cached prediction in seconds
+            version_ttl: Seconds between model version checks
+            include_confidence: Whether predictions include confidence scores
+        """
+        self.client = client
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.cache_ttl = cache_ttl
+        self.version_ttl = version_ttl
+        self.include_confidence = include_confidence
+        self.errors: Dict[int, PurrrLoveError] = {}
+        self._version: Optional[str] = None
+        self._version_checked = 0.0
+        self._lock = threading.Lock()
+
+    def model_version(self, refresh: bool = False) -> str:
+        """
+        Get the current model version
+
+        Args:
+            refresh: Ask the server even if the last check is recent
+
+        Returns:
+            Model version string
+        """
+        with self._lock:
+            if not refresh and self._version is not None \
+                    and time.monotonic() - self._version_checked < self.version_ttl:
+                return self._version
+        version = model_version(self.client.get_ml_training_status())
+        with self._lock:
+            self._version = version
+            self._version_checked = time.monotonic()
+        return version
+
+    def invalidate(self) -> None:
+        """Forget the model version so the next call re-checks it"""
+        with self._lock:
+            self._version = None
+
+    def invalidate_cat(self, cat_id: int) -> None:
+        """
+        Drop the cached prediction and insights for one cat
+
+        Args:
+            cat_id: ID of the cat
+        """
+        with self._lock:
+            version = self._version
+        if version is None:
+            return
+        for route_name in ('ml_personality.predict', 'ml_personality.insights'):
+            self.client.cache.delete(self._key(route_name, version, cat_id))
+
+    def predict(self, cat_id: int) -> Dict[str, Any]:
+        """
+        Predict one cat's personality, using the cache when possible
+
+        Args:
+            cat_id: ID of the cat
+
+        Returns:
+            Personality prediction data
+        """
+        return self._cached_call('ml_personality.predict', self._fetch_prediction, cat_id)
+
+    def insights(self, cat_id: int) -> Dict[str, Any]:
+        """
+        Get one cat's personality insights, using the cache when possible
+
+        Args:
+            cat_id: ID of the cat
+
+        Returns:
+            Personality insights data
+        """
+        return self._cached_call('ml_personality.insights', self.client.get_personality_insights, cat_id)
+
+    def predict_many(self, cat_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Predict personalities for many cats
+
+        Cats whose request failed are left out of the result and recorded
+        in ``errors``.
+
+        Args:
+            cat_ids: IDs of the cats
+
+        Returns:
+            Predictions keyed by cat id
+        """
+        return self._batch('ml_personality.predict', self._fetch_prediction, cat_ids)
+
+    def insights_many(self, cat_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get personality insights for many cats
+
+        Cats whose request failed are left out of the result and recorded
+        in ``errors``.
+
+        Args:
+            cat_ids: IDs of the cats
+
+        Returns:
+            Insights keyed by cat id
+        """
+        return self._batch('ml_personality.insights', self.client.get_personality_insights, cat_ids)
+
+    def _fetch_prediction(self, cat_id: int) -> Dict[str, Any]:
+        return self.client.predict_cat_personality(cat_id, self.include_confidence)
+
+    def _key(self, route_name: str, version: str, cat_id: int):
+        return ROUTES[route_name].label, version, self.include_confidence, cat_id
+
+    def _cached_call(self, route_name: str, fetch: Callable[[int], Dict[str, Any]], cat_id: int) -> Dict[str, Any]:
+        key = self._key(route_name, self.model_version(), cat_id)
+        return self.client.cache.get_or_set(key, lambda: fetch(cat_id), ttl=self.cache_ttl)
+
+    def _batch(self, route_name: str, fetch: Callable[[int], Dict[str, Any]],
+               cat_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        version = self.model_version()
+        results: Dict[int, Dict[str, Any]] = {}
+        missing: List[int] = []
+        for cat_id in dict.fromkeys(cat_ids):
+            cached = self.client.cache.get(self._key(route_name, version, cat_id))
+            if cached is None:
+                missing.append(cat_id)
+            else:
+                results[cat_id] = cached
+
+        errors: Dict[int, PurrrLoveError] = {}
+
+        def run_chunk(chunk: List[int]) -> None:
+            for cat_id in chunk:
+                try:
+                    value = fetch(cat_id)
+                except PurrrLoveError as e:
+                    errors[cat_id] = e
+                    continue
+                self.client.cache.set(self._key(route_name, version, cat_id), value, ttl=self.cache_ttl)
+                results[cat_id] = value
+
+        if missing:
+            # Several small chunks per worker keep the pool busy when latencies vary
+            chunk_size = max(1, min(self.chunk_size, -(-len(missing) // (self.max_workers * 4))))
+            chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                for future in [executor.submit(run_chunk, chunk) for chunk in chunks]:
+                    future.result()
+
+        self.errors = errors
+        return results
@@ -0,0 +1,410 @@
+"""
+🐱 Purrr.love Python SDK - Offline Personality Model
+Local, vectorized personality scoring from an exported linear model
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import urljoin, urlsplit
+
+import requests
+
+from .exceptions import ConfigurationError, PurrrLoveError, ValidationError
+from .personality import model_version
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+MODEL_FORMAT = 1
+_UNSAFE_FILENAME = re.compile(r'[^A-Za-z0-9_.-]')
+
+PERSONALITY_DIMENSIONS = ('openness', 'conscientiousness', 'extraversion', 'agreeableness', 'neuroticism')
+BEHAVIOR_TYPES = ('play', 'social', 'explore', 'rest', 'grooming', 'hunting', 'vocalization', 'hiding')
+COAT_PATTERNS = ('tabby', 'solid', 'calico', 'tortoiseshell')
+BREEDS = ('siamese', 'persian', 'mainecoon', 'british_shorthair')
+
+FEATURE_NAMES = (
+    ['heritage_score', 'observation_volume']
+    + [f'coat_pattern:{name}' for name in COAT_PATTERNS]
+    + [f'breed:{name}' for name in BREEDS]
+    + [f'behavior_share:{name}' for name in BEHAVIOR_TYPES]
+    + [f'behavior_intensity:{name}' for name in BEHAVIOR_TYPES]
+)
+
+# Observation count whose log maps to a volume feature of 1.0
+_VOLUME_SCALE = math.log1p(1000)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ConfigurationError(
+            "NumPy is required for offline personality scoring (pip install \"purrr-love-sdk[numpy]\")",
+            config_key='numpy'
+        )
+
+
+def _behavior_type(observation: Dict[str, Any]) -> str:
+    return str(observation.get('behavior_type') or observation.get('type') or '').casefold()
+
+
+def _intensity(observation: Dict[str, Any]) -> float:
+    value = observation.get('intensity_level', observation.get('intensity'))
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 5.0
+
+
+def encode_features(cats: Sequence[Dict[str, Any]]):
+    """
+    Build the feature matrix for a batch of cats
+
+    Each cat is a dictionary with the inputs the server uses: ``breed``,
+    ``coat_pattern`` and ``heritage_score`` (as sent to
+    ``update_genetic_data``) and ``observations``, a list of behavior
+    observations (as sent to ``record_behavior_observation``).
+
+    Args:
+        cats: Cat feature dictionaries
+
+    Returns:
+        float32 array of shape (len(cats), len(FEATURE_NAMES))
+    """
+    _require_numpy()
+    index = {name: i for i, name in enumerate(FEATURE_NAMES)}
+    share_offset = index[f'behavior_share:{BEHAVIOR_TYPES[0]}']
+    intensity_offset = index[f'behavior_intensity:{BEHAVIOR_TYPES[0]}']
+    behavior_index = {name: i for i, name in enumerate(BEHAVIOR_TYPES)}
+
+    features = np.zeros((len(cats), len(FEATURE_NAMES)), dtype=np.float32)
+    for row, cat in enumerate(cats):
+        heritage = cat.get('heritage_score')
+        features[row, index['heritage_score']] = 0.5 if heritage is None else float(heritage) / 100.0
+
+        coat = index.get(f"coat_pattern:{str(cat.get('coat_pattern') or '').casefold()}")
+        if coat is not None:
+            features[row, coat] = 1.0
+        breed = index.get(f"breed:{str(cat.get('breed') or '').casefold().replace(' ', '_')}")
+        if breed is not None:
+            features[row, breed] = 1.0
+
+        observations = cat.get('observations') or []
+        features[row, index['observation_volume']] = math.log1p(len(observations)) / _VOLUME_SCALE
+        if not observations:
+            continue
+        counts = np.zeros(len(BEHAVIOR_TYPES), dtype=np.float32)
+        intensity = np.zeros(len(BEHAVIOR_TYPES), dtype=np.float32)
+        for observation in observations:
+            column = behavior_index.get(_behavior_type(observation))
+            if column is not None:
+                counts[column] += 1
+                intensity[column] += _intensity(observation)
+        features[row, share_offset:share_offset + len(BEHAVIOR_TYPES)] = counts / len(observations)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            features[row, intensity_offset:intensity_offset + len(BEHAVIOR_TYPES)] = \
+                np.where(counts > 0, intensity / np.maximum(counts, 1) / 10.0, 0.0)
+    return features
+
+
+class OfflinePersonalityModel:
+    """
+    Linear personality model scored locally with NumPy
+
+    The model is a float32 matrix of shape ``(n_features + 1, n_dimensions)``
+    whose last row is the bias, stored as a ``.npy`` file next to a JSON
+    manifest (version, feature names, dimensions). Weights are memory-mapped,
+    so loading is instant and processes scoring from the same file share
+    its pages.
+
+    The manifest version is compared with ``model_version()`` of
+    ``get_ml_training_status``, so a retrain on the server marks the local
+    copy stale. Use :meth:`parity_check` to compare local scores with the
+    server's predictions before relying on a model.
+
+    Example:
+        model = OfflinePersonalityModel.download(client, '~/.cache/purrr-love/models')
+        scores = model.predict_many(cats)
+    """
+
+    def __init__(self, weights, version: str, features: Sequence[str] = FEATURE_NAMES,
+                 dimensions: Sequence[str] = PERSONALITY_DIMENSIONS):
+        """
+        Initialize the model
+
+        Args:
+            weights: Array of shape (len(features) + 1, len(dimensions))
+            version: Model version the weights were exported from
+            features: Feature names in weight-row order
+            dimensions: Personality dimensions in weight-column order
+
+        Raises:
+            ValidationError: If the weight shape does not match
+        """
+        _require_numpy()
+        self.features = list(features)
+        self.dimensions = list(dimensions)
+        if tuple(weights.shape) != (len(self.features) + 1, len(self.dimensions)):
+            raise ValidationError(
+                f"Weights have shape {tuple(weights.shape)}, expected "
+                f"{(len(self.features) + 1, len(self.dimensions))}",
+                field='weights'
+            )
+        self.weights = weights
+        self.version = version
+        if self.features != list(FEATURE_NAMES):
+            # Reorder local features to match an export built with another feature list
+            positions = {name: i for i, name in enumerate(FEATURE_NAMES)}
+            missing = [name for name in self.features if name not in positions]
+            if missing:
+                raise ValidationError(f"Unknown model features: {', '.join(missing)}", field='features')
+            self._columns = np.array([positions[name] for name in self.features])
+        else:
+            self._columns = None
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'OfflinePersonalityModel':
+        """
+        Load an exported model
+
+        Args:
+            path: Path of the ``.npy`` weights; the manifest is the same path with ``.json``
+            mmap: Memory-map the weights instead of reading them into memory
+
+        Returns:
+            OfflinePersonalityModel
+        """
+        _require_numpy()
+        path = os.path.expanduser(path)
+        with open(os.path.splitext(path)[0] + '.json', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format', MODEL_FORMAT) != MODEL_FORMAT:
+            raise ConfigurationError(f"Unsupported model format {manifest.get('format')}",
+                                     config_key='format')
+        weights = np.load(path, mmap_mode='r' if mmap else None)
+        return cls(weights, str(manifest['version']), manifest.get('features', FEATURE_NAMES),
+                   manifest.get('dimensions', PERSONALITY_DIMENSIONS))
+
+    def save(self, path: str) -> str:
+        """
+        Export the model as ``.npy`` weights plus a JSON manifest
+
+        Args:
+            path: Path of the ``.npy`` file to write
+
+        Returns:
+            Path of the weights file
+        """
+        path = os.path.expanduser(path)
+        np.save(path, np.asarray(self.weights, dtype=np.float32))
+        if not path.endswith('.npy'):
+            path += '.npy'
+        with open(os.path.splitext(path)[0] + '.json', 'w', encoding='utf-8') as f:
+            json.dump({'format': MODEL_FORMAT, 'version': self.version, 'features': self.features,
+                       'dimensions': self.dimensions}, f, indent=2)
+        return path
+
+    @classmethod
+    def download(cls, client, directory: str, url: Optional[str] = None) -> 'OfflinePersonalityModel':
+        """
+        Fetch the exported model for the current server model version
+
+        The manifest URL comes from ``url`` or from ``model_export_url`` in
+        the training status. The manifest's ``weights_url`` is resolved
+        relative to it and its optional ``sha256`` is verified. Files are
+        named after the version, so a model already on disk is reused.
+
+        Args:
+            client: PurrrLoveClient
+            directory: Directory the model files are stored in
+            url: Manifest URL overriding the training status
+
+        Returns:
+            OfflinePersonalityModel for the current version
+
+        Raises:
+            ConfigurationError: If no export URL is known
+            PurrrLoveError: If the download fails or is corrupt
+        """
+        _require_numpy()
+        status = client.get_ml_training_status()
+        version = model_version(status)
+        directory = os.path.expanduser(directory)
+        path = os.path.join(directory, _model_filename(version))
+        if os.path.dirname(os.path.realpath(path)) != os.path.realpath(directory):
+            raise PurrrLoveError(f"Model version {version!r} does not map to a file inside {directory}")
+        if os.path.exists(path) and os.path.exists(os.path.splitext(path)[0] + '.json'):
+            return cls.load(path)
+
+        url = url or status.get('model_export_url')
+        if not url:
+            raise ConfigurationError("No personality model export URL is available",
+                                     config_key='model_export_url')
+
+        manifest = json.loads(_fetch(client, url))
+        if str(manifest.get('version', version)) != version:
+            raise PurrrLoveError(f"Exported model version {manifest.get('version')} "
+                                 f"does not match server model version {version}")
+        weights = _fetch(client, urljoin(url, manifest.get('weights_url', 'weights.npy')))
+        if manifest.get('sha256') and hashlib.sha256(weights).hexdigest() != manifest['sha256']:
+            raise PurrrLoveError("Downloaded personality model failed its checksum")
+
+        os.makedirs(directory, exist_ok=True)
+        manifest = dict(manifest, version=version)
+        for target, content in ((path, weights),
+                                (os.path.splitext(path)[0] + '.json', json.dumps(manifest).encode('utf-8'))):
+            fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp, target)
+        return cls.load(path)
+
+    @classmethod
+    def fit(cls, cats: Sequence[Dict[str, Any]], personalities: Sequence[Dict[str, float]], version: str,
+            l2: float = 1e-3) -> 'OfflinePersonalityModel':
+        """
+        Fit a model to known personalities with ridge regression
+
+        Useful for distilling server predictions into a local model when no
+        export is published.
+
+        Args:
+            cats: Cat feature dictionaries (see :func:`encode_features`)
+            personalities: Target scores per dimension (0-100), one per cat
+            version: Model version the targets came from
+            l2: Ridge regularization strength
+
+        Returns:
+            Fitted OfflinePersonalityModel
+        """
+        _require_numpy()
+        x = np.hstack([encode_features(cats).astype(np.float64), np.ones((len(cats), 1))])
+        y = np.array([[float(p.get(d, 50.0)) for d in PERSONALITY_DIMENSIONS] for p in personalities])
+        penalty = l2 * np.eye(x.shape[1])
+        penalty[-1, -1] = 0.0
+        weights = np.linalg.solve(x.T @ x + penalty, x.T @ y)
+        return cls(weights.astype(np.float32), version)
+
+    def is_current(self, client) -> bool:
+        """
+        Check the model against the server's current model version
+
+        Args:
+            client: PurrrLoveClient
+
+        Returns:
+            True if the server has not been retrained since the export
+        """
+        return self.version == model_version(client.get_ml_training_status())
+
+    def score(self, features):
+        """
+        Score a prepared feature matrix
+
+        Args:
+            features: Array from :func:`encode_features`
+
+        Returns:
+            float32 array of shape (n_cats, n_dimensions), clipped to 0-100
+        """
+        if self._columns is not None:
+            features = features[:, self._columns]
+        scores = features @ self.weights[:-1] + self.weights[-1]
+        return np.clip(scores, 0.0, 100.0)
+
+    def predict_many(self, cats: Sequence[Dict[str, Any]]) -> List[Dict[str, float]]:
+        """
+        Score personalities for many cats
+
+        Args:
+            cats: Cat feature dictionaries (see :func:`encode_features`)
+
+        Returns:
+            One ``{dimension: score}`` dictionary per cat
+        """
+        scores = self.score(encode_features(cats))
+        return [dict(zip(self.dimensions, map(float, row))) for row in scores]
+
+    def predict(self, cat: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Score one cat's personality
+
+        Args:
+            cat: Cat feature dictionary (see :func:`encode_features`)
+
+        Returns:
+            Scores per personality dimension (0-100)
+        """
+        return self.predict_many([cat])[0]
+
+    def parity_check(self, client, cats: Dict[int, Dict[str, Any]], tolerance: float = 5.0) -> Dict[str, Any]:
+        """
+        Compare local scores with the server's predictions
+
+        Args:
+            client: PurrrLoveClient
+            cats: Cat feature dictionaries keyed by cat id
+            tolerance: Largest acceptable absolute difference per dimension
+
+        Returns:
+            ``ok``, the mean and max absolute error per dimension, and the
+            cat ids that exceeded the tolerance
+        """
+        cat_ids = list(cats)
+        local = self.score(encode_features([cats[cat_id] for cat_id in cat_ids]))
+        server = np.array([
+            [float(client.predict_cat_personality(cat_id, False).get('personality', {}).get(d, np.nan))
+             for d in self.dimensions]
+            for cat_id in cat_ids
+        ]).reshape(len(cat_ids), len(self.dimensions))
+        error = np.abs(local - server)
+        exceeded = np.nan_to_num(error, nan=np.inf) > tolerance
+
+        report = {
+            'ok': not exceeded.any(),
+            'samples': len(cat_ids),
+            'mean_abs_error': {},
+            'max_abs_error': {},
+            'mismatched_cat_ids': [cat_id for cat_id, row in zip(cat_ids, exceeded) if row.any()],
+        }
+        if cat_ids:
+            with np.errstate(invalid='ignore'):
+                report['mean_abs_error'] = dict(zip(self.dimensions, map(float, np.nanmean(error, axis=0))))
+                report['max_abs_error'] = dict(zip(self.dimensions, map(float, np.nanmax(error, axis=0))))
+        return report
+
+
+def _model_filename(version: str) -> str:
+    """Weights filename for a server model version, safe to join onto a directory"""
+    safe = _UNSAFE_FILENAME.sub('_', version)
+    if safe != version:
+        # Keep versions that sanitize alike (v2/2024, v2_2024) apart
+        safe += '-' + hashlib.sha256(version.encode('utf-8')).hexdigest()[:8]
+    return f"personality-{safe}.npy"
+
+
+def _fetch(client, url: str) -> bytes:
+    """GET an export file through the client's session"""
+    # Export URLs may point at a CDN or presigned storage; the API key only
+    # goes to the API's own origin
+    headers = {}
+    if client.api_key and _origin(url) == _origin(client._origin):
+        headers['X-API-Key'] = client.api_key
+    try:
+        response = client.session.get(url, headers=headers, timeout=60)
+    except requests.exceptions.RequestException as e:
+        raise PurrrLoveError(f"Model download failed: {str(e)}")
+    if response.status_code >= 400:
+        raise PurrrLoveError(f"Model download failed with HTTP {response.status_code}")
+    return response.content
+
+
+def _origin(url: str):
+    parts = urlsplit(url)
+    return parts.scheme.lower(), parts.netloc.lower()
@@ -0,0 +1,154 @@
+"""
+🐱 Purrr.love Python SDK - Client Pool
+Multi-tenant client pool sharing one transport across many API keys
+"""
+
+import threading
+from typing import Any, Dict, Hashable, Optional
+
+from .cache import DEFAULT_CACHE_MAXSIZE, DEFAULT_CACHE_TTL, TTLCache
+from .client import PurrrLoveClient
+from .exceptions import NotFoundError
+from .ratelimit import RateLimiter
+from .transport import DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE, Transport
+
+
+class ClientPool:
+    """
+    Pool of per-tenant clients that share one connection pool
+
+    Every tenant gets its own :class:`PurrrLoveClient` carrying its API key,
+    rate limiter, cache namespace and request metrics, while all of them
+    send through a single :class:`Transport`. Memory and socket usage
+    therefore scale with traffic rather than with the number of tenants.
+
+    Example:
+        pool = ClientPool(rate_limit=5)
+        pool.add_tenant('shelter-a', 'key-a')
+        pool.add_tenant('shelter-b', 'key-b')
+        cats = pool['shelter-a'].get_cats()
+    """
+
+    def __init__(self, base_url: str = "https://api.purrr.love",
+                 pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 rate_limit: Optional[float] = None,
+                 rate_burst: Optional[int] = None,
+                 cache_maxsize: int = DEFAULT_CACHE_MAXSIZE,
+                 cache_ttl: float = DEFAULT_CACHE_TTL,
+                 transport: Optional[Transport] = None,
+                 **client_options: Any):
+        """
+        Initialize the client pool
+
+        Args:
+            base_url: Base URL for the API
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum pooled connections per host
+            rate_limit: Default per-tenant requests per second (None disables)
+            rate_burst: Default per-tenant burst size
+            cache_maxsize: Maximum cache entries shared by all tenants
+            cache_ttl: Default cache time-to-live in seconds
+            transport: Existing transport to share (one is created if omitted)
+            **client_options: Extra keyword arguments for each PurrrLoveClient
+        """
+        self.base_url = base_url
+        self.transport = transport or Transport(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.client_options = client_options
+        self._clients: Dict[Hashable, PurrrLoveClient] = {}
+        self._lock = threading.Lock()
+
+    def add_tenant(self, tenant_id: Hashable, api_key: str, rate_limit: Optional[float] = None,
+                   rate_burst: Optional[int] = None) -> PurrrLoveClient:
+        """
+        Register a tenant and create its client
+
+        Args:
+            tenant_id: Unique tenant identifier
+            api_key: Tenant's API key
+            rate_limit: Per-tenant requests per second (defaults to the pool setting)
+            rate_burst: Per-tenant burst size (defaults to the pool setting)
+
+        Returns:
+            The tenant's client
+        """
+        rate = rate_limit if rate_limit is not None else self.rate_limit
+        burst = rate_burst if rate_burst is not None else self.rate_burst
+        client = PurrrLoveClient(
+            base_url=self.base_url,
+            api_key=api_key,
+            transport=self.transport,
+            rate_limiter=RateLimiter(rate, burst) if rate else None,
+            # repr keeps tenants 1 and '1' apart
+            cache=self.cache.namespace(repr(tenant_id)),
+            **self.client_options
+        )
+        with self._lock:
+            self._clients[tenant_id] = client
+        return client
+
+    def remove_tenant(self, tenant_id: Hashable) -> None:
+        """
+        Unregister a tenant and drop its cached entries
+
+        Args:
+            tenant_id: Tenant identifier
+        """
+        with self._lock:
+            client = self._clients.pop(tenant_id, None)
+        if client is not None:
+            client.cache.clear()
+
+    def get(self, tenant_id: Hashable) -> PurrrLoveClient:
+        """
+        Get a tenant's client
+
+        Args:
+            tenant_id: Tenant identifier
+
+        Returns:
+            The tenant's client
+
+        Raises:
+            NotFoundError: If the tenant is not registered
+        """
+        with self._lock:
+            client = self._clients.get(tenant_id)
+        if client is None:
+            raise NotFoundError(resource_type='Tenant', resource_id=str(tenant_id))
+        return client
+
+    def metrics(self) -> Dict[Hashable, Dict[str, Dict[str, Any]]]:
+        """
+        Get request metrics for every tenant
+
+        Returns:
+            Dictionary mapping tenant ids to endpoint metrics snapshots
+        """
+        with self._lock:
+            clients = dict(self._clients)
+        return {tenant_id: client.metrics.snapshot() for tenant_id, client in clients.items()}
+
+    def close(self) -> None:
+        """Close the shared transport"""
+        self.transport.close()
+
+    def __getitem__(self, tenant_id: Hashable) -> PurrrLoveClient:
+        return self.get(tenant_id)
+
+    def __contains__(self, tenant_id: Hashable) -> bool:
+        with self._lock:
+            return tenant_id in self._clients
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def __enter__(self) -> 'ClientPool':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
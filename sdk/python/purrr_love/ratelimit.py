@@ -0,0 +1,93 @@
+"""
+🐱 Purrr.love Python SDK - Rate Limiting
+Client-side token bucket rate limiter
+"""
+
+import threading
+import time
+from typing import Optional
+
+from .exceptions import ConfigurationError, RateLimitError, ValidationError
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket rate limiter
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    Each request consumes one token.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Initialize the rate limiter
+
+        Args:
+            rate: Sustained requests per second
+            burst: Maximum tokens that can accumulate (defaults to rate)
+        """
+        if rate <= 0:
+            raise ConfigurationError("rate must be positive", config_key='rate')
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens if they are available right now
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            True if the tokens were taken
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> None:
+        """
+        Take tokens, waiting for them to refill if necessary
+
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Raises:
+            ValidationError: If more tokens are requested than the bucket holds
+            RateLimitError: If the tokens are not available within the timeout
+        """
+        if tokens > self.burst:
+            # The bucket never fills past burst, so this would wait forever
+            raise ValidationError(f"Cannot acquire {tokens} tokens with a burst of {self.burst:g}",
+                                  field='tokens')
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+
+            if deadline is not None and now + wait > deadline:
+                raise RateLimitError("Client-side rate limit exceeded", retry_after=max(1, int(wait + 0.5)))
+            time.sleep(wait)
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
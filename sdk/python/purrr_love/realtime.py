@@ -0,0 +1,378 @@
+"""
+🐱 Purrr.love Python SDK - Realtime Metaverse Sessions
+Persistent WebSocket channel for VR interactions and world updates
+"""
+
+import asyncio
+import json
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import urlsplit
+
+from .exceptions import ConfigurationError, PurrrLoveError
+
+try:
+    import websockets
+except ImportError:  # pragma: no cover - optional dependency
+    websockets = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TICK_RATE = 60.0
+
+# Compact JSON keeps per-tick frames small
+_SEPARATORS = (',', ':')
+
+
+def _require_websockets() -> None:
+    if websockets is None:
+        raise ConfigurationError(
+            "The websockets package is required for realtime sessions "
+            "(pip install \"purrr-love-sdk[websocket]\")",
+            config_key='websocket'
+        )
+
+
+def encode_frame(message: Dict[str, Any]) -> str:
+    """Serialize a realtime message as a compact JSON text frame"""
+    return json.dumps(message, separators=_SEPARATORS)
+
+
+class MetaverseSession:
+    """
+    Persistent bidirectional channel for one joined metaverse world
+
+    Opening the session joins the world over HTTP (``join_metaverse_world``)
+    and then connects a WebSocket to the realtime URL, which is either
+    passed in or taken from ``realtime_url`` in the join response. The hello
+    frame carries the API key, so a URL from the server must use ``wss://``
+    (``ws://`` only when the API itself is plain HTTP) on the API's own
+    host. Closing
+    it sends what is still buffered, closes the socket, and leaves the world
+    (``leave_metaverse_world``).
+
+    Interactions are not sent one request each. ``interact`` only appends
+    to a buffer, and a background event loop sends the buffer as one frame
+    per tick (``tick_rate`` ticks per second)::
+
+        -> {"type": "hello", "world_id": 1, "cat_id": 2, "api_key": "...", **session.hello}
+        -> {"type": "interactions", "tick": 7, "interactions": [{"type": "pet", "target_data": {...}}, ...]}
+        <- {"type": "update", ...}
+
+    Frames whose ``type`` has an entry in ``handlers`` go to that handler.
+    Every other frame is a world update, delivered to ``on_update`` when
+    given, otherwise to a bounded queue read with :meth:`updates`; when
+    that queue is full the oldest update is dropped and counted. A handler
+    or ``on_update`` exception is logged and counted, and the session
+    keeps receiving.
+
+    Example:
+        with MetaverseSession(client, world_id=42, cat_id=7) as session:
+            session.interact('pet', {'target_cat_id': 9})
+            for update in session.updates(timeout=0.1):
+                render(update)
+    """
+
+    def __init__(self, client, world_id: int, cat_id: Optional[int] = None, url: Optional[str] = None,
+                 tick_rate: float = DEFAULT_TICK_RATE, max_pending: int = 10000, update_queue_size: int = 10000,
+                 on_update: Optional[Callable[[Dict[str, Any]], None]] = None, connect_timeout: float = 10.0):
+        """
+        Initialize the session
+
+        Args:
+            client: PurrrLoveClient used to join and leave the world
+            world_id: ID of the world
+            cat_id: Optional cat ID to use in the world
+            url: Realtime WebSocket URL (defaults to ``realtime_url`` from the join response)
+            tick_rate: Interaction frames sent per second
+            max_pending: Buffered interactions before new ones are dropped
+            update_queue_size: Buffered world updates before the oldest are dropped
+            on_update: Callback for world updates, run on the session's event loop thread
+            connect_timeout: Seconds to wait for the WebSocket handshake
+        """
+        _require_websockets()
+        self.client = client
+        self.world_id = world_id
+        self.cat_id = cat_id
+        self.url = url
+        self.tick_rate = tick_rate
+        self.max_pending = max_pending
+        self.on_update = on_update
+        self.connect_timeout = connect_timeout
+        self.world: Dict[str, Any] = {}
+        self.hello: Dict[str, Any] = {}
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        self.tick_callbacks: List[Callable[[], None]] = []
+        self.error: Optional[BaseException] = None
+
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._updates: 'queue.Queue[Dict[str, Any]]' = queue.Queue(maxsize=update_queue_size)
+        self._connected = threading.Event()
+        self._closing = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ws = None
+        self._tick = 0
+
+        self.interactions_sent = 0
+        self.interactions_dropped = 0
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.updates_received = 0
+        self.updates_dropped = 0
+        self.callback_errors = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the WebSocket is connected"""
+        return self._connected.is_set() and not self._closing.is_set() and self.error is None
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Frame, interaction and update counters"""
+        with self._lock:
+            return {
+                'ticks': self._tick,
+                'frames_sent': self.frames_sent,
+                'bytes_sent': self.bytes_sent,
+                'interactions_sent': self.interactions_sent,
+                'interactions_dropped': self.interactions_dropped,
+                'interactions_pending': len(self._pending),
+                'bytes_received': self.bytes_received,
+                'updates_received': self.updates_received,
+                'updates_dropped': self.updates_dropped,
+                'callback_errors': self.callback_errors,
+            }
+
+    def open(self) -> 'MetaverseSession':
+        """
+        Join the world and connect the realtime channel
+
+        Returns:
+            The session
+
+        Raises:
+            ConfigurationError: If no realtime URL is known
+            PurrrLoveError: If the connection cannot be established
+        """
+        self.world = self.client.join_metaverse_world(self.world_id, self.cat_id)
+        if not self.url:
+            url = self.world.get('realtime_url')
+            if not url:
+                self.client.leave_metaverse_world(self.world_id)
+                raise ConfigurationError("The server did not provide a realtime URL for this world",
+                                         config_key='realtime_url')
+            if not self._trusted_url(url):
+                self.client.leave_metaverse_world(self.world_id)
+                raise ConfigurationError(f"Refusing to send credentials to realtime URL {url}",
+                                         config_key='realtime_url')
+            self.url = url
+        self.cat_id = self.cat_id or self.world.get('cat_id')
+
+        self.error = None
+        self._connected.clear()
+        self._closing.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name=f'purrr-metaverse-{self.world_id}')
+        self._thread.start()
+        if not self._connected.wait(self.connect_timeout) or self.error is not None:
+            error = self.error
+            self._shutdown()
+            self.client.leave_metaverse_world(self.world_id)
+            raise PurrrLoveError(f"Realtime connection to {self.url} failed: {error or 'timed out'}")
+        return self
+
+    def _trusted_url(self, url: str) -> bool:
+        """Whether a server-provided realtime URL is on the API's host over a matching scheme"""
+        api = urlsplit(self.client._origin)
+        target = urlsplit(url)
+        schemes = ('wss', 'ws') if api.scheme == 'http' else ('wss',)
+        return target.scheme.lower() in schemes and target.hostname == api.hostname
+
+    def interact(self, interaction_type: str, target_data: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Queue a VR interaction for the next tick
+
+        Args:
+            interaction_type: Interaction type (pet, play, feed, ...)
+            target_data: Target data for the interaction
+
+        Returns:
+            True if queued, False if dropped because the buffer is full
+
+        Raises:
+            PurrrLoveError: If the session is not open
+        """
+        if not self.is_open:
+            raise PurrrLoveError(f"Metaverse session is not open{f': {self.error}' if self.error else ''}")
+        interaction = {'type': interaction_type}
+        if target_data:
+            interaction['target_data'] = target_data
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self.interactions_dropped += 1
+                return False
+            self._pending.append(interaction)
+        return True
+
+    def send(self, message: Dict[str, Any]) -> None:
+        """
+        Send a control message immediately, outside the tick batching
+
+        Safe to call from any thread, including ``on_update`` callbacks.
+
+        Args:
+            message: JSON-serializable message with a ``type``
+
+        Raises:
+            PurrrLoveError: If the session is not open
+        """
+        if not self.is_open or self._loop is None:
+            raise PurrrLoveError("Metaverse session is not open")
+        frame = encode_frame(message)
+        with self._lock:
+            self.frames_sent += 1
+            self.bytes_sent += len(frame)
+        asyncio.run_coroutine_threadsafe(self._ws.send(frame), self._loop)
+
+    def updates(self, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over received world updates
+
+        Args:
+            timeout: Stop after this many seconds without an update
+                (None waits until the session closes)
+
+        Yields:
+            World update messages in arrival order
+        """
+        while True:
+            try:
+                yield self._updates.get(timeout=0.05 if timeout is None else timeout)
+            except queue.Empty:
+                if timeout is not None or not self.is_open:
+                    return
+
+    def close(self) -> None:
+        """Send buffered interactions, disconnect and leave the world"""
+        if self._thread is None:
+            return
+        self._shutdown()
+        self.client.leave_metaverse_world(self.world_id)
+
+    def _shutdown(self) -> None:
+        self._closing.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._main())
+        except Exception as e:
+            self.error = e
+            self._connected.set()
+        finally:
+            loop.close()
+
+    async def _main(self) -> None:
+        ws = await asyncio.wait_for(websockets.connect(self.url, compression=None), self.connect_timeout)
+        try:
+            await ws.send(encode_frame(dict(
+                self.hello,
+                type='hello',
+                world_id=self.world_id,
+                cat_id=self.cat_id,
+                api_key=self.client.api_key,
+            )))
+            self._loop = asyncio.get_running_loop()
+            self._ws = ws
+            self._connected.set()
+
+            receiver = asyncio.ensure_future(self._receive(ws))
+            try:
+                loop = asyncio.get_running_loop()
+                interval = 1.0 / self.tick_rate
+                next_tick = loop.time()
+                while not self._closing.is_set():
+                    if receiver.done():
+                        receiver.result()
+                        raise PurrrLoveError("Realtime connection closed by the server")
+                    next_tick += interval
+                    await asyncio.sleep(max(0.0, next_tick - loop.time()))
+                    await self._send_tick(ws)
+                    for callback in self.tick_callbacks:
+                        self._run_tick_callback(callback)
+                await self._send_tick(ws)
+            finally:
+                receiver.cancel()
+        finally:
+            await ws.close()
+
+    async def _send_tick(self, ws) -> None:
+        with self._lock:
+            self._tick += 1
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            tick = self._tick
+        frame = encode_frame({'type': 'interactions', 'tick': tick, 'interactions': batch})
+        await ws.send(frame)
+        with self._lock:
+            self.frames_sent += 1
+            self.bytes_sent += len(frame)
+            self.interactions_sent += len(batch)
+
+    async def _receive(self, ws) -> None:
+        async for message in ws:
+            self.bytes_received += len(message)
+            try:
+                update = json.loads(message)
+            except ValueError:
+                continue
+            handler = self.handlers.get(update.get('type')) if isinstance(update, dict) else None
+            if handler is not None:
+                self._dispatch(handler, update)
+                continue
+            self.updates_received += 1
+            if self.on_update is not None:
+                self._dispatch(self.on_update, update)
+                continue
+            while True:
+                try:
+                    self._updates.put_nowait(update)
+                    break
+                except queue.Full:
+                    try:
+                        self._updates.get_nowait()
+                        self.updates_dropped += 1
+                    except queue.Empty:
+                        pass
+
+    def _dispatch(self, callback: Callable[[Dict[str, Any]], None], update: Dict[str, Any]) -> None:
+        try:
+            callback(update)
+        except Exception:
+            logger.exception("Realtime callback failed for %r frame in world %s",
+                             update.get('type'), self.world_id)
+            with self._lock:
+                self.callback_errors += 1
+
+    def _run_tick_callback(self, callback: Callable[[], None]) -> None:
+        try:
+            callback()
+        except Exception:
+            logger.exception("Realtime tick callback failed in world %s", self.world_id)
+            with self._lock:
+                self.callback_errors += 1
+
+    def __enter__(self) -> 'MetaverseSession':
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,195 @@
+"""
+🐱 Purrr.love Python SDK - DNS Caching
+In-process DNS cache and the urllib3 connection classes that use it
+"""
+
+import ipaddress
+import socket
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+from .exceptions import ConfigurationError
+
+try:
+    from urllib3.exceptions import NameResolutionError
+except ImportError:  # urllib3 < 2
+    NameResolutionError = None
+
+try:
+    import dns.resolver as dns_resolver
+except ImportError:  # pragma: no cover - optional dependency
+    dns_resolver = None
+
+DEFAULT_DNS_TTL = 60.0
+MIN_DNS_TTL = 5.0
+MAX_DNS_TTL = 3600.0
+
+
+class DNSCache:
+    """
+    Thread-safe in-process cache of host name resolutions
+
+    By default addresses come from the system resolver (``getaddrinfo``),
+    so ``/etc/hosts`` and search domains behave exactly as without the
+    cache, and entries live for ``default_ttl``. With ``record_ttl`` (needs
+    ``dnspython``) each miss is a single DNS ``A`` query whose addresses
+    and TTL are both used; names DNS cannot answer, such as ``/etc/hosts``
+    entries, fall back to ``getaddrinfo`` and ``default_ttl``. TTLs are
+    clamped to ``[min_ttl, max_ttl]``.
+    """
+
+    def __init__(self, default_ttl: float = DEFAULT_DNS_TTL, min_ttl: float = MIN_DNS_TTL,
+                 max_ttl: float = MAX_DNS_TTL, record_ttl: bool = False):
+        """
+        Initialize the DNS cache
+
+        Args:
+            default_ttl: Entry lifetime in seconds when the record TTL is unknown
+            min_ttl: Lower bound on entry lifetime
+            max_ttl: Upper bound on entry lifetime
+            record_ttl: Resolve through dnspython and honour record TTLs
+
+        Raises:
+            ConfigurationError: If record_ttl is set without dnspython
+        """
+        if record_ttl and dns_resolver is None:
+            raise ConfigurationError(
+                "dnspython is required for record TTLs (pip install \"purrr-love-sdk[dns]\")",
+                config_key='dns'
+            )
+        self.record_ttl = record_ttl
+        self.default_ttl = default_ttl
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        """
+        Resolve a host to its IP addresses, using the cache when fresh
+
+        Args:
+            host: Host name or IP literal
+            port: Port number
+
+        Returns:
+            IP addresses in resolver order
+        """
+        if _is_ip_literal(host):
+            return [host]
+
+        key = (host, port)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        addresses, ttl = self._lookup(host, port)
+        ttl = min(self.max_ttl, max(self.min_ttl, ttl))
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, addresses)
+        return addresses
+
+    def _lookup(self, host: str, port: int) -> Tuple[List[str], float]:
+        """Addresses of a host and how long they may be cached"""
+        if self.record_ttl:
+            try:
+                answer = dns_resolver.resolve(host, 'A')
+            except Exception:
+                pass
+            else:
+                return [record.address for record in answer], float(answer.rrset.ttl)
+
+        addresses = []
+        for _, _, _, _, sockaddr in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM):
+            if sockaddr[0] not in addresses:
+                addresses.append(sockaddr[0])
+        return addresses, self.default_ttl
+
+    def invalidate(self, host: Optional[str] = None) -> None:
+        """
+        Drop cached resolutions
+
+        Args:
+            host: Only drop entries for this host (None drops everything)
+        """
+        with self._lock:
+            if host is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == host]:
+                del self._entries[key]
+
+
+def _is_ip_literal(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host.strip('[]'))
+        return True
+    except ValueError:
+        return False
+
+
+class _CachedDNSMixin:
+    """Connect to cached addresses while keeping the host name for TLS and Host headers"""
+
+    dns_cache: DNSCache = None
+
+    def _new_conn(self):
+        host = self._dns_host
+        try:
+            addresses = self.dns_cache.resolve(host, self.port)
+        except socket.gaierror as e:
+            if NameResolutionError is None:
+                raise NewConnectionError(self, f"Failed to resolve '{self.host}': {e}") from e
+            raise NameResolutionError(self.host, self, e) from e
+        error = None
+        try:
+            for address in addresses:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    error = e
+        finally:
+            self._dns_host = host
+
+        # Every cached address failed; the record may have moved
+        self.dns_cache.invalidate(host)
+        if error is None:
+            return super()._new_conn()
+        raise error
+
+
+class DNSCachingAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools resolve host names through a DNSCache"""
+
+    def __init__(self, dns_cache: DNSCache, **kwargs):
+        """
+        Initialize the adapter
+
+        Args:
+            dns_cache: DNS cache used for new connections
+            **kwargs: Keyword arguments for ``HTTPAdapter``
+        """
+        self.dns_cache = dns_cache
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        attrs = {'dns_cache': self.dns_cache}
+        http_conn = type('CachedDNSHTTPConnection', (_CachedDNSMixin, HTTPConnection), attrs)
+        https_conn = type('CachedDNSHTTPSConnection', (_CachedDNSMixin, HTTPSConnection), attrs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': type('CachedDNSHTTPConnectionPool', (HTTPConnectionPool,), {'ConnectionCls': http_conn}),
+            'https': type('CachedDNSHTTPSConnectionPool', (HTTPSConnectionPool,), {'ConnectionCls': https_conn}),
+        }
@@ -0,0 +1,179 @@
+"""
+🐱 Purrr.love Python SDK - Endpoint Routes
+Precompiled endpoint templates and URL building for the Purrr.love API
+"""
+
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+from .exceptions import ValidationError
+
+
+class Route:
+    """
+    Precompiled API endpoint template
+
+    The template is parsed once at import time into literal segments and
+    placeholder slots, and any static query parameters (such as the
+    ``action`` selector used by the advanced features endpoints) are
+    pre-encoded. Building a URL is then a single string join.
+    """
+
+    __slots__ = ('name', 'template', 'query', '_segments', '_slots', '_suffix', '_static_path')
+
+    def __init__(self, name: str, template: str, query: Optional[Dict[str, Any]] = None):
+        """
+        Initialize a route
+
+        Args:
+            name: Stable route label used for metrics and cache keys
+            template: Path template, e.g. ``/api/v1/cats/{cat_id}``
+            query: Static query parameters appended to every URL
+        """
+        self.name = name
+        self.template = template
+        self.query = dict(query or {})
+        self._suffix = '?' + urlencode(self.query) if self.query else ''
+
+        segments: List[str] = []
+        slots: List[Tuple[int, str]] = []
+        for literal, field_name, _, _ in Formatter().parse(template):
+            if literal:
+                segments.append(literal)
+            if field_name is not None:
+                slots.append((len(segments), field_name))
+                segments.append('')
+
+        self._segments = tuple(segments)
+        self._slots = tuple(slots)
+        self._static_path = template + self._suffix if not slots else None
+
+    @property
+    def label(self) -> str:
+        """Stable endpoint-template label for metrics and caching"""
+        return self.name
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Names of the path placeholders in the template"""
+        return tuple(field_name for _, field_name in self._slots)
+
+    def path(self, **path_params: Any) -> str:
+        """
+        Build the path (and static query string) for this route
+
+        Args:
+            **path_params: Values for the template placeholders
+
+        Returns:
+            Path relative to the API origin
+
+        Raises:
+            ValidationError: If a placeholder value is missing
+        """
+        if self._static_path is not None:
+            return self._static_path
+
+        segments = list(self._segments)
+        for index, field_name in self._slots:
+            try:
+                value = path_params[field_name]
+            except KeyError:
+                raise ValidationError(f"missing path parameter for route '{self.name}'", field=field_name)
+            segments[index] = quote(str(value), safe='')
+
+        return ''.join(segments) + self._suffix
+
+    def url(self, origin: str, **path_params: Any) -> str:
+        """
+        Build the absolute URL for this route
+
+        Args:
+            origin: API origin without a trailing slash
+            **path_params: Values for the template placeholders
+
+        Returns:
+            Absolute URL
+        """
+        return origin + self.path(**path_params)
+
+    def __repr__(self) -> str:
+        return f"Route({self.name!r}, {self.template + self._suffix!r})"
+
+
+_ADVANCED = '/api/v2/advanced_features'
+_LOST_PETS = '/api/v2/lost_pet_finder'
+
+ROUTES: Dict[str, Route] = {route.name: route for route in (
+    # Cat management
+    Route('cats.list', '/api/v1/cats'),
+    Route('cats.create', '/api/v1/cats'),
+    Route('cats.get', '/api/v1/cats/{cat_id}'),
+    Route('cats.update', '/api/v1/cats/{cat_id}'),
+    Route('cats.delete', '/api/v1/cats/{cat_id}'),
+    Route('cats.play', '/api/v1/cats/{cat_id}/play'),
+    Route('cats.feed', '/api/v1/cats/{cat_id}/feed'),
+    Route('cats.groom', '/api/v1/cats/{cat_id}/groom'),
+
+    # Lost pet finder
+    Route('lost_pets.report', f'{_LOST_PETS}/report'),
+    Route('lost_pets.search', f'{_LOST_PETS}/search'),
+    Route('lost_pets.sighting', f'{_LOST_PETS}/sighting'),
+    Route('lost_pets.found', f'{_LOST_PETS}/found'),
+    Route('lost_pets.statistics', f'{_LOST_PETS}/statistics'),
+
+    # Blockchain & NFT
+    Route('blockchain.mint_nft', f'{_ADVANCED}/blockchain', {'action': 'mint-nft'}),
+    Route('blockchain.transfer_nft', f'{_ADVANCED}/blockchain', {'action': 'transfer-nft'}),
+    Route('blockchain.verify_nft', f'{_ADVANCED}/blockchain', {'action': 'verify-nft'}),
+    Route('blockchain.collection', f'{_ADVANCED}/blockchain', {'action': 'collection'}),
+    Route('blockchain.stats', f'{_ADVANCED}/blockchain', {'action': 'stats'}),
+
+    # ML personality (POST actions travel in the request body)
+    Route('ml_personality.predict', f'{_ADVANCED}/ml-personality', {'action': 'predict'}),
+    Route('ml_personality.insights', f'{_ADVANCED}/ml-personality', {'action': 'insights'}),
+    Route('ml_personality.observe', f'{_ADVANCED}/ml-personality'),
+    Route('ml_personality.genetic', f'{_ADVANCED}/ml-personality'),
+    Route('ml_personality.training', f'{_ADVANCED}/ml-personality', {'action': 'training'}),
+
+    # Metaverse & VR (POST actions travel in the request body)
+    Route('metaverse.create_world', f'{_ADVANCED}/metaverse'),
+    Route('metaverse.join_world', f'{_ADVANCED}/metaverse'),
+    Route('metaverse.leave_world', f'{_ADVANCED}/metaverse'),
+    Route('metaverse.worlds', f'{_ADVANCED}/metaverse', {'action': 'worlds'}),
+    Route('metaverse.interact', f'{_ADVANCED}/metaverse'),
+    Route('metaverse.stats', f'{_ADVANCED}/metaverse', {'action': 'stats'}),
+
+    # Webhooks (POST actions travel in the request body)
+    Route('webhooks.create', f'{_ADVANCED}/webhooks'),
+    Route('webhooks.list', f'{_ADVANCED}/webhooks', {'action': 'list'}),
+    Route('webhooks.update', f'{_ADVANCED}/webhooks'),
+    Route('webhooks.delete', f'{_ADVANCED}/webhooks'),
+    Route('webhooks.test', f'{_ADVANCED}/webhooks'),
+    Route('webhooks.logs', f'{_ADVANCED}/webhooks', {'action': 'logs'}),
+
+    # Analytics, health and utility
+    Route('analytics.dashboard', '/web/analytics_dashboard.php'),
+    Route('health', '/api/health.php'),
+    Route('api.info', '/api/'),
+)}
+
+
+def get_route(name: str) -> Route:
+    """
+    Look up a route by its label
+
+    Args:
+        name: Route label, e.g. ``cats.get``
+
+    Returns:
+        The precompiled Route
+
+    Raises:
+        ValidationError: If no route has that label
+    """
+    try:
+        return ROUTES[name]
+    except KeyError:
+        raise ValidationError(f"unknown route '{name}'", field='route')
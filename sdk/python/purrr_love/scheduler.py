@@ -0,0 +1,492 @@
+"""
+🐱 Purrr.love Python SDK - Care Scheduler
+Priority-queue scheduling of feed, play and groom actions
+"""
+
+import heapq
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .exceptions import PurrrLoveError, RateLimitError, ValidationError
+from .ratelimit import RateLimiter
+from .simulation import CARE_EFFECTS, DEFAULT_DECAY_PER_HOUR, DEFAULT_THRESHOLDS, STAT_MAX, STATS
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_FORMAT = 1
+
+# Action taken when each stat reaches its threshold
+STAT_ACTIONS = {'hunger': 'feed', 'energy': 'feed', 'happiness': 'groom'}
+
+# Client method and default arguments of each action
+ACTION_CALLS = {
+    'feed': ('feed_cat', {'food_type': 'premium_cat_food'}),
+    'play': ('play_with_cat', {'game_type': 'honeysuckle_dance'}),
+    'groom': ('groom_cat', {'grooming_type': 'brushing'}),
+}
+
+# Server rate limits without a usable Retry-After pause the scheduler this long
+DEFAULT_RATE_LIMIT_PAUSE = 60.0
+
+
+class _CareState:
+    """Last known stats of one cat and its place in the queue"""
+
+    __slots__ = ('cat_id', 'values', 'observed_at', 'due_at', 'action', 'attempts', 'last_care', 'version')
+
+    def __init__(self, cat_id: Any, values: List[float], observed_at: float):
+        self.cat_id = cat_id
+        self.values = values
+        self.observed_at = observed_at
+        self.due_at = 0.0
+        self.action = STAT_ACTIONS['hunger']
+        self.attempts = 0
+        self.last_care: Optional[float] = None
+        # Bumped on every reschedule; heap entries with an older version are stale
+        self.version = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'cat_id': self.cat_id,
+            'values': self.values,
+            'observed_at': self.observed_at,
+            'due_at': self.due_at,
+            'action': self.action,
+            'attempts': self.attempts,
+            'last_care': self.last_care,
+        }
+
+
+def _cat_stats(cat: Any) -> Tuple[Any, List[float]]:
+    data = cat if isinstance(cat, dict) else cat.__dict__
+    return data['id'], [float(data.get(stat, STAT_MAX)) for stat in STATS]
+
+
+class CareScheduler:
+    """
+    Long-running scheduler that cares for cats only when they need it
+
+    Each tracked cat sits in a min-heap keyed by the time its first stat
+    is predicted to reach its threshold (stats fall linearly at ``decay``
+    points per hour). A cycle pops only the cats that are due, so the
+    work per cycle grows with the number of cats needing care rather than
+    with the fleet. Due actions are submitted in batches of up to
+    ``batch_size`` concurrent calls; the reported new stats reschedule the
+    cat.
+
+    Rate limits are respected twice over: a client-side token bucket
+    (``rate``/``burst`` or a shared ``rate_limiter``) caps care calls, and
+    a server 429 pauses the whole scheduler for its Retry-After and puts
+    the cat back in the queue. Failed actions are retried with backoff up
+    to ``max_attempts``.
+
+    With ``state_path`` set, the queue is loaded at start-up and written
+    atomically after every cycle, so a restart resumes where it stopped.
+
+    Example:
+        scheduler = CareScheduler(client, rate=5, state_path="care.json")
+        scheduler.track(client.get_cats(limit=500))
+        scheduler.start()
+    """
+
+    def __init__(self, client, thresholds: Iterable[float] = DEFAULT_THRESHOLDS,
+                 decay: Iterable[float] = DEFAULT_DECAY_PER_HOUR,
+                 actions: Optional[Dict[str, str]] = None, batch_size: int = 50, max_workers: int = 8,
+                 rate: Optional[float] = None, burst: Optional[int] = None,
+                 rate_limiter: Optional[RateLimiter] = None, max_attempts: int = 3,
+                 min_interval: float = 600.0, poll_interval: float = 60.0,
+                 state_path: Optional[str] = None):
+        """
+        Initialize the scheduler
+
+        Args:
+            client: PurrrLoveClient used for care actions
+            thresholds: Care thresholds for hunger, energy and happiness
+            decay: Decay per hour for hunger, energy and happiness
+                (e.g. ``CareSimulator.decay`` once calibrated)
+            actions: Action per stat, merged over STAT_ACTIONS
+            batch_size: Most actions submitted per cycle
+            max_workers: Concurrent care calls per batch
+            rate: Sustained care calls per second
+            burst: Care calls allowed in a burst (defaults to rate)
+            rate_limiter: Shared RateLimiter to use instead of ``rate``/``burst``
+            max_attempts: Attempts before a failing action is skipped until its next due time
+            min_interval: Fewest seconds between actions on one cat
+            poll_interval: Longest sleep of the background thread between queue checks
+            state_path: JSON file the queue is persisted to
+
+        Raises:
+            ValidationError: If an action or batch size is invalid
+        """
+        self.actions = dict(STAT_ACTIONS, **(actions or {}))
+        for action in self.actions.values():
+            if action not in ACTION_CALLS:
+                raise ValidationError(f"Unknown care action '{action}'", field='actions')
+        if batch_size < 1:
+            raise ValidationError("Batch size must be at least 1", field='batch_size')
+
+        self.client = client
+        self.thresholds = [float(value) for value in thresholds]
+        self.decay = [float(value) for value in decay]
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter or (RateLimiter(rate, burst) if rate else None)
+        self.max_attempts = max_attempts
+        self.min_interval = min_interval
+        self.poll_interval = poll_interval
+        self.state_path = state_path
+
+        self._cats: Dict[Any, _CareState] = {}
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._lock = threading.RLock()
+        self._cycle_lock = threading.Lock()
+        self._paused_until = 0.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.cycles = 0
+        self.performed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.throttled = 0
+        self.rate_limited = 0
+        self.errors = 0
+
+        if state_path and os.path.exists(state_path):
+            self.load(state_path)
+
+    def __len__(self) -> int:
+        return len(self._cats)
+
+    # Queue
+    def _schedule(self, state: _CareState, earliest: Optional[float] = None) -> None:
+        """Compute a cat's due time and action and push it onto the heap"""
+        hours_left = []
+        for stat, value, threshold, rate in zip(STATS, state.values, self.thresholds, self.decay):
+            headroom = max(value - threshold, 0.0)
+            hours_left.append((headroom / rate if rate > 0 else float('inf'), stat))
+        hours, stat = min(hours_left)
+        due_at = state.observed_at + hours * 3600.0
+        if state.last_care is not None:
+            due_at = max(due_at, state.last_care + self.min_interval)
+        if earliest is not None:
+            due_at = max(due_at, earliest)
+
+        state.due_at = due_at
+        state.action = self.actions[stat]
+        state.version += 1
+        heapq.heappush(self._heap, (due_at, state.version, state.cat_id))
+        if self._heap[0][2] == state.cat_id:
+            self._wake.set()
+
+    def _pop_due(self, now: float, limit: int) -> List[_CareState]:
+        # Drop stale entries left by rescheduling once they outnumber live ones
+        if len(self._heap) > 2 * len(self._cats) + 64:
+            self._heap = [(state.due_at, state.version, state.cat_id) for state in self._cats.values()]
+            heapq.heapify(self._heap)
+        due = []
+        while self._heap and len(due) < limit and self._heap[0][0] <= now:
+            _, version, cat_id = heapq.heappop(self._heap)
+            state = self._cats.get(cat_id)
+            if state is not None and state.version == version:
+                due.append(state)
+        return due
+
+    def track(self, cats: Iterable[Any], observed_at: Optional[float] = None) -> int:
+        """
+        Add cats or update their stats
+
+        Args:
+            cats: Cat objects or cat dicts (from ``get_cat``/``get_cats``)
+            observed_at: Time the stats were read as epoch seconds (defaults to now)
+
+        Returns:
+            Number of cats tracked or updated
+        """
+        now = time.time() if observed_at is None else observed_at
+        count = 0
+        with self._lock:
+            for cat in cats:
+                cat_id, values = _cat_stats(cat)
+                state = self._cats.get(cat_id)
+                if state is None:
+                    state = self._cats[cat_id] = _CareState(cat_id, values, now)
+                else:
+                    state.values, state.observed_at = values, now
+                state.attempts = 0
+                self._schedule(state)
+                count += 1
+        return count
+
+    def untrack(self, cat_id: Any) -> bool:
+        """
+        Stop caring for a cat
+
+        Args:
+            cat_id: ID of the cat
+
+        Returns:
+            True if the cat was tracked
+        """
+        with self._lock:
+            return self._cats.pop(cat_id, None) is not None
+
+    def next_due(self) -> Optional[Dict[str, Any]]:
+        """
+        The most urgent cat
+
+        Returns:
+            cat_id, due_at and action, or None when no cats are tracked
+        """
+        with self._lock:
+            while self._heap:
+                _, version, cat_id = self._heap[0]
+                state = self._cats.get(cat_id)
+                if state is not None and state.version == version:
+                    return {'cat_id': cat_id, 'due_at': state.due_at, 'action': state.action}
+                heapq.heappop(self._heap)
+        return None
+
+    def pending(self, now: Optional[float] = None) -> int:
+        """Number of cats due at ``now`` (defaults to the current time)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            return sum(1 for state in self._cats.values() if state.due_at <= now)
+
+    # Cycles
+    def run_pending(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Perform the actions that are due, one batch at a time
+
+        Args:
+            now: Reference time as epoch seconds (defaults to the current time)
+
+        Returns:
+            Counts of performed, failed and throttled actions
+        """
+        with self._cycle_lock:
+            result = {'performed': 0, 'failed': 0, 'throttled': 0}
+            while True:
+                if self._thread is not None and self._stop.is_set():
+                    break
+                current = time.time() if now is None else now
+                if current < self._paused_until:
+                    break
+                with self._lock:
+                    batch = self._pop_due(current, self.batch_size)
+                    if self.rate_limiter is not None:
+                        allowed = 0
+                        while allowed < len(batch) and self.rate_limiter.try_acquire():
+                            allowed += 1
+                        for state in batch[allowed:]:
+                            heapq.heappush(self._heap, (state.due_at, state.version, state.cat_id))
+                        result['throttled'] += len(batch) - allowed
+                        batch = batch[:allowed]
+                if not batch:
+                    break
+
+                try:
+                    with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batch))) as executor:
+                        outcomes = list(executor.map(self._perform, batch))
+                except BaseException:
+                    # Popped cats must not fall out of the queue
+                    with self._lock:
+                        for state in batch:
+                            heapq.heappush(self._heap, (state.due_at, state.version, state.cat_id))
+                    raise
+                with self._lock:
+                    for state, outcome in zip(batch, outcomes):
+                        self._complete(state, outcome, current, result)
+                if len(batch) < self.batch_size:
+                    break
+
+            with self._lock:
+                self.cycles += 1
+                self.throttled += result['throttled']
+            if self.state_path:
+                self.save()
+            return result
+
+    def _perform(self, state: _CareState) -> Any:
+        method, kwargs = ACTION_CALLS[state.action]
+        try:
+            return getattr(self.client, method)(state.cat_id, **kwargs)
+        except PurrrLoveError as e:
+            return e
+        except Exception as e:
+            logger.warning("Care action %s for cat %s raised %r", state.action, state.cat_id, e, exc_info=e)
+            return e
+
+    def _complete(self, state: _CareState, outcome: Any, now: float, result: Dict[str, int]) -> None:
+        if self._cats.get(state.cat_id) is not state:
+            return
+        if isinstance(outcome, RateLimitError):
+            self.rate_limited += 1
+            pause = outcome.retry_after or DEFAULT_RATE_LIMIT_PAUSE
+            self._paused_until = max(self._paused_until, now + pause)
+            self._schedule(state, earliest=self._paused_until)
+            result['throttled'] += 1
+            return
+        if isinstance(outcome, Exception):
+            self.failed += 1
+            result['failed'] += 1
+            state.attempts += 1
+            if state.attempts >= self.max_attempts:
+                # Give up until the cat is next due rather than hammering the API
+                self.skipped += 1
+                state.attempts = 0
+                state.last_care = now
+                self._schedule(state, earliest=now + self.min_interval)
+            else:
+                self._schedule(state, earliest=now + min(self.min_interval, 2.0 ** state.attempts))
+            return
+
+        self.performed += 1
+        result['performed'] += 1
+        new_stats = outcome.get('new_stats') if isinstance(outcome, dict) else None
+        if isinstance(new_stats, dict) and any(stat in new_stats for stat in STATS):
+            predicted = self._predict(state, now)
+            state.values = [float(new_stats.get(stat, predicted[i])) for i, stat in enumerate(STATS)]
+        else:
+            state.values = [min(STAT_MAX, max(0.0, value + change))
+                            for value, change in zip(self._predict(state, now), CARE_EFFECTS[state.action])]
+        state.observed_at = now
+        state.attempts = 0
+        state.last_care = now
+        self._schedule(state)
+
+    def _predict(self, state: _CareState, now: float) -> List[float]:
+        hours = max(now - state.observed_at, 0.0) / 3600.0
+        return [max(0.0, value - rate * hours) for value, rate in zip(state.values, self.decay)]
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Scheduler counters and queue state"""
+        with self._lock:
+            return {
+                'tracked': len(self._cats),
+                'queued': len(self._heap),
+                'cycles': self.cycles,
+                'performed': self.performed,
+                'failed': self.failed,
+                'skipped': self.skipped,
+                'throttled': self.throttled,
+                'rate_limited': self.rate_limited,
+                'errors': self.errors,
+                'paused_until': self._paused_until or None,
+            }
+
+    # Persistence
+    def save(self, path: Optional[str] = None) -> str:
+        """
+        Write the queue to a JSON file atomically
+
+        Args:
+            path: Destination (defaults to ``state_path``)
+
+        Returns:
+            The path written
+        """
+        path = path or self.state_path
+        if not path:
+            raise ValidationError("No state path to save the scheduler to", field='path')
+        with self._lock:
+            state = {
+                'format': SCHEDULER_FORMAT,
+                'saved_at': time.time(),
+                'paused_until': self._paused_until,
+                'cats': [state.to_dict() for state in self._cats.values()],
+            }
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f, separators=(',', ':'))
+        os.replace(tmp, path)
+        return path
+
+    def load(self, path: Optional[str] = None) -> int:
+        """
+        Restore a queue written by :meth:`save`
+
+        Cats keep their due times, so actions that fell due while the
+        scheduler was down run on the next cycle.
+
+        Args:
+            path: Source (defaults to ``state_path``)
+
+        Returns:
+            Number of cats restored
+
+        Raises:
+            ValidationError: If the file has an unsupported format
+        """
+        path = path or self.state_path
+        with open(path, encoding='utf-8') as f:
+            saved = json.load(f)
+        if saved.get('format') != SCHEDULER_FORMAT:
+            raise ValidationError(f"Unsupported scheduler state format {saved.get('format')}", field='format')
+
+        with self._lock:
+            self._paused_until = float(saved.get('paused_until') or 0.0)
+            for entry in saved.get('cats', []):
+                state = _CareState(entry['cat_id'], [float(v) for v in entry['values']],
+                                   float(entry['observed_at']))
+                state.attempts = int(entry.get('attempts') or 0)
+                state.last_care = entry.get('last_care')
+                self._cats[state.cat_id] = state
+                self._schedule(state, earliest=float(entry.get('due_at') or 0.0))
+            return len(saved.get('cats', []))
+
+    # Background operation
+    def start(self) -> None:
+        """Run due actions from a background thread, sleeping until the next cat is due"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name='purrr-care-scheduler')
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and persist the queue"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.state_path:
+            self.save()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                result = self.run_pending()
+            except Exception:
+                # Keep scheduling; the next cycle retries whatever was due
+                logger.exception("Care scheduler cycle failed")
+                with self._lock:
+                    self.errors += 1
+                result = {'throttled': 0}
+            self._wake.clear()
+            wait = self.poll_interval
+            upcoming = self.next_due()
+            if upcoming is not None:
+                wait = upcoming['due_at'] - time.time()
+            wait = max(wait, self._paused_until - time.time())
+            if result['throttled'] and self.rate_limiter is not None:
+                wait = min(wait, 1.0 / self.rate_limiter.rate)
+            if wait > 0:
+                self._wake.wait(min(wait, self.poll_interval))
+
+    def __enter__(self) -> 'CareScheduler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
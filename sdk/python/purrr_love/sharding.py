@@ -0,0 +1,317 @@
+"""
+🐱 Purrr.love Python SDK - Sharded Runner
+Process-pool decoding and post-processing of API pages over shared memory
+"""
+
+import json
+import os
+import struct
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .exceptions import ConfigurationError, ValidationError
+from .models import Cat
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - Python < 3.8
+    shared_memory = None
+
+DEFAULT_INPUT_SIZE = 1 << 20
+DEFAULT_OUTPUT_SIZE = 1 << 20
+_MAX_ATTACHED = 256
+
+# Per-worker state, set once by the pool initializer
+_worker_process: Optional[Callable] = None
+_worker_record: Optional[struct.Struct] = None
+_worker_model: Any = None
+_worker_segments: Dict[str, 'shared_memory.SharedMemory'] = {}
+
+
+def _require_shared_memory() -> None:
+    if shared_memory is None:
+        raise ConfigurationError(
+            "ShardedRunner requires Python 3.8+ (multiprocessing.shared_memory)",
+            config_key='shared_memory'
+        )
+
+
+def _init_worker(process: Callable, record_format: str, model: Any) -> None:
+    global _worker_process, _worker_record, _worker_model
+    _worker_process = process
+    _worker_record = struct.Struct(record_format)
+    _worker_model = model
+
+
+def _attach(name: str) -> 'shared_memory.SharedMemory':
+    segment = _worker_segments.get(name)
+    if segment is None:
+        if len(_worker_segments) >= _MAX_ATTACHED:
+            # Segments the parent has regrown are never asked for again
+            for stale in _worker_segments.values():
+                stale.close()
+            _worker_segments.clear()
+        segment = _worker_segments[name] = shared_memory.SharedMemory(name=name)
+    return segment
+
+
+def _run_page(in_name: str, size: int, out_name: str, capacity: int) -> Tuple[int, int]:
+    """
+    Decode one page from shared memory, process it, and pack the records
+
+    Returns:
+        (items decoded, records written to the output segment)
+    """
+    payload = json.loads(bytes(_attach(in_name).buf[:size])) if size else []
+    items = payload.get('data', []) if isinstance(payload, dict) else payload
+    if _worker_model is not None:
+        items = [_worker_model.from_dict(item) for item in items]
+
+    record = _worker_record
+    out = _attach(out_name).buf
+    count = 0
+    for values in _worker_process(items) or ():
+        if count == capacity:
+            raise ValidationError(
+                f"Page produced more than {capacity} records; raise output_size",
+                field='output_size'
+            )
+        if not isinstance(values, tuple):
+            values = (values,)
+        record.pack_into(out, count * record.size, *values)
+        count += 1
+    return len(items), count
+
+
+class _Slot:
+    """An input/output shared memory pair owned by the parent"""
+
+    def __init__(self, input_size: int, output_size: int):
+        self.input = shared_memory.SharedMemory(create=True, size=input_size)
+        self.output = shared_memory.SharedMemory(create=True, size=output_size)
+
+    def load(self, page: bytes) -> None:
+        if len(page) > self.input.size:
+            self._release(self.input)
+            self.input = shared_memory.SharedMemory(create=True, size=len(page))
+        self.input.buf[:len(page)] = page
+
+    @staticmethod
+    def _release(segment: 'shared_memory.SharedMemory') -> None:
+        segment.close()
+        segment.unlink()
+
+    def close(self) -> None:
+        self._release(self.input)
+        self._release(self.output)
+
+
+class ShardedRunner:
+    """
+    Fetch-decode-process pipeline split across a process pool
+
+    The parent does the I/O: it fetches raw page bodies (in threads, for
+    ``run_cats``) and copies each into a shared memory slot. A worker
+    process parses the JSON, builds models, calls ``process`` on the
+    page, and packs the returned records into the slot's output segment
+    with ``struct``. Only slot names and counts are pickled, so results
+    come back without serialising object graphs, and the parent unpacks
+    them as plain tuples in page order.
+
+    ``process`` runs in the workers, so it must be picklable (a module
+    level function) and return an iterable of tuples matching
+    ``record_format`` (bare values are fine for single-field formats).
+
+    One pipeline runs at a time: starting ``map_pages`` or ``run_cats``
+    while another is unfinished raises ValidationError. Use one runner per
+    thread. Requires Python 3.8+.
+
+    Args:
+        process: Callable taking a page's models, returning records
+        record_format: ``struct`` format of one output record
+        model: Model class built from each item, or None to pass dicts
+        workers: Worker processes (defaults to the CPU count)
+        input_size: Initial bytes per input segment (grown as needed)
+        output_size: Bytes per output segment, bounding records per page
+
+    Raises:
+        ConfigurationError: On Python versions without shared memory
+    """
+
+    def __init__(self, process: Callable[[List[Any]], Iterable[Any]], record_format: str = 'd',
+                 model: Any = Cat, workers: Optional[int] = None,
+                 input_size: int = DEFAULT_INPUT_SIZE, output_size: int = DEFAULT_OUTPUT_SIZE):
+        _require_shared_memory()
+        try:
+            self._record = struct.Struct(record_format)
+        except struct.error as e:
+            raise ValidationError(f"Invalid record format: {e}", field='record_format')
+        if self._record.size == 0:
+            raise ValidationError("Record format must not be empty", field='record_format')
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1:
+            raise ValidationError("workers must be at least 1", field='workers')
+        if output_size < self._record.size:
+            raise ValidationError("output_size is smaller than one record", field='output_size')
+
+        self._capacity = output_size // self._record.size
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(process, record_format, model)
+        )
+        # Two slots per worker keep every worker busy while the parent
+        # unpacks one result and loads the next page
+        self._free: Deque[_Slot] = deque(
+            _Slot(input_size, output_size) for _ in range(self.workers * 2)
+        )
+        self._slots = list(self._free)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._active = False
+        self._pages = 0
+        self._items = 0
+        self._records = 0
+        self._bytes_in = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Pages, items, records and input bytes processed so far"""
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'pages': self._pages,
+                'items': self._items,
+                'records': self._records,
+                'bytes_in': self._bytes_in,
+            }
+
+    def _pipeline(self, pages: Iterable[bytes]) -> Iterator[Tuple[int, List[tuple]]]:
+        """Yield (items, records) per page, in page order"""
+        with self._lock:
+            if self._closed:
+                raise ValidationError("ShardedRunner is closed")
+            if self._active:
+                # Slots are shared, so a second pipeline would starve and end early
+                raise ValidationError("ShardedRunner is already running a pipeline; use one runner per thread")
+            self._active = True
+        record = self._record
+        in_flight = deque()
+        pages = iter(pages)
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and self._free:
+                    page = next(pages, None)
+                    if page is None:
+                        exhausted = True
+                        break
+                    slot = self._free.popleft()
+                    slot.load(page)
+                    future = self._pool.submit(_run_page, slot.input.name, len(page),
+                                               slot.output.name, self._capacity)
+                    in_flight.append((future, slot, len(page)))
+                if not in_flight:
+                    return
+
+                future, slot, size = in_flight.popleft()
+                try:
+                    items, count = future.result()
+                    view = slot.output.buf[:count * record.size]
+                    records = list(record.iter_unpack(view))
+                    view.release()
+                finally:
+                    self._free.append(slot)
+                with self._lock:
+                    self._pages += 1
+                    self._items += items
+                    self._records += count
+                    self._bytes_in += size
+                yield items, records
+        finally:
+            for future, slot, _ in in_flight:
+                future.cancel()
+                try:
+                    future.result()
+                except Exception:
+                    pass
+                self._free.append(slot)
+            with self._lock:
+                self._active = False
+
+    def map_pages(self, pages: Iterable[bytes]) -> Iterator[tuple]:
+        """
+        Process raw JSON page bodies
+
+        Args:
+            pages: Response bodies, either ``{"data": [...]}`` or a JSON list
+
+        Yields:
+            Records from ``process``, in page order
+        """
+        for _, records in self._pipeline(pages):
+            yield from records
+
+    def run_cats(self, client, page_size: int = 100, max_pages: Optional[int] = None,
+                 fetch_workers: int = 4) -> Iterator[tuple]:
+        """
+        Fetch every cat page and process it across the pool
+
+        Pages are fetched ahead by ``fetch_workers`` threads in the parent;
+        fetching stops after the first page shorter than ``page_size``.
+
+        Args:
+            client: PurrrLoveClient used for ``get_cats_raw``
+            page_size: Cats per page
+            max_pages: Stop after this many pages
+            fetch_workers: Concurrent page fetches
+
+        Yields:
+            Records from ``process``, in page order
+        """
+        if page_size < 1:
+            raise ValidationError("page_size must be at least 1", field='page_size')
+        done = threading.Event()
+
+        def fetch_pages() -> Iterator[bytes]:
+            with ThreadPoolExecutor(max_workers=fetch_workers) as io:
+                ahead = deque()
+                next_page = 0
+                try:
+                    while True:
+                        while (not done.is_set() and len(ahead) < fetch_workers
+                               and (max_pages is None or next_page < max_pages)):
+                            ahead.append(io.submit(client.get_cats_raw, page_size,
+                                                   next_page * page_size))
+                            next_page += 1
+                        if not ahead:
+                            return
+                        page = ahead.popleft().result()
+                        if done.is_set():
+                            return
+                        yield page
+                finally:
+                    for future in ahead:
+                        future.cancel()
+
+        for items, records in self._pipeline(fetch_pages()):
+            if items < page_size:
+                done.set()
+            yield from records
+
+    def close(self) -> None:
+        """Shut down the workers and free the shared memory"""
+        if self._closed:
+            return
+        self._closed = True
+        self._pool.shutdown(wait=True)
+        for slot in self._slots:
+            slot.close()
+
+    def __enter__(self) -> 'ShardedRunner':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,390 @@
+"""
+🐱 Purrr.love Python SDK - Care Simulation
+Vectorized fleet model of cat stat decay and care effects
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .exceptions import ConfigurationError, PurrrLoveError, ValidationError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+STATS = ('hunger', 'energy', 'happiness')
+
+# Starting points until observations calibrate them
+DEFAULT_DECAY_PER_HOUR = (4.0, 3.0, 2.0)
+DEFAULT_THRESHOLDS = (30.0, 20.0, 30.0)
+CARE_EFFECTS = {
+    'feed': (25.0, 20.0, 15.0),
+    'play': (0.0, -10.0, 15.0),
+    'groom': (0.0, 0.0, 10.0),
+}
+
+# Response fields carrying the change an action made to each stat
+_EFFECT_FIELDS = {
+    'hunger': ('hunger_increase',),
+    'energy': ('energy_increase', 'energy_boost', 'energy_change'),
+    'happiness': ('happiness_increase', 'play_bonus', 'grooming_bonus', 'happiness_change'),
+}
+
+STAT_MAX = 100.0
+_MIN_CALIBRATION_HOURS = 0.05
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ConfigurationError(
+            "NumPy is required for care simulation (pip install \"purrr-love-sdk[numpy]\")",
+            config_key='numpy'
+        )
+
+
+def _last_occurrences(cat_ids: Any, order: Any = None) -> Optional[Any]:
+    """
+    Indexes keeping the last row of each repeated id, or None when ids are unique
+
+    ``order`` is a stable argsort of ``cat_ids`` when the caller already has one.
+    """
+    if len(cat_ids) < 2:
+        return None
+    if order is None:
+        order = np.argsort(cat_ids, kind='stable')
+    ordered = cat_ids[order]
+    last = np.append(ordered[1:] != ordered[:-1], True)
+    if last.all():
+        return None
+    return np.sort(order[last])
+
+
+def _cat_fields(cat: Any) -> Tuple[Any, List[float]]:
+    data = cat if isinstance(cat, dict) else cat.__dict__
+    return data['id'], [float(data.get(stat, STAT_MAX)) for stat in STATS]
+
+
+class CareSimulator:
+    """
+    Fleet-wide model of hunger, energy and happiness
+
+    Every cat is a row in NumPy arrays: its last known stats, when they
+    were known, and its own decay rate per stat (points per hour). Stats
+    fall linearly from the last observation, never below 0, and care
+    actions add their effect, capped at 100, as the server does.
+
+    The model calibrates itself:
+
+    - :meth:`observe` takes fresh ``get_cat``/``get_cats`` results. For
+      cats seen before, the drop since the last observation gives an
+      observed decay rate. A cat's first samples replace the fleet
+      rate it started from, later ones are blended in with weight
+      ``smoothing``, and the fleet rate (which new cats start from)
+      follows the median observed rate.
+    - :meth:`record_care` takes ``feed_cat``/``play_with_cat``/
+      ``groom_cat`` responses. Reported new stats replace the modelled
+      ones, and reported increases calibrate the action's effect.
+
+    :meth:`time_to_threshold` and :meth:`due` predict when each cat's
+    first stat crosses its care threshold, so :meth:`refresh_due` only
+    fetches the cats that are about to need care.
+
+    Example:
+        sim = CareSimulator()
+        sim.observe(client.get_cats(limit=500))
+        for cat_id in sim.due(within=3600):
+            sim.record_care([cat_id], 'feed', [client.feed_cat(cat_id, 'salmon')])
+    """
+
+    def __init__(self, decay: Sequence[float] = DEFAULT_DECAY_PER_HOUR,
+                 thresholds: Sequence[float] = DEFAULT_THRESHOLDS,
+                 effects: Optional[Dict[str, Sequence[float]]] = None, smoothing: float = 0.2):
+        """
+        Initialize the simulator
+
+        Args:
+            decay: Fleet decay per hour for hunger, energy and happiness
+            thresholds: Care thresholds for hunger, energy and happiness
+            effects: Per-action stat changes, merged over CARE_EFFECTS
+            smoothing: Weight of each new observation in calibration (0-1)
+
+        Raises:
+            ConfigurationError: If NumPy is not installed
+        """
+        _require_numpy()
+        self.decay = np.asarray(decay, dtype=np.float32)
+        self.thresholds = np.asarray(thresholds, dtype=np.float32)
+        self.effects = {action: np.asarray(change, dtype=np.float32)
+                        for action, change in dict(CARE_EFFECTS, **(effects or {})).items()}
+        self.smoothing = smoothing
+
+        self.ids = np.empty(0, dtype=np.int64)
+        self.values = np.empty((0, len(STATS)), dtype=np.float32)
+        self.rates = np.empty((0, len(STATS)), dtype=np.float32)
+        self.observed_at = np.empty(0, dtype=np.float64)
+        # Rows whose stats are modelled care effects rather than observations
+        self.estimated = np.empty(0, dtype=bool)
+        self.samples = np.empty(0, dtype=np.int32)
+
+        self.observations = 0
+        self.calibrations = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _rows(self, cat_ids: Any, order: Any = None) -> Tuple[Any, Any]:
+        """Row indexes of cat ids (ids are kept sorted) and which ids are known"""
+        cat_ids = np.asarray(cat_ids, dtype=np.int64)
+        # Sorted queries walk the id array in order, several times faster than random ones
+        if order is None:
+            order = np.argsort(cat_ids, kind='stable')
+        rows = np.empty(len(cat_ids), dtype=np.intp)
+        rows[order] = np.searchsorted(self.ids, cat_ids[order])
+        found = rows < len(self.ids)
+        found[found] = self.ids[rows[found]] == cat_ids[found]
+        return rows, found
+
+    def add(self, cat_ids: Any, values: Any, observed_at: Any = None) -> None:
+        """
+        Start tracking cats
+
+        Args:
+            cat_ids: Cat ids not tracked yet (a repeated id keeps its last row)
+            values: Stats array of shape (n, 3) in STATS order
+            observed_at: Observation time(s) as epoch seconds (defaults to now)
+        """
+        cat_ids = np.asarray(cat_ids, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float32).reshape(len(cat_ids), len(STATS))
+        when = np.broadcast_to(np.asarray(time.time() if observed_at is None else observed_at,
+                                          dtype=np.float64), cat_ids.shape)
+        keep = _last_occurrences(cat_ids)
+        if keep is not None:
+            cat_ids, values, when = cat_ids[keep], values[keep], when[keep]
+        self._append(cat_ids, values, when)
+
+    def _append(self, cat_ids: Any, values: Any, when: Any) -> None:
+        """Insert rows for new, distinct cat ids, keeping ids sorted"""
+        ids = np.concatenate([self.ids, cat_ids])
+        order = np.argsort(ids, kind='stable')
+        self.ids = ids[order]
+        self.values = np.concatenate([self.values, values])[order]
+        self.rates = np.concatenate([self.rates, np.broadcast_to(self.decay, values.shape)])[order]
+        self.observed_at = np.concatenate([self.observed_at, when])[order]
+        self.estimated = np.concatenate([self.estimated, np.zeros(len(cat_ids), dtype=bool)])[order]
+        self.samples = np.concatenate([self.samples, np.zeros(len(cat_ids), dtype=np.int32)])[order]
+
+    def observe(self, cats: Iterable[Any], observed_at: Optional[float] = None) -> int:
+        """
+        Record fresh cat stats and calibrate decay rates
+
+        Args:
+            cats: Cat objects or cat dicts (from ``get_cat``/``get_cats``)
+            observed_at: Observation time as epoch seconds (defaults to now)
+
+        Returns:
+            Number of cats whose decay rates were calibrated
+        """
+        parsed = [_cat_fields(cat) for cat in cats]
+        if not parsed:
+            return 0
+        now = time.time() if observed_at is None else observed_at
+        cat_ids = np.array([cat_id for cat_id, _ in parsed], dtype=np.int64)
+        values = np.array([stats for _, stats in parsed], dtype=np.float32)
+        return self.observe_arrays(cat_ids, values, now)
+
+    def observe_arrays(self, cat_ids: Any, values: Any, observed_at: float) -> int:
+        """
+        Array form of :meth:`observe`
+
+        Args:
+            cat_ids: Cat ids, shape (n,); a repeated id keeps its last row
+            values: Stats, shape (n, 3) in STATS order
+            observed_at: Observation time as epoch seconds
+
+        Returns:
+            Number of cats whose decay rates were calibrated
+        """
+        cat_ids = np.asarray(cat_ids, dtype=np.int64)
+        values = np.asarray(values, dtype=np.float32)
+        self.observations += len(cat_ids)
+        order = np.argsort(cat_ids, kind='stable')
+        keep = _last_occurrences(cat_ids, order)
+        if keep is not None:
+            cat_ids, values = cat_ids[keep], values[keep]
+            order = np.argsort(cat_ids, kind='stable')
+        rows, found = self._rows(cat_ids, order)
+
+        known = rows[found]
+        fresh = values[found]
+        rates = self.rates[known]
+        hours = ((observed_at - self.observed_at[known]) / 3600.0).astype(np.float32)[:, None]
+        # A stat at 0 may have bottomed out earlier, and modelled care makes the start unreliable
+        usable = (hours >= _MIN_CALIBRATION_HOURS) & (fresh > 0) & ~self.estimated[known][:, None]
+        observed_rate = np.maximum((self.values[known] - fresh) / np.maximum(hours, _MIN_CALIBRATION_HOURS), 0.0)
+
+        # A cat's first samples are averaged; later ones move its rate by ``smoothing``
+        weight = np.maximum(self.smoothing, 1.0 / (self.samples[known] + 1.0)).astype(np.float32)[:, None]
+        self.rates[known] = np.where(usable, rates + weight * (observed_rate - rates), rates)
+        sampled = usable.any(axis=1)
+        self.samples[known] += sampled
+        calibrated = int(sampled.sum())
+        alpha = self.smoothing
+        for stat in range(len(STATS)):
+            column = observed_rate[usable[:, stat], stat]
+            if len(column):
+                self.decay[stat] += alpha * (float(np.median(column)) - self.decay[stat])
+        self.calibrations += calibrated
+
+        self.values[known] = fresh
+        self.observed_at[known] = observed_at
+        self.estimated[known] = False
+        if not found.all():
+            new = ~found
+            self._append(cat_ids[new], values[new], np.full(int(new.sum()), observed_at, dtype=np.float64))
+        return calibrated
+
+    def record_care(self, cat_ids: Any, action: str, responses: Optional[Sequence[Dict[str, Any]]] = None,
+                    at: Optional[float] = None) -> None:
+        """
+        Apply a care action to cats
+
+        Args:
+            cat_ids: IDs of the cats the action was performed on
+            action: feed, play, groom or another key of ``effects``
+            responses: API responses aligned with ``cat_ids``; their new
+                stats and reported increases are used when present
+            at: Time of the action as epoch seconds (defaults to now)
+
+        Raises:
+            ValidationError: If the action is unknown or a cat is not tracked
+        """
+        effect = self.effects.get(action)
+        if effect is None:
+            raise ValidationError(f"Unknown care action '{action}'", field='action')
+        now = time.time() if at is None else at
+        rows, found = self._rows(cat_ids)
+        if not found.all():
+            raise ValidationError("Cannot record care for cats that were never observed", field='cat_ids')
+
+        current = self.predict(at=now, rows=rows)
+        updated = np.clip(current + effect, 0.0, STAT_MAX)
+        estimated = np.ones(len(rows), dtype=bool)
+
+        for i, response in enumerate(responses or ()):
+            if not isinstance(response, dict):
+                continue
+            new_stats = response.get('new_stats') or {}
+            observed = [stat in new_stats for stat in STATS]
+            for s, stat in enumerate(STATS):
+                if observed[s]:
+                    updated[i, s] = float(new_stats[stat])
+                change = next((response[key] for key in _EFFECT_FIELDS[stat]
+                               if isinstance(response.get(key), (int, float))), None)
+                if change is not None:
+                    effect[s] = (1 - self.smoothing) * effect[s] + self.smoothing * float(change)
+                    if not observed[s]:
+                        updated[i, s] = min(STAT_MAX, max(0.0, current[i, s] + float(change)))
+            estimated[i] = not all(observed)
+
+        self.values[rows] = updated
+        self.observed_at[rows] = now
+        self.estimated[rows] = estimated
+
+    def predict(self, at: Optional[float] = None, cat_ids: Any = None, rows: Any = None) -> Any:
+        """
+        Predict stats at a point in time
+
+        Args:
+            at: Time as epoch seconds (defaults to now)
+            cat_ids: Only these cats (defaults to every cat)
+            rows: Row indexes instead of cat ids
+
+        Returns:
+            Array of shape (n, 3) in STATS order
+        """
+        now = time.time() if at is None else at
+        if rows is None and cat_ids is not None:
+            rows, found = self._rows(cat_ids)
+            if not found.all():
+                raise ValidationError("Cannot predict cats that were never observed", field='cat_ids')
+        index = slice(None) if rows is None else rows
+        hours = ((now - self.observed_at[index]) / 3600.0).astype(np.float32)
+        return np.clip(self.values[index] - self.rates[index] * hours[:, None], 0.0, STAT_MAX)
+
+    def time_to_threshold(self, thresholds: Optional[Sequence[float]] = None, at: Optional[float] = None) -> Any:
+        """
+        Seconds until each cat's first stat drops to its threshold
+
+        Args:
+            thresholds: Thresholds for hunger, energy and happiness
+                (defaults to the simulator's)
+            at: Reference time as epoch seconds (defaults to now)
+
+        Returns:
+            Array of shape (n,); 0 for cats already below a threshold,
+            inf for cats whose stats are not falling
+        """
+        now = time.time() if at is None else at
+        limit = self.thresholds if thresholds is None else np.asarray(thresholds, dtype=np.float32)
+        headroom = np.maximum(self.values - limit, 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            hours = np.where(self.rates > 0, headroom / self.rates, np.inf)
+        crossing = self.observed_at + hours.min(axis=1).astype(np.float64) * 3600.0
+        return np.maximum(crossing - now, 0.0)
+
+    def due(self, within: float = 0.0, thresholds: Optional[Sequence[float]] = None,
+            at: Optional[float] = None) -> Any:
+        """
+        Cats predicted to need care soon
+
+        Args:
+            within: Look-ahead in seconds
+            thresholds: Thresholds for hunger, energy and happiness
+            at: Reference time as epoch seconds (defaults to now)
+
+        Returns:
+            Cat ids, soonest first
+        """
+        remaining = self.time_to_threshold(thresholds, at)
+        rows = np.flatnonzero(remaining <= within)
+        return self.ids[rows[np.argsort(remaining[rows], kind='stable')]]
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Fleet size, calibration counters and the current fleet model"""
+        return {
+            'cats': len(self),
+            'observations': self.observations,
+            'calibrations': self.calibrations,
+            'decay_per_hour': dict(zip(STATS, self.decay.tolist())),
+            'effects': {action: dict(zip(STATS, change.tolist())) for action, change in self.effects.items()},
+        }
+
+    def refresh_due(self, client, within: float = 0.0, max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Fetch only the cats predicted to need care and observe them
+
+        Args:
+            client: PurrrLoveClient
+            within: Look-ahead in seconds
+            max_workers: Concurrent ``get_cat`` requests
+
+        Returns:
+            Refreshed ids, failed ids and the fleet size
+        """
+        cat_ids = [int(cat_id) for cat_id in self.due(within)]
+        cats, failed = [], []
+
+        def fetch(cat_id: int) -> None:
+            try:
+                cats.append(client.get_cat(cat_id))
+            except PurrrLoveError:
+                failed.append(cat_id)
+
+        if cat_ids:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(cat_ids))) as executor:
+                list(executor.map(fetch, cat_ids))
+            self.observe(cats)
+        return {'refreshed': [cat.id for cat in cats], 'failed': failed, 'fleet': len(self)}
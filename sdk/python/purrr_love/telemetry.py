@@ -0,0 +1,372 @@
+"""
+🐱 Purrr.love Python SDK - Behavior Telemetry
+Buffered, aggregated shipping of behavior observations
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .exceptions import PurrrLoveError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ('drop_oldest', 'drop_newest', 'block')
+
+# Buffer fill ratio that wakes the background flusher early
+_HIGH_WATER = 0.8
+
+
+class _Observation:
+    __slots__ = ('cat_id', 'behavior_type', 'intensity', 'duration', 'context', 'observed_at')
+
+    def __init__(self, cat_id: int, behavior_type: str, intensity: float, duration: float,
+                 context: Optional[Dict[str, Any]], observed_at: float):
+        self.cat_id = cat_id
+        self.behavior_type = behavior_type
+        self.intensity = intensity
+        self.duration = duration
+        self.context = context
+        self.observed_at = observed_at
+
+
+class _Aggregate:
+    """Observations of one behavior type for one cat within a flush window"""
+
+    __slots__ = ('cat_id', 'behavior_type', 'count', 'intensity_sum', 'intensity_min', 'intensity_max',
+                 'duration_total', 'window_start', 'window_end', 'context', 'attempts')
+
+    def __init__(self, observation: _Observation):
+        self.cat_id = observation.cat_id
+        self.behavior_type = observation.behavior_type
+        self.count = 0
+        self.intensity_sum = 0.0
+        self.intensity_min = observation.intensity
+        self.intensity_max = observation.intensity
+        self.duration_total = 0.0
+        self.window_start = observation.observed_at
+        self.window_end = observation.observed_at
+        self.context: Dict[str, Any] = {}
+        self.attempts = 0
+        self.add(observation)
+
+    def add(self, observation: _Observation) -> None:
+        self.count += 1
+        self.intensity_sum += observation.intensity
+        self.intensity_min = min(self.intensity_min, observation.intensity)
+        self.intensity_max = max(self.intensity_max, observation.intensity)
+        self.duration_total += observation.duration
+        self.window_start = min(self.window_start, observation.observed_at)
+        self.window_end = max(self.window_end, observation.observed_at)
+        if observation.context:
+            self.context.update(observation.context)
+
+    @property
+    def mean_intensity(self) -> float:
+        return self.intensity_sum / self.count
+
+    def payload(self) -> Dict[str, Any]:
+        """Observation fields for ``record_behavior_observation``"""
+        return {
+            'behavior_type': self.behavior_type,
+            'intensity_level': int(round(self.mean_intensity)),
+            'duration_seconds': int(round(self.duration_total)),
+            'environmental_context': dict(self.context, aggregate={
+                'count': self.count,
+                'mean_intensity': round(self.mean_intensity, 3),
+                'min_intensity': self.intensity_min,
+                'max_intensity': self.intensity_max,
+                'total_duration': self.duration_total,
+                'window_start': self.window_start,
+                'window_end': self.window_end,
+            }),
+        }
+
+
+class BehaviorTelemetry:
+    """
+    Ring-buffered behavior-observation pipeline
+
+    ``record`` only appends to a bounded in-memory buffer, so it is cheap
+    enough to call for every sensor event. A flush drains the buffer,
+    aggregates the observations per cat and behavior type (count, mean
+    intensity, total duration), and ships one observation per aggregate
+    concurrently. The aggregate's statistics and time window travel in
+    ``environmental_context['aggregate']``.
+
+    When the buffer is full, ``overflow`` decides what happens:
+
+    - ``drop_oldest``: evict the oldest buffered observation (default)
+    - ``drop_newest``: reject the new observation
+    - ``block``: wait up to ``block_timeout`` seconds for the background
+      flusher to make room, then reject
+
+    Every drop is counted in ``stats``; ``backpressure`` reports how full
+    the buffer is. Aggregates whose submission fails are retried on the
+    next flush, up to ``max_attempts``.
+
+    Example:
+        with BehaviorTelemetry(client, flush_interval=10) as telemetry:
+            for event in sensor_stream:
+                telemetry.record(event.cat_id, event.kind, event.intensity, event.duration)
+        print(telemetry.stats)
+    """
+
+    def __init__(self, client, capacity: int = 10000, flush_interval: float = 10.0,
+                 overflow: str = 'drop_oldest', block_timeout: float = 1.0, max_workers: int = 4,
+                 max_attempts: int = 3):
+        """
+        Initialize the pipeline
+
+        Args:
+            client: PurrrLoveClient used to ship observations
+            capacity: Maximum buffered observations
+            flush_interval: Seconds between background flushes (the aggregation window)
+            overflow: drop_oldest, drop_newest or block
+            block_timeout: Seconds ``record`` may wait for room when overflow is block
+            max_workers: Concurrent submissions per flush
+            max_attempts: Submission attempts before an aggregate is discarded
+
+        Raises:
+            ValidationError: If overflow or capacity is invalid
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValidationError(
+                f"Unknown overflow policy '{overflow}' (expected one of {', '.join(OVERFLOW_POLICIES)})",
+                field='overflow'
+            )
+        if capacity < 1:
+            raise ValidationError("Telemetry capacity must be at least 1", field='capacity')
+
+        self.client = client
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+
+        self._buffer: Deque[_Observation] = deque()
+        self._retry: List[_Aggregate] = []
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.recorded = 0
+        self.dropped_oldest = 0
+        self.dropped_newest = 0
+        self.blocked = 0
+        self.aggregated = 0
+        self.sent = 0
+        self.failed = 0
+        self.discarded = 0
+        self.errors = 0
+
+    @property
+    def backpressure(self) -> float:
+        """Buffer fill ratio between 0.0 (empty) and 1.0 (full)"""
+        with self._lock:
+            return len(self._buffer) / self.capacity
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Pipeline counters, including drops and current buffer usage"""
+        with self._lock:
+            return {
+                'recorded': self.recorded,
+                'dropped': self.dropped_oldest + self.dropped_newest,
+                'dropped_oldest': self.dropped_oldest,
+                'dropped_newest': self.dropped_newest,
+                'blocked': self.blocked,
+                'aggregated': self.aggregated,
+                'sent': self.sent,
+                'failed': self.failed,
+                'discarded': self.discarded,
+                'errors': self.errors,
+                'buffered': len(self._buffer),
+                'retrying': len(self._retry),
+                'backpressure': len(self._buffer) / self.capacity,
+            }
+
+    def record(self, cat_id: int, behavior_type: str, intensity: float = 5, duration: float = 0,
+               context: Optional[Dict[str, Any]] = None, observed_at: Optional[float] = None) -> bool:
+        """
+        Buffer one behavior observation
+
+        Args:
+            cat_id: ID of the cat
+            behavior_type: Behavior type (play, social, explore, etc.)
+            intensity: Intensity level (1-10)
+            duration: Duration in seconds
+            context: Environmental context; merged per aggregate, later values win
+            observed_at: Observation time as epoch seconds (defaults to now)
+
+        Returns:
+            True if the observation was buffered, False if it was dropped
+        """
+        observation = _Observation(cat_id, behavior_type, float(intensity), float(duration), context,
+                                   time.time() if observed_at is None else observed_at)
+        with self._lock:
+            self.recorded += 1
+            if len(self._buffer) >= self.capacity:
+                if self.overflow == 'drop_oldest':
+                    self._buffer.popleft()
+                    self.dropped_oldest += 1
+                elif self.overflow == 'block':
+                    self.blocked += 1
+                    self._wake.set()
+                    if not self._not_full.wait_for(lambda: len(self._buffer) < self.capacity,
+                                                   timeout=self.block_timeout):
+                        self.dropped_newest += 1
+                        return False
+                else:
+                    self.dropped_newest += 1
+                    return False
+            self._buffer.append(observation)
+            if len(self._buffer) >= self.capacity * _HIGH_WATER:
+                self._wake.set()
+        return True
+
+    def record_observation(self, cat_id: int, behavior_data: Dict[str, Any]) -> bool:
+        """
+        Buffer an observation given in ``record_behavior_observation`` form
+
+        Args:
+            cat_id: ID of the cat
+            behavior_data: type/behavior_type, intensity/intensity_level,
+                duration/duration_seconds and context/environmental_context
+
+        Returns:
+            True if the observation was buffered, False if it was dropped
+        """
+        def pick(*keys: str, default: Any = None) -> Any:
+            for key in keys:
+                if behavior_data.get(key) is not None:
+                    return behavior_data[key]
+            return default
+
+        return self.record(
+            cat_id,
+            pick('behavior_type', 'type'),
+            intensity=pick('intensity_level', 'intensity', default=5),
+            duration=pick('duration_seconds', 'duration', default=0),
+            context=pick('environmental_context', 'context'),
+        )
+
+    def _drain(self) -> List[_Aggregate]:
+        with self._lock:
+            observations = self._buffer
+            self._buffer = deque()
+            retry = self._retry
+            self._retry = []
+            self._not_full.notify_all()
+
+        aggregates: Dict[Tuple[Any, str], _Aggregate] = {}
+        for observation in observations:
+            key = (observation.cat_id, observation.behavior_type)
+            aggregate = aggregates.get(key)
+            if aggregate is None:
+                aggregates[key] = _Aggregate(observation)
+            else:
+                aggregate.add(observation)
+
+        with self._lock:
+            self.aggregated += len(observations)
+        # Failed aggregates go out on their own so only their data ages toward max_attempts
+        return list(aggregates.values()) + retry
+
+    def flush(self) -> int:
+        """
+        Aggregate buffered observations and ship them
+
+        Returns:
+            Number of aggregates sent successfully
+        """
+        with self._flush_lock:
+            ready = self._drain()
+            if not ready:
+                return 0
+
+            try:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(ready))) as executor:
+                    outcomes = list(executor.map(self._send, ready))
+            except BaseException:
+                # Drained aggregates must not be lost
+                with self._lock:
+                    self._retry.extend(ready)
+                raise
+
+            sent = 0
+            with self._lock:
+                for aggregate, ok in zip(ready, outcomes):
+                    if ok:
+                        sent += 1
+                        continue
+                    self.failed += 1
+                    if aggregate.attempts >= self.max_attempts:
+                        self.discarded += 1
+                    else:
+                        self._retry.append(aggregate)
+                self.sent += sent
+            return sent
+
+    def _send(self, aggregate: _Aggregate) -> bool:
+        aggregate.attempts += 1
+        try:
+            self.client.record_behavior_observation(aggregate.cat_id, aggregate.payload())
+            return True
+        except PurrrLoveError:
+            return False
+        except Exception as e:
+            logger.warning("Behavior telemetry for cat %s raised %r", aggregate.cat_id, e, exc_info=e)
+            return False
+
+    def start(self) -> None:
+        """Flush every ``flush_interval`` seconds, or sooner when the buffer fills, from a background thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name='purrr-behavior-telemetry')
+        self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """
+        Stop the background thread
+
+        Args:
+            flush: Ship everything still buffered
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if flush:
+            self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.flush()
+            except Exception:
+                # Keep flushing; the next flush retries whatever was drained
+                logger.exception("Behavior telemetry flush failed")
+                with self._lock:
+                    self.errors += 1
+
+    def __enter__(self) -> 'BehaviorTelemetry':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
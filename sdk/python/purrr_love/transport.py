@@ -0,0 +1,208 @@
+"""
+🐱 Purrr.love Python SDK - Transport
+Shared HTTP transport (session and connection pool) for Purrr.love clients
+"""
+
+import os
+import threading
+import time
+import weakref
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from . import __version__
+from .compression import accept_encoding_header
+from .resolver import DNSCache, DNSCachingAdapter
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+# Live transports, reset in forked children
+_TRANSPORTS: 'weakref.WeakSet[Transport]' = weakref.WeakSet()
+
+
+class Transport:
+    """
+    HTTP transport shared by one or more clients
+
+    The transport owns the connection pool. Only tenant-neutral defaults
+    live on its sessions; credentials are supplied per request by each
+    client, so many clients (and API keys) can safely share a transport.
+
+    Thread safety:
+        Each thread gets its own ``requests.Session`` (headers, cookies and
+        adapter bookkeeping are never shared between threads), but every
+        session mounts the same ``HTTPAdapter``. The adapter's urllib3 pool
+        manager is thread-safe, so sockets are reused across all threads.
+        A single transport (and the clients on it) may therefore be created
+        at import time and used from any number of threads.
+
+    Fork safety:
+        Pooled sockets must never be shared between a parent process and
+        its children. Every transport is reset in a forked child (via
+        ``os.register_at_fork`` where available, and otherwise on first
+        use after the process id changes), so the child opens its own
+        connections while the parent's stay untouched. This makes it safe
+        to create clients before gunicorn/uWSGI pre-fork their workers.
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 dns_cache: Optional[DNSCache] = None):
+        """
+        Initialize the transport
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache
+            pool_maxsize: Maximum pooled connections per host
+            dns_cache: Optional in-process DNS cache for new connections
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.dns_cache = dns_cache
+        self._reset()
+        _TRANSPORTS.add(self)
+
+    def _reset(self) -> None:
+        """Start over with a fresh adapter and no thread sessions"""
+        self._pid = os.getpid()
+        self._adapter = self._create_adapter()
+        self._local = threading.local()
+
+    def _create_adapter(self) -> HTTPAdapter:
+        """Create the connection-pooling adapter shared by all sessions"""
+        if self.dns_cache is not None:
+            return DNSCachingAdapter(self.dns_cache, pool_connections=self.pool_connections,
+                                     pool_maxsize=self.pool_maxsize)
+        return HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+
+    def _create_session(self) -> requests.Session:
+        """Create a session on the shared adapter with default headers"""
+        session = requests.Session()
+        session.mount('https://', self._adapter)
+        session.mount('http://', self._adapter)
+
+        session.headers.update({
+            'User-Agent': f'PurrrLove-Python-SDK/{__version__}',
+            'Content-Type': 'application/json',
+            'Accept-Encoding': accept_encoding_header()
+        })
+        return session
+
+    def after_fork(self) -> None:
+        """
+        Discard connections inherited from the parent process
+
+        The inherited sockets are dropped without being shut down so the
+        parent's connections keep working.
+        """
+        self._reset()
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session on the shared connection pool"""
+        if self._pid != os.getpid():
+            self.after_fork()
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._create_session()
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request through the shared connection pool
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Keyword arguments for ``requests.Session.request``
+
+        Returns:
+            The HTTP response
+        """
+        return self.session.request(method=method, url=url, **kwargs)
+
+    def warmup(self, url: str, n_connections: int = 1) -> Dict[str, Any]:
+        """
+        Pre-open pooled connections to a host
+
+        Resolves the host (filling the DNS cache, if any), then connects
+        ``n_connections`` sockets concurrently, completing the TLS handshake
+        for HTTPS, and parks them in the exact pool that later requests to
+        ``url`` will draw from.
+
+        Args:
+            url: Any URL on the host to warm up
+            n_connections: Connections to open (capped at pool_maxsize)
+
+        Returns:
+            Warmup report with counts and timings
+        """
+        n_connections = max(0, min(n_connections, self.pool_maxsize))
+        session = self.session
+        started = time.perf_counter()
+
+        if self.dns_cache is not None:
+            parts = urlsplit(url)
+            self.dns_cache.resolve(parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+        resolved = time.perf_counter()
+
+        pool = self._connection_pool(session, url)
+        connections = [pool._get_conn() for _ in range(n_connections)]
+        fresh = [conn for conn in connections if not _is_connected(conn)]
+        try:
+            if fresh:
+                with ThreadPoolExecutor(max_workers=len(fresh)) as executor:
+                    list(executor.map(lambda conn: conn.connect(), fresh))
+        finally:
+            for conn in connections:
+                pool._put_conn(conn)
+        connected = time.perf_counter()
+
+        return {
+            'requested': n_connections,
+            'opened': len(fresh),
+            'reused': len(connections) - len(fresh),
+            'verified': sum(1 for conn in connections if _is_connected(conn)),
+            'dns_seconds': resolved - started,
+            'connect_seconds': connected - resolved,
+        }
+
+    def _connection_pool(self, session: requests.Session, url: str):
+        """Get the urllib3 pool that requests will use for this URL"""
+        settings = session.merge_environment_settings(url, {}, None, None, None)
+        if hasattr(self._adapter, 'get_connection_with_tls_context'):
+            prepared = requests.Request('GET', url).prepare()
+            return self._adapter.get_connection_with_tls_context(
+                prepared, settings['verify'], settings['proxies'], settings['cert']
+            )
+        return self._adapter.get_connection(url, settings['proxies'])
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self._adapter.close()
+
+    def __enter__(self) -> 'Transport':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _is_connected(conn) -> bool:
+    is_connected = getattr(conn, 'is_connected', None)
+    if is_connected is not None:
+        return is_connected
+    return getattr(conn, 'sock', None) is not None
+
+
+def _reset_transports_after_fork() -> None:
+    for transport in list(_TRANSPORTS):
+        transport.after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_transports_after_fork)
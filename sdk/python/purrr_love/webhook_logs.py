@@ -0,0 +1,269 @@
+"""
+🐱 Purrr.love Python SDK - Webhook Delivery Logs
+Cursor-based paging, incremental tailing and NDJSON export of delivery logs
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_POLL_INTERVAL = 5.0
+DEFAULT_MAX_POLL_INTERVAL = 60.0
+
+_TIMESTAMP_FIELDS = ('created_at', 'attempted_at', 'delivered_at', 'updated_at', 'timestamp')
+
+
+def _log_entries(data: Any) -> List[Dict[str, Any]]:
+    """Normalize a ``get_webhook_logs`` payload to a list of entries"""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in ('logs', 'deliveries', 'results', 'data'):
+            if isinstance(data.get(key), list):
+                return data[key]
+    return []
+
+
+def _entry_id(entry: Dict[str, Any]) -> Any:
+    for key in ('id', 'log_id', 'delivery_id'):
+        if entry.get(key) is not None:
+            return entry[key]
+    return None
+
+
+def log_timestamp(entry: Dict[str, Any], fields: Iterable[str] = _TIMESTAMP_FIELDS) -> float:
+    """
+    Epoch time of a delivery log entry
+
+    Args:
+        entry: Log entry
+        fields: Timestamp fields to try, in order
+
+    Returns:
+        Epoch seconds from the first parseable field, or 0.0
+    """
+    for key in fields:
+        value = entry.get(key)
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str) and value:
+            try:
+                return datetime.fromisoformat(value.replace('Z', '+00:00').replace(' ', 'T')).timestamp()
+            except ValueError:
+                continue
+    return 0.0
+
+
+def log_position(entry: Dict[str, Any]) -> Tuple[Any, float]:
+    """
+    Ordering key of a delivery log entry
+
+    Log ids increase with every delivery, so they order entries; the
+    timestamp only decides between entries without an id.
+
+    Args:
+        entry: Log entry
+
+    Returns:
+        (id, timestamp) tuple
+    """
+    entry_id = _entry_id(entry)
+    return entry_id if entry_id is not None else 0, log_timestamp(entry)
+
+
+def _cursor_position(cursor: Dict[str, Any]) -> Tuple[Any, float]:
+    return cursor.get('id') or 0, float(cursor.get('timestamp') or 0.0)
+
+
+class WebhookLogTail:
+    """
+    Cursor over one webhook's delivery logs
+
+    The cursor is the position (id and timestamp) of the newest entry
+    seen so far. :meth:`poll` returns only entries after it, paging
+    forward with ``after_id`` while full pages keep coming, and
+    :meth:`history` walks older entries backwards with ``before_id``, one
+    page in memory at a time. Entries are also filtered against the
+    cursor client-side, so overlapping pages never yield an entry twice,
+    even from a server that ignores the cursor parameters.
+
+    :meth:`follow` turns polling into a generator that backs off while the
+    webhook is idle. The cursor is a plain dict, so a tail can be resumed
+    after a restart.
+
+    Example:
+        tail = WebhookLogTail(client, webhook_id=123)
+        for entry in tail.follow(interval=5):
+            if entry.get('status') == 'failed':
+                alert(entry)
+    """
+
+    def __init__(self, client, webhook_id: int, page_size: int = DEFAULT_PAGE_SIZE,
+                 cursor: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the tail
+
+        Args:
+            client: PurrrLoveClient
+            webhook_id: ID of the webhook
+            page_size: Entries requested per page
+            cursor: Cursor from an earlier tail to resume after
+        """
+        self.client = client
+        self.webhook_id = webhook_id
+        self.page_size = page_size
+        self._position: Optional[Tuple[Any, float]] = None
+        if cursor:
+            self._position = _cursor_position(cursor)
+        self._stop = threading.Event()
+
+        self.requests = 0
+        self.yielded = 0
+
+    @property
+    def cursor(self) -> Optional[Dict[str, Any]]:
+        """Position of the newest entry seen, or None before the first poll"""
+        if self._position is None:
+            return None
+        return {'id': self._position[0], 'timestamp': self._position[1]}
+
+    def _fetch(self, after_id: Any = None, before_id: Any = None) -> List[Dict[str, Any]]:
+        self.requests += 1
+        data = self.client.get_webhook_logs(self.webhook_id, limit=self.page_size,
+                                            after_id=after_id, before_id=before_id)
+        return _log_entries(data)
+
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Fetch the entries logged since the cursor
+
+        The first poll returns the latest page and sets the cursor.
+
+        Returns:
+            New entries, oldest first
+        """
+        fresh: Dict[Tuple[Any, float], Dict[str, Any]] = {}
+        after_id = self._position[0] if self._position else None
+        while True:
+            page = self._fetch(after_id=after_id)
+            added = 0
+            for entry in page:
+                position = log_position(entry)
+                if (self._position is None or position > self._position) and position not in fresh:
+                    fresh[position] = entry
+                    added += 1
+            # Only a full page of new entries can hide more behind it
+            if self._position is None or added < self.page_size or len(page) < self.page_size:
+                break
+            newest = max(fresh)
+            if newest[0] == after_id:
+                break
+            after_id = newest[0]
+
+        entries = [fresh[position] for position in sorted(fresh)]
+        if entries:
+            self._position = max(fresh)
+        self.yielded += len(entries)
+        return entries
+
+    def history(self, before: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream older entries page by page
+
+        Args:
+            before: Position to start from (defaults to the cursor, or the
+                newest entry when the tail has not polled yet)
+
+        Yields:
+            Entries, newest first
+        """
+        if before is not None:
+            position: Optional[Tuple[Any, float]] = _cursor_position(before)
+        else:
+            position = self._position
+        before_id = position[0] if position else None
+        while True:
+            page = self._fetch(before_id=before_id)
+            older = sorted((entry for entry in page
+                            if position is None or log_position(entry) < position),
+                           key=log_position, reverse=True)
+            if not older:
+                return
+            for entry in older:
+                self.yielded += 1
+                yield entry
+            position = log_position(older[-1])
+            if self._position is None:
+                self._position = log_position(older[0])
+            if len(page) < self.page_size:
+                return
+            before_id = position[0]
+
+    def follow(self, interval: float = DEFAULT_POLL_INTERVAL, max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+               timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield new entries as they are logged
+
+        The poll interval doubles while nothing new arrives, up to
+        ``max_interval``, and resets once entries appear.
+
+        Args:
+            interval: Seconds between polls while entries are arriving
+            max_interval: Longest wait between polls
+            timeout: Stop after this many seconds (None follows until :meth:`stop`)
+
+        Yields:
+            Entries, oldest first
+        """
+        self._stop.clear()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        wait = interval
+        while not self._stop.is_set():
+            entries = self.poll()
+            yield from entries
+            wait = interval if entries else min(wait * 2, max_interval)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                wait = min(wait, remaining)
+            self._stop.wait(wait)
+
+    def stop(self) -> None:
+        """Stop a running :meth:`follow` after its current wait"""
+        self._stop.set()
+
+
+def export_ndjson(entries: Iterable[Dict[str, Any]], destination: Union[str, IO[str]],
+                  append: bool = True, flush_every: int = 1000) -> int:
+    """
+    Write log entries as newline-delimited JSON
+
+    Entries are written as they are produced, so streaming a whole history
+    keeps only one page in memory.
+
+    Args:
+        entries: Entries to write (e.g. from :meth:`WebhookLogTail.history`)
+        destination: File path or open text file
+        append: Append to an existing file instead of replacing it
+        flush_every: Entries between flushes, so a follower's file stays current
+
+    Returns:
+        Number of entries written
+    """
+    if isinstance(destination, str):
+        with open(destination, 'a' if append else 'w', encoding='utf-8') as handle:
+            return export_ndjson(entries, handle, flush_every=flush_every)
+
+    written = 0
+    for entry in entries:
+        destination.write(json.dumps(entry, separators=(',', ':'), default=str))
+        destination.write('\n')
+        written += 1
+        if written % flush_every == 0:
+            destination.flush()
+    destination.flush()
+    return written
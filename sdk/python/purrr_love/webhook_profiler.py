@@ -0,0 +1,279 @@
+"""
+🐱 Purrr.love Python SDK - Webhook Profiler
+Concurrent webhook testing and per-webhook delivery latency reports
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from .exceptions import PurrrLoveError, ValidationError
+from .webhook_logs import WebhookLogTail, log_timestamp
+
+FAILED_DELIVERY_STATUSES = {'failed', 'retrying', 'cancelled', 'error'}
+
+_LATENCY_FIELDS = (('response_time_ms', 0.001), ('duration_ms', 0.001), ('latency_ms', 0.001),
+                   ('response_time', 1.0), ('duration', 1.0), ('latency', 1.0))
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    """
+    Nearest-rank percentile
+
+    Args:
+        values: Sample values
+        q: Percentile between 0 and 100
+
+    Returns:
+        The percentile, or None for an empty sample
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+def delivery_latency(entry: Dict[str, Any]) -> Optional[float]:
+    """
+    Delivery latency of a log entry in seconds
+
+    Uses an explicit response time when the log has one, otherwise the gap
+    between ``created_at`` and ``delivered_at``/``updated_at``.
+
+    Args:
+        entry: Delivery log entry
+
+    Returns:
+        Seconds, or None when the entry carries no timing
+    """
+    for key, scale in _LATENCY_FIELDS:
+        if isinstance(entry.get(key), (int, float)):
+            return entry[key] * scale
+    created = log_timestamp(entry, ('created_at',))
+    finished = log_timestamp(entry, ('delivered_at', 'updated_at'))
+    if created and finished and finished >= created:
+        return finished - created
+    return None
+
+
+def delivery_failed(entry: Dict[str, Any]) -> bool:
+    """Whether a delivery log entry records a failed or pending-retry delivery"""
+    status = str(entry.get('status') or '').lower()
+    if status in FAILED_DELIVERY_STATUSES:
+        return True
+    code = entry.get('last_response_code', entry.get('response_code', entry.get('http_code')))
+    try:
+        return code is not None and not 200 <= int(code) < 300
+    except (TypeError, ValueError):
+        return False
+
+
+@dataclass
+class WebhookProfile:
+    """Test and delivery measurements for one webhook"""
+    webhook_id: Any
+    url: Optional[str] = None
+    test_latencies: List[float] = field(default_factory=list)
+    test_errors: List[str] = field(default_factory=list)
+    log_errors: List[str] = field(default_factory=list)
+    deliveries_profiled: bool = True
+    delivery_latencies: List[float] = field(default_factory=list)
+    deliveries: int = 0
+    delivery_failures: int = 0
+
+    @property
+    def tests(self) -> int:
+        return len(self.test_latencies) + len(self.test_errors)
+
+    @property
+    def failure_rate(self) -> Optional[float]:
+        """Failed share of deliveries, or of test calls when no deliveries were logged"""
+        if self.deliveries:
+            return self.delivery_failures / self.deliveries
+        if self.tests:
+            return len(self.test_errors) / self.tests
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert WebhookProfile instance to dictionary"""
+        return {
+            'webhook_id': self.webhook_id,
+            'url': self.url,
+            'tests': self.tests,
+            'test_failures': len(self.test_errors),
+            'test_p50': percentile(self.test_latencies, 50),
+            'test_p95': percentile(self.test_latencies, 95),
+            'deliveries': self.deliveries,
+            'delivery_failures': self.delivery_failures,
+            'failure_rate': self.failure_rate,
+            'p50': percentile(self.delivery_latencies, 50),
+            'p95': percentile(self.delivery_latencies, 95),
+            'p99': percentile(self.delivery_latencies, 99),
+            'deliveries_profiled': self.deliveries_profiled,
+            'errors': (self.test_errors + self.log_errors)[:5],
+        }
+
+
+class WebhookProfiler:
+    """
+    Fan ``test_webhook`` out across subscriptions and profile deliveries
+
+    :meth:`run` snapshots each webhook's log cursor, fires ``rounds`` test
+    deliveries per webhook concurrently, waits ``settle`` seconds for the
+    server to deliver them, and then reads only the log entries written
+    since the snapshot. A webhook whose log cannot be read before or after
+    the tests gets ``deliveries_profiled`` set to False instead of
+    delivery numbers. Each webhook's report has the test call latency,
+    the delivery latency percentiles (p50/p95/p99) and the failure rate,
+    so slow or failing receivers stand out before they back up the
+    delivery queue.
+
+    Example:
+        profiler = WebhookProfiler(client, max_workers=16)
+        report = profiler.run(rounds=5)
+        for row in profiler.slowest(5):
+            print(row['webhook_id'], row['p95'], row['failure_rate'])
+    """
+
+    def __init__(self, client, max_workers: int = 16, page_size: int = 100):
+        """
+        Initialize the profiler
+
+        Args:
+            client: PurrrLoveClient
+            max_workers: Concurrent test and log requests
+            page_size: Log entries requested per page
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.profiles: Dict[Any, WebhookProfile] = {}
+        self._lock = threading.Lock()
+
+    def webhooks(self) -> List[Dict[str, Any]]:
+        """
+        List the webhook subscriptions to profile
+
+        Returns:
+            Webhook subscriptions
+        """
+        data = self.client.list_webhooks()
+        if isinstance(data, dict):
+            data = data.get('webhooks', data.get('data', []))
+        return [webhook for webhook in data or [] if isinstance(webhook, dict)]
+
+    def run(self, webhook_ids: Optional[Iterable[Any]] = None, rounds: int = 1,
+            settle: float = 5.0) -> Dict[Any, Dict[str, Any]]:
+        """
+        Test every webhook concurrently and profile the resulting deliveries
+
+        Args:
+            webhook_ids: Webhooks to test (defaults to every ``list_webhooks`` entry)
+            rounds: Test deliveries per webhook
+            settle: Seconds to wait for deliveries before reading the logs
+
+        Returns:
+            Report rows keyed by webhook id
+
+        Raises:
+            ValidationError: If rounds is less than 1
+        """
+        if rounds < 1:
+            raise ValidationError("rounds must be at least 1", field='rounds')
+        if webhook_ids is None:
+            profiles = {webhook.get('id', webhook.get('webhook_id')): WebhookProfile(
+                webhook.get('id', webhook.get('webhook_id')), webhook.get('url')) for webhook in self.webhooks()}
+        else:
+            profiles = {webhook_id: WebhookProfile(webhook_id) for webhook_id in webhook_ids}
+        profiles.pop(None, None)
+        self.profiles = profiles
+        if not profiles:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(profiles) * rounds)) as executor:
+            tails = dict(zip(profiles, executor.map(self._snapshot, profiles)))
+            list(executor.map(self._test, [webhook_id for webhook_id in profiles for _ in range(rounds)]))
+            if settle > 0:
+                time.sleep(settle)
+            # Without a baseline every historical entry would look new
+            list(executor.map(self._collect, [tail for tail in tails.values() if tail is not None]))
+
+        return self.report()
+
+    def _snapshot(self, webhook_id: Any) -> Optional[WebhookLogTail]:
+        tail = WebhookLogTail(self.client, webhook_id, page_size=self.page_size)
+        try:
+            tail.poll()
+        except PurrrLoveError as e:
+            with self._lock:
+                profile = self.profiles[webhook_id]
+                profile.deliveries_profiled = False
+                profile.log_errors.append(f"logs: no baseline, deliveries not profiled: {e}")
+            return None
+        return tail
+
+    def _test(self, webhook_id: Any) -> None:
+        profile = self.profiles[webhook_id]
+        started = time.perf_counter()
+        try:
+            result = self.client.test_webhook(webhook_id)
+        except PurrrLoveError as e:
+            with self._lock:
+                profile.test_errors.append(str(e))
+            return
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            if isinstance(result, dict) and (result.get('success') is False
+                                             or str(result.get('status', '')).lower() in FAILED_DELIVERY_STATUSES):
+                profile.test_errors.append(str(result.get('error') or result.get('status')))
+            else:
+                profile.test_latencies.append(elapsed)
+
+    def _collect(self, tail: WebhookLogTail) -> None:
+        profile = self.profiles[tail.webhook_id]
+        try:
+            entries = tail.poll()
+        except PurrrLoveError as e:
+            with self._lock:
+                profile.deliveries_profiled = False
+                profile.log_errors.append(f"logs: {e}")
+            return
+        with self._lock:
+            for entry in entries:
+                profile.deliveries += 1
+                if delivery_failed(entry):
+                    profile.delivery_failures += 1
+                # Failed attempts count too; timeouts are the slowest deliveries
+                latency = delivery_latency(entry)
+                if latency is not None:
+                    profile.delivery_latencies.append(latency)
+
+    def report(self) -> Dict[Any, Dict[str, Any]]:
+        """
+        Report rows for the most recent run
+
+        Returns:
+            Report rows keyed by webhook id
+        """
+        with self._lock:
+            return {webhook_id: profile.to_dict() for webhook_id, profile in self.profiles.items()}
+
+    def slowest(self, n: int = 10) -> List[Dict[str, Any]]:
+        """
+        Webhooks ordered by p95 delivery latency, slowest first
+
+        Webhooks without delivery timing are ranked by test call latency.
+
+        Args:
+            n: Rows to return
+
+        Returns:
+            Report rows
+        """
+        rows = list(self.report().values())
+        rows.sort(key=lambda row: (row['p95'] if row['p95'] is not None else row['test_p95'] or 0.0,
+                                   row['failure_rate'] or 0.0), reverse=True)
+        return rows[:n]
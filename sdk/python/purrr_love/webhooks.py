@@ -0,0 +1,570 @@
+"""
+🐱 Purrr.love Python SDK - Webhook Receiver
+Signature verification and asynchronous dispatch of incoming webhook events
+"""
+
+import asyncio
+import hashlib
+import hmac
+import inspect
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+from .exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADER = 'X-Webhook-Signature'
+TIMESTAMP_HEADER = 'X-Webhook-Timestamp'
+EVENT_HEADER = 'X-Webhook-Event'
+
+DEFAULT_TOLERANCE = 300
+DEFAULT_MAX_BODY = 1024 * 1024
+
+Handler = Callable[['WebhookEvent'], Union[None, Awaitable[None]]]
+
+_REASONS = {200: 'OK', 202: 'Accepted', 400: 'Bad Request', 401: 'Unauthorized', 404: 'Not Found',
+            405: 'Method Not Allowed', 413: 'Payload Too Large', 503: 'Service Unavailable'}
+
+
+def compute_signature(secret: str, timestamp: Union[int, str], body: bytes) -> str:
+    """
+    Compute a webhook signature the way the Purrr.love server does
+
+    Args:
+        secret: Webhook secret
+        timestamp: Value of the X-Webhook-Timestamp header
+        body: Raw request body
+
+    Returns:
+        Hex HMAC-SHA256 of ``"{timestamp}.{body}"``
+    """
+    message = str(timestamp).encode('ascii') + b'.' + body
+    return hmac.new(secret.encode('utf-8'), message, hashlib.sha256).hexdigest()
+
+
+def verify_signature(secret: str, timestamp: Optional[str], body: bytes, signature: Optional[str],
+                     tolerance: Optional[float] = DEFAULT_TOLERANCE, now: Optional[float] = None) -> bool:
+    """
+    Verify a webhook signature in constant time
+
+    Args:
+        secret: Webhook secret
+        timestamp: Value of the X-Webhook-Timestamp header
+        body: Raw request body
+        signature: Value of the X-Webhook-Signature header
+        tolerance: Maximum age of the timestamp in seconds (None disables the check)
+        now: Current epoch time (defaults to ``time.time()``)
+
+    Returns:
+        True if the signature is valid and the timestamp is fresh
+    """
+    if not timestamp or not signature:
+        return False
+    try:
+        sent_at = int(timestamp)
+    except ValueError:
+        return False
+    if tolerance is not None and abs((time.time() if now is None else now) - sent_at) > tolerance:
+        return False
+    return hmac.compare_digest(compute_signature(secret, sent_at, body), signature.strip().lower())
+
+
+@dataclass
+class WebhookEvent:
+    """Verified webhook delivery"""
+    event_type: str
+    data: Any
+    timestamp: int
+    event_id: str
+    received_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert WebhookEvent instance to dictionary"""
+        return {
+            'event_type': self.event_type,
+            'data': self.data,
+            'timestamp': self.timestamp,
+            'event_id': self.event_id,
+            'received_at': self.received_at,
+        }
+
+
+def _event_id(data: Any, event_type: str, body: bytes) -> str:
+    """
+    Stable delivery id: the payload's own id, else a digest of the event
+
+    The signed timestamp is left out because the server re-signs every
+    retry with a fresh one, while the body is resent unchanged; retries of
+    one delivery therefore share an id.
+    """
+    if isinstance(data, dict):
+        for key in ('event_id', 'delivery_id'):
+            if data.get(key):
+                return str(data[key])
+    return hashlib.sha256(f"{event_type}\n".encode('utf-8') + body).hexdigest()[:32]
+
+
+class WebhookReceiver:
+    """
+    Receive, verify and dispatch Purrr.love webhook deliveries
+
+    The receiver is a WSGI app (:meth:`wsgi`), an ASGI app (:meth:`asgi`),
+    and a standalone asyncio HTTP server (:meth:`serve`). Each request is
+    verified with a constant-time HMAC over the raw body, parsed, put on a
+    bounded queue, and acknowledged straight away with ``202``; handlers
+    run afterwards on asyncio worker tasks, so slow handlers never delay
+    the acknowledgement. When the queue is full the delivery is refused
+    with ``503`` and ``Retry-After``, and the server's own retry picks it
+    up later.
+
+    Handlers are registered per event type with :meth:`on`; ``cat.*``
+    matches every ``cat.`` event and ``*`` matches everything. Coroutine
+    handlers are awaited, and plain functions run in the default thread
+    executor.
+
+    Example:
+        receiver = WebhookReceiver(secret=os.environ['PURRR_WEBHOOK_SECRET'])
+
+        @receiver.on('cat.updated')
+        async def refresh(event):
+            await cache.invalidate(event.data['cat_id'])
+
+        receiver.run(port=8080)   # or mount receiver.wsgi / receiver.asgi
+    """
+
+    def __init__(self, secret: str, queue_size: int = 10000, workers: int = 8,
+                 tolerance: Optional[float] = DEFAULT_TOLERANCE, max_body: int = DEFAULT_MAX_BODY,
+                 on_error: Optional[Callable[[WebhookEvent, BaseException], None]] = None):
+        """
+        Initialize the receiver
+
+        Args:
+            secret: Webhook secret configured with ``create_webhook``
+            queue_size: Events accepted but not yet handled before deliveries are refused
+            workers: Concurrent handler tasks
+            tolerance: Maximum timestamp age in seconds (None disables replay protection)
+            max_body: Largest accepted request body in bytes
+            on_error: Called with the event and exception when a handler fails
+
+        Raises:
+            ConfigurationError: If no secret is given
+        """
+        if not secret:
+            raise ConfigurationError("A webhook secret is required to verify deliveries", config_key='secret')
+        self.secret = secret
+        self.queue_size = queue_size
+        self.workers = workers
+        self.tolerance = tolerance
+        self.max_body = max_body
+        self.on_error = on_error
+
+        self._routes: Dict[str, List[Handler]] = {}
+        self._prefix_routes: List[Tuple[str, Handler]] = []
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._thread: Optional[threading.Thread] = None
+
+        self.received = 0
+        self.accepted = 0
+        self.rejected_signature = 0
+        self.rejected_invalid = 0
+        self.rejected_full = 0
+        self.dispatched = 0
+        self.unrouted = 0
+        self.handler_errors = 0
+        self.error_callback_errors = 0
+
+    # Routing
+
+    def on(self, event_type: str, handler: Optional[Handler] = None):
+        """
+        Register a handler for an event type
+
+        Usable directly (``receiver.on('cat.created', fn)``) or as a decorator.
+
+        Args:
+            event_type: Exact event type, a ``prefix.*`` pattern, or ``*``
+            handler: Function or coroutine function taking a WebhookEvent
+
+        Returns:
+            The handler (or a decorator when no handler is given)
+        """
+        def register(fn: Handler) -> Handler:
+            if event_type == '*' or event_type.endswith('.*'):
+                self._prefix_routes.append((event_type[:-1], fn))
+            else:
+                self._routes.setdefault(event_type, []).append(fn)
+            return fn
+
+        return register if handler is None else register(handler)
+
+    def handlers_for(self, event_type: str) -> List[Handler]:
+        """
+        Get the handlers an event type is routed to
+
+        Args:
+            event_type: Event type
+
+        Returns:
+            Exact-match handlers followed by matching wildcard handlers
+        """
+        handlers = list(self._routes.get(event_type, ()))
+        handlers.extend(fn for prefix, fn in self._prefix_routes if event_type.startswith(prefix))
+        return handlers
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Request, rejection and dispatch counters"""
+        with self._lock:
+            return {
+                'received': self.received,
+                'accepted': self.accepted,
+                'rejected_signature': self.rejected_signature,
+                'rejected_invalid': self.rejected_invalid,
+                'rejected_full': self.rejected_full,
+                'dispatched': self.dispatched,
+                'unrouted': self.unrouted,
+                'handler_errors': self.handler_errors,
+                'error_callback_errors': self.error_callback_errors,
+                'queued': self._pending,
+            }
+
+    # Request handling shared by every front end
+
+    def receive(self, headers: Mapping[str, str], body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """
+        Verify a delivery and enqueue it for dispatch
+
+        Safe to call from any thread once the dispatcher is running.
+
+        Args:
+            headers: Request headers (names are matched ignoring case)
+            body: Raw request body
+
+        Returns:
+            (HTTP status, JSON response body)
+        """
+        headers = {key.lower(): value for key, value in headers.items()}
+        with self._lock:
+            self.received += 1
+
+        if not verify_signature(self.secret, headers.get(TIMESTAMP_HEADER.lower()), body,
+                                headers.get(SIGNATURE_HEADER.lower()), self.tolerance):
+            with self._lock:
+                self.rejected_signature += 1
+            return 401, {'error': 'invalid signature'}
+
+        event_type = headers.get(EVENT_HEADER.lower())
+        try:
+            data = json.loads(body) if body else {}
+        except ValueError:
+            data = None
+        if not event_type or data is None:
+            with self._lock:
+                self.rejected_invalid += 1
+            return 400, {'error': 'missing event type or invalid JSON body'}
+
+        with self._lock:
+            if self._queue is None:
+                self.rejected_full += 1
+                return 503, {'error': 'receiver not started'}
+            if self._pending >= self.queue_size:
+                self.rejected_full += 1
+                return 503, {'error': 'receiver busy'}
+            self._pending += 1
+            self.accepted += 1
+
+        timestamp = int(headers[TIMESTAMP_HEADER.lower()])
+        event = WebhookEvent(event_type, data, timestamp, _event_id(data, event_type, body))
+        self._enqueue(event)
+        return 202, {'received': True, 'event_id': event.event_id}
+
+    def _enqueue(self, event: WebhookEvent) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._queue.put_nowait(event)
+        else:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, event)
+
+    # Dispatch
+
+    async def start_dispatcher(self) -> None:
+        """Start the worker tasks on the running event loop"""
+        if self._queue is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._tasks = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+
+    async def stop_dispatcher(self, drain: bool = True) -> None:
+        """
+        Stop the worker tasks
+
+        Args:
+            drain: Wait until every accepted event has been handled first
+        """
+        if self._queue is None:
+            return
+        if drain:
+            await self.join()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    async def join(self) -> None:
+        """Wait until every accepted event has been handled"""
+        while True:
+            with self._lock:
+                if self._pending == 0:
+                    return
+            await asyncio.sleep(0.005)
+
+    async def _worker(self) -> None:
+        while True:
+            event = await self._queue.get()
+            try:
+                await self.dispatch(event)
+            except Exception:
+                # One bad event must not take a worker down
+                logger.exception("Dispatching webhook event %s failed", event.event_id)
+            finally:
+                with self._lock:
+                    self._pending -= 1
+
+    async def dispatch(self, event: WebhookEvent) -> None:
+        """
+        Run every handler routed to an event
+
+        Args:
+            event: Verified event
+        """
+        handlers = self.handlers_for(event.event_type)
+        if not handlers:
+            with self._lock:
+                self.unrouted += 1
+            return
+        for handler in handlers:
+            try:
+                if inspect.iscoroutinefunction(handler):
+                    await handler(event)
+                else:
+                    result = await asyncio.get_running_loop().run_in_executor(None, handler, event)
+                    if inspect.isawaitable(result):
+                        await result
+            except Exception as e:
+                with self._lock:
+                    self.handler_errors += 1
+                if self.on_error is not None:
+                    try:
+                        self.on_error(event, e)
+                    except Exception:
+                        logger.exception("Webhook on_error callback failed for event %s", event.event_id)
+                        with self._lock:
+                            self.error_callback_errors += 1
+        with self._lock:
+            self.dispatched += 1
+
+    def start(self) -> None:
+        """Run the dispatcher on a background event loop thread (used by the WSGI app)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            ready = threading.Event()
+            loop = asyncio.new_event_loop()
+
+            def run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.run_until_complete(self.start_dispatcher())
+                ready.set()
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=run, daemon=True, name='purrr-webhook-dispatcher')
+            self._thread.start()
+        ready.wait()
+
+    def stop(self, drain: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop a background dispatcher started with :meth:`start`
+
+        Args:
+            drain: Handle every accepted event first
+            timeout: Seconds to wait for draining
+        """
+        if self._thread is None:
+            return
+        loop = self._loop
+        future = asyncio.run_coroutine_threadsafe(self.stop_dispatcher(drain), loop)
+        future.result(timeout)
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    # Front ends
+
+    def wsgi(self, environ: Dict[str, Any], start_response: Callable) -> List[bytes]:
+        """WSGI application; mount it at the webhook URL"""
+        if self._queue is None:
+            self.start()
+        if environ.get('REQUEST_METHOD') != 'POST':
+            status, payload = 405, {'error': 'method not allowed'}
+        else:
+            try:
+                length = int(environ.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                length = 0
+            if length > self.max_body:
+                status, payload = 413, {'error': 'payload too large'}
+            else:
+                body = environ['wsgi.input'].read(length) if length else b''
+                headers = {key[5:].replace('_', '-'): value for key, value in environ.items()
+                           if key.startswith('HTTP_')}
+                status, payload = self.receive(headers, body)
+
+        response = json.dumps(payload).encode('utf-8')
+        response_headers = [('Content-Type', 'application/json'), ('Content-Length', str(len(response)))]
+        if status == 503:
+            response_headers.append(('Retry-After', '1'))
+        start_response(f"{status} {_REASONS.get(status, '')}", response_headers)
+        return [response]
+
+    async def asgi(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        """ASGI application; mount it at the webhook URL"""
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await self.start_dispatcher()
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await self.stop_dispatcher()
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+        if scope['type'] != 'http':
+            return
+
+        await self.start_dispatcher()
+        if scope['method'] != 'POST':
+            status, payload = 405, {'error': 'method not allowed'}
+        else:
+            chunks = []
+            size = 0
+            more = True
+            while more:
+                message = await receive()
+                chunk = message.get('body', b'')
+                size += len(chunk)
+                chunks.append(chunk)
+                more = message.get('more_body', False)
+                if size > self.max_body:
+                    break
+            if size > self.max_body:
+                status, payload = 413, {'error': 'payload too large'}
+            else:
+                headers = {key.decode('latin-1'): value.decode('latin-1') for key, value in scope['headers']}
+                status, payload = self.receive(headers, b''.join(chunks))
+
+        response = json.dumps(payload).encode('utf-8')
+        headers = [(b'content-type', b'application/json'), (b'content-length', str(len(response)).encode())]
+        if status == 503:
+            headers.append((b'retry-after', b'1'))
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': response})
+
+    async def serve(self, host: str = '0.0.0.0', port: int = 8080,
+                    ready: Optional[Callable[[int], None]] = None) -> None:
+        """
+        Run the standalone asyncio HTTP server until cancelled
+
+        Speaks just enough HTTP/1.1 for webhook deliveries: POST with a
+        Content-Length body, over keep-alive connections.
+
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            ready: Called with the bound port once the server is listening
+        """
+        await self.start_dispatcher()
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        if ready is not None:
+            ready(server.sockets[0].getsockname()[1])
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.stop_dispatcher()
+
+    def run(self, host: str = '0.0.0.0', port: int = 8080) -> None:
+        """
+        Run the standalone server in the current thread until interrupted
+
+        Args:
+            host: Interface to bind
+            port: Port to bind
+        """
+        try:
+            asyncio.run(self.serve(host, port))
+        except KeyboardInterrupt:
+            pass
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                lines = head.decode('latin-1').split('\r\n')
+                parts = lines[0].split(' ')
+                if len(parts) != 3:
+                    return
+                method, _, version = parts
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        key, value = line.split(':', 1)
+                        headers[key.strip()] = value.strip()
+                lowered = {key.lower(): value for key, value in headers.items()}
+
+                try:
+                    length = int(lowered.get('content-length') or 0)
+                except ValueError:
+                    length = -1
+                keep_alive = (lowered.get('connection', '').lower() != 'close'
+                              if version == 'HTTP/1.1' else lowered.get('connection', '').lower() == 'keep-alive')
+
+                if length < 0 or length > self.max_body:
+                    status, payload, keep_alive = 413, {'error': 'payload too large'}, False
+                else:
+                    body = await reader.readexactly(length) if length else b''
+                    if method != 'POST':
+                        status, payload = 405, {'error': 'method not allowed'}
+                    else:
+                        status, payload = self.receive(headers, body)
+
+                response = json.dumps(payload).encode('utf-8')
+                extra = 'Retry-After: 1\r\n' if status == 503 else ''
+                writer.write(
+                    f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\nContent-Length: {len(response)}\r\n{extra}"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + response
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+        finally:
+            writer.close()
@@ -0,0 +1,328 @@
+"""
+🐱 Purrr.love Python SDK - Metaverse World Replica
+Local copy of a joined world's state, kept current with sequenced deltas
+"""
+
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .exceptions import ValidationError
+
+WORLD_COLLECTIONS = ('players', 'cats', 'objects')
+
+
+def _entity_id(entity: Dict[str, Any]) -> Any:
+    for key in ('id', 'player_id', 'user_id', 'cat_id', 'object_id'):
+        if entity.get(key) is not None:
+            return entity[key]
+    return None
+
+
+class WorldReplica:
+    """
+    In-memory replica of one metaverse world
+
+    The replica holds the world's own fields plus the ``players``, ``cats``
+    and ``objects`` collections keyed by entity id. It starts from a
+    snapshot and then applies deltas in sequence order::
+
+        {"type": "snapshot", "seq": 10, "state": {"name": ..., "players": [...], "cats": [...], "objects": [...]}}
+        {"type": "delta", "seq": 11, "ops": [
+            {"op": "set", "kind": "cats", "id": 7, "fields": {"x": 1.5}},
+            {"op": "replace", "kind": "objects", "id": 3, "value": {...}},
+            {"op": "remove", "kind": "players", "id": 42},
+            {"op": "set", "kind": "world", "fields": {"weather": "rain"}}
+        ]}
+
+    A delta whose ``seq`` is not the next one is held back until the gap
+    fills. If the gap is still open after ``max_buffered`` deltas or
+    ``gap_timeout`` seconds, the replica asks for a fresh snapshot through
+    its ``resync`` callable and keeps buffering until that snapshot
+    arrives. Duplicate and already-covered deltas are ignored. An attached
+    session also runs :meth:`check` every tick, so gaps close even when no
+    further deltas arrive.
+
+    Reads are lookups in local dictionaries and never touch the network.
+
+    Example:
+        replica = WorldReplica(world_id=42)
+        session = MetaverseSession(client, world_id=42)
+        replica.attach(session)
+        session.open()
+        cat = replica.get('cats', 7)
+    """
+
+    def __init__(self, world_id: int, resync: Optional[Callable[[int], Any]] = None,
+                 max_buffered: int = 64, gap_timeout: float = 0.5, resync_timeout: float = 5.0):
+        """
+        Initialize the replica
+
+        Args:
+            world_id: ID of the world
+            resync: Called with the last applied sequence number to request a
+                snapshot; it may return the snapshot message directly
+            max_buffered: Out-of-order deltas held before resyncing
+            gap_timeout: Seconds a gap may stay open before resyncing
+            resync_timeout: Seconds to wait for a requested snapshot before asking again
+        """
+        self.world_id = world_id
+        self.resync = resync
+        self.max_buffered = max_buffered
+        self.gap_timeout = gap_timeout
+        self.resync_timeout = resync_timeout
+
+        self.seq: Optional[int] = None
+        self._world: Dict[str, Any] = {}
+        self._collections: Dict[str, Dict[Any, Dict[str, Any]]] = {kind: {} for kind in WORLD_COLLECTIONS}
+        self._buffered: Dict[int, Dict[str, Any]] = {}
+        self._gap_since: Optional[float] = None
+        self._resyncing = False
+        self._resync_requested = 0.0
+        self._lock = threading.RLock()
+
+        self.snapshots = 0
+        self.deltas_applied = 0
+        self.duplicates = 0
+        self.gaps = 0
+        self.resyncs = 0
+
+    def attach(self, session) -> 'WorldReplica':
+        """
+        Feed the replica from a MetaverseSession
+
+        Must be called before the session is opened. The session's hello
+        asks the server for delta encoding, snapshot and delta frames are
+        routed to the replica, and resyncs are requested over the session
+        itself. Other updates still reach ``on_update`` or the update queue.
+
+        Args:
+            session: MetaverseSession for the same world
+
+        Returns:
+            The replica
+        """
+        session.hello.update({'delta_encoding': True, 'since': self.seq})
+        session.handlers['snapshot'] = self.apply
+        session.handlers['delta'] = self.apply
+        session.tick_callbacks.append(self.check)
+        if self.resync is None:
+            self.resync = lambda since: session.send({'type': 'resync', 'world_id': self.world_id, 'since': since})
+        return self
+
+    def apply(self, message: Dict[str, Any]) -> bool:
+        """
+        Apply a snapshot or delta message
+
+        Args:
+            message: Message with ``type`` snapshot or delta and a ``seq``
+
+        Returns:
+            True if the replica's state changed
+
+        Raises:
+            ValidationError: If the message is not a snapshot or delta
+        """
+        kind = message.get('type')
+        with self._lock:
+            if kind == 'snapshot':
+                return self._apply_snapshot(message)
+            if kind != 'delta':
+                raise ValidationError(f"Cannot apply '{kind}' message to a world replica", field='type')
+
+            seq = int(message['seq'])
+            if self.seq is not None and seq <= self.seq:
+                self.duplicates += 1
+                return False
+            if self.seq is None or seq != self.seq + 1:
+                self._hold(seq, message)
+                return False
+
+            self._apply_ops(message.get('ops') or [])
+            self.seq = seq
+            self.deltas_applied += 1
+            self._drain()
+            return True
+
+    def check(self) -> None:
+        """
+        Resync if a sequence gap has been open longer than ``gap_timeout``
+
+        Attached sessions call this every tick; call it periodically when
+        feeding the replica some other way, so a gap still closes while no
+        new deltas arrive.
+        """
+        with self._lock:
+            if self._gap_since is not None and time.monotonic() - self._gap_since > self.gap_timeout:
+                self._request_resync()
+
+    def _hold(self, seq: int, message: Dict[str, Any]) -> None:
+        if seq in self._buffered:
+            self.duplicates += 1
+            return
+        if not self._buffered and self.seq is not None:
+            self.gaps += 1
+        self._buffered[seq] = message
+        if self._gap_since is None:
+            self._gap_since = time.monotonic()
+        expired = time.monotonic() - self._gap_since > self.gap_timeout
+        if len(self._buffered) > self.max_buffered or expired:
+            self._request_resync()
+        if len(self._buffered) > self.max_buffered and self.resync is None:
+            # Nothing can fill the gap; keep the newest deltas only
+            del self._buffered[min(self._buffered)]
+
+    def _drain(self) -> None:
+        """Apply held deltas that are now in sequence"""
+        while self.seq + 1 in self._buffered:
+            message = self._buffered.pop(self.seq + 1)
+            self._apply_ops(message.get('ops') or [])
+            self.seq += 1
+            self.deltas_applied += 1
+        for stale in [s for s in self._buffered if s <= self.seq]:
+            del self._buffered[stale]
+        self._gap_since = time.monotonic() if self._buffered else None
+
+    def _request_resync(self) -> None:
+        now = time.monotonic()
+        if self.resync is None or (self._resyncing and now - self._resync_requested < self.resync_timeout):
+            return
+        self._resyncing = True
+        self._resync_requested = now
+        self.resyncs += 1
+        snapshot = self.resync(self.seq or 0)
+        if isinstance(snapshot, dict) and snapshot.get('type') == 'snapshot':
+            self._apply_snapshot(snapshot)
+
+    def _apply_snapshot(self, message: Dict[str, Any]) -> bool:
+        seq = int(message.get('seq', 0))
+        if self.seq is not None and seq < self.seq and not self._resyncing:
+            self.duplicates += 1
+            return False
+
+        state = dict(message.get('state') or {})
+        collections = {kind: {} for kind in WORLD_COLLECTIONS}
+        for kind in WORLD_COLLECTIONS:
+            entities = state.pop(kind, None) or []
+            if isinstance(entities, dict):
+                entities = list(entities.values())
+            for entity in entities:
+                collections[kind][_entity_id(entity)] = dict(entity)
+
+        self._world = state
+        self._collections = collections
+        self.seq = seq
+        self.snapshots += 1
+        self._resyncing = False
+        self._drain()
+        return True
+
+    def _apply_ops(self, ops: List[Dict[str, Any]]) -> None:
+        for op in ops:
+            kind = op.get('kind')
+            action = op.get('op', 'set')
+            if kind == 'world':
+                if action == 'replace':
+                    self._world = dict(op.get('value') or {})
+                else:
+                    self._world.update(op.get('fields') or {})
+                    for field in op.get('unset') or ():
+                        self._world.pop(field, None)
+                continue
+
+            collection = self._collections.setdefault(kind, {})
+            entity_id = op.get('id')
+            if action == 'remove':
+                collection.pop(entity_id, None)
+            elif action == 'replace':
+                collection[entity_id] = dict(op.get('value') or {})
+            else:
+                entity = collection.setdefault(entity_id, {})
+                entity.update(op.get('fields') or {})
+                for field in op.get('unset') or ():
+                    entity.pop(field, None)
+
+    @property
+    def ready(self) -> bool:
+        """Whether the replica holds a snapshot and is not waiting on a resync"""
+        with self._lock:
+            return self.seq is not None and not self._resyncing
+
+    @property
+    def world(self) -> Dict[str, Any]:
+        """Copy of the world's own fields"""
+        with self._lock:
+            return dict(self._world)
+
+    @property
+    def players(self) -> Dict[Any, Dict[str, Any]]:
+        """Copy of the players keyed by id"""
+        return self.collection('players')
+
+    @property
+    def cats(self) -> Dict[Any, Dict[str, Any]]:
+        """Copy of the cats keyed by id"""
+        return self.collection('cats')
+
+    @property
+    def objects(self) -> Dict[Any, Dict[str, Any]]:
+        """Copy of the objects keyed by id"""
+        return self.collection('objects')
+
+    def collection(self, kind: str) -> Dict[Any, Dict[str, Any]]:
+        """
+        Get one collection
+
+        Args:
+            kind: players, cats, objects or another collection the server sends
+
+        Returns:
+            Shallow copy of the collection keyed by entity id
+        """
+        with self._lock:
+            return dict(self._collections.get(kind, {}))
+
+    def get(self, kind: str, entity_id: Any, default: Any = None) -> Any:
+        """
+        Look up one entity
+
+        Args:
+            kind: Collection name
+            entity_id: Entity id
+            default: Value returned when the entity is absent
+
+        Returns:
+            Copy of the entity, or default
+        """
+        with self._lock:
+            entity = self._collections.get(kind, {}).get(entity_id)
+            return default if entity is None else dict(entity)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a deep copy of the whole replica
+
+        Returns:
+            Snapshot message that :meth:`apply` accepts
+        """
+        with self._lock:
+            state = copy.deepcopy(self._world)
+            for kind, entities in self._collections.items():
+                state[kind] = copy.deepcopy(list(entities.values()))
+            return {'type': 'snapshot', 'seq': self.seq or 0, 'state': state}
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Sequence position and snapshot, delta, gap and resync counters"""
+        with self._lock:
+            return {
+                'seq': self.seq,
+                'snapshots': self.snapshots,
+                'deltas_applied': self.deltas_applied,
+                'duplicates': self.duplicates,
+                'gaps': self.gaps,
+                'resyncs': self.resyncs,
+                'buffered': len(self._buffered),
+                'entities': {kind: len(entities) for kind, entities in self._collections.items()},
+            }
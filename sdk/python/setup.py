@@ -76,6 +76,19 @@ setup(
         "websocket": [
             "websockets>=9.0.0",
         ],
+        "compression": [
+            "brotli>=1.0.9",
+            "zstandard>=0.18.0",
+        ],
+        "dns": [
+            "dnspython>=2.0.0",
+        ],
+        "numpy": [
+            "numpy>=1.20.0",
+        ],
+        "msgpack": [
+            "msgpack>=1.0.0",
+        ],
     },
     keywords=[
         "cat", "gaming", "api", "client", "sdk", "purrr", "love", "virtual-pets",